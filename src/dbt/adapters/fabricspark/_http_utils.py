@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import threading
 from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from dbt.adapters.fabricspark.throttle import ThrottleCoordinator
+
+DEFAULT_POOL_MAXSIZE = 10
+
+T = TypeVar("T")
 
 
 def parse_retry_after(response: requests.Response) -> float:
@@ -33,3 +43,155 @@ def parse_retry_after(response: requests.Response) -> float:
     except Exception:
         pass
     return 0
+
+
+class HttpTransport:
+    """Process-wide keep-alive transport shared by every Livy and Fabric REST caller.
+
+    Holds one ``requests.Session`` per endpoint origin (``scheme://host:port``)
+    so submits and polls from every dbt thread reuse pooled TCP+TLS
+    connections instead of handshaking on each call. The pool size is
+    raised to match ``threads`` by :func:`configure_transport`. Every request
+    also passes through the shared :class:`ThrottleCoordinator`, so a 429 seen
+    by one thread pauses the whole endpoint+workspace.
+    """
+
+    def __init__(self, pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> None:
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._pool_maxsize = pool_maxsize
+        self.throttle = ThrottleCoordinator()
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self._pool_maxsize
+
+    def configure(self, pool_maxsize: int) -> None:
+        """Grow the per-origin connection pool; never shrinks a live pool."""
+        with self._lock:
+            if pool_maxsize <= self._pool_maxsize:
+                return
+            self._pool_maxsize = pool_maxsize
+            for session in self._sessions.values():
+                self._mount(session)
+
+    def _mount(self, session: requests.Session) -> None:
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self._pool_maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    def session_for(self, url: str) -> requests.Session:
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        session = self._sessions.get(origin)
+        if session is not None:
+            return session
+        with self._lock:
+            session = self._sessions.get(origin)
+            if session is None:
+                session = requests.Session()
+                self._mount(session)
+                self._sessions[origin] = session
+            return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        if not getattr(_token_taken, "active", False):
+            self.throttle.before_request(url)
+        response = self.session_for(url).request(method, url, **kwargs)
+        retry_after = parse_retry_after(response) if response.status_code == 429 else 0.0
+        self.throttle.after_response(url, response.status_code, retry_after)
+        return response
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return per-origin ``{requests, opened, reused}`` connection counters.
+
+        ``opened`` counts TCP(+TLS) connections established by urllib3;
+        ``reused`` is every request that rode an already-open connection.
+        """
+        result: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            sessions = dict(self._sessions)
+        for origin, session in sessions.items():
+            seen = set()
+            num_requests = 0
+            opened = 0
+            for adapter in session.adapters.values():
+                if id(adapter) in seen or not isinstance(adapter, HTTPAdapter):
+                    continue
+                seen.add(id(adapter))
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    num_requests += pool.num_requests
+                    opened += pool.num_connections
+            result[origin] = {
+                "requests": num_requests,
+                "opened": opened,
+                "reused": max(num_requests - opened, 0),
+            }
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+_transport = HttpTransport()
+# Set while a request runs whose caller already took its throttle token.
+_token_taken = threading.local()
+
+
+def configure_transport(pool_maxsize: Optional[int], max_rps: Optional[float] = None) -> None:
+    if pool_maxsize:
+        _transport.configure(pool_maxsize)
+    _transport.throttle.configure(max_rps)
+
+
+async def acquire_token(url: str) -> None:
+    """Await a throttle token for ``url`` on the running loop; see :func:`send_with_token`."""
+    await _transport.throttle.before_request_async(url)
+
+
+def send_with_token(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call ``fn`` (``get``, ``post``, ...) without waiting for a throttle token.
+
+    For callers that already took one with :func:`acquire_token`.
+    """
+    _token_taken.active = True
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _token_taken.active = False
+
+
+def throttle_stats() -> Dict[str, Dict[str, float]]:
+    return _transport.throttle.stats()
+
+
+def transport_pool_maxsize() -> int:
+    return _transport.pool_maxsize
+
+
+def transport_stats() -> Dict[str, Dict[str, int]]:
+    return _transport.stats()
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    return _transport.request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    return _transport.request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    return _transport.request("POST", url, **kwargs)
+
+
+def delete(url: str, **kwargs: Any) -> requests.Response:
+    return _transport.request("DELETE", url, **kwargs)
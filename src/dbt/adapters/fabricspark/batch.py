@@ -0,0 +1,101 @@
+"""Run an ordered list of SQL statements as one Livy statement.
+
+Each Livy statement costs a submit plus at least one poll round trip, so a
+materialization that issues a dozen DDL/DML statements pays that latency a
+dozen times. :func:`build_script` wraps the statements in a small ``pyspark``
+program that runs them one after another with ``spark.sql`` and prints a
+per-statement outcome; :func:`parse_results` turns that output back into one
+result per statement. Execution stops at the first failing statement, exactly
+as it would if the statements were sent one by one.
+
+Batched statements are executed but never collected, so batching is only
+for statements whose results are not fetched. :func:`holdable` says which
+statements ``batch_statements`` may hold back for a later batch.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List, Sequence
+
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.fabricspark import sql_lexer
+
+RESULT_MARKER = "__dbt_fabricspark_batch__"
+
+_SCRIPT = """import json as _dbt_json
+_dbt_results = []
+for _dbt_sql in _dbt_json.loads({statements}):
+    try:
+        spark.sql(_dbt_sql)
+        _dbt_results.append({{"status": "ok"}})
+    except Exception as _dbt_error:
+        _dbt_results.append({{"status": "error", "evalue": str(_dbt_error)}})
+        break
+print({marker!r} + _dbt_json.dumps(_dbt_results))"""
+
+
+# Statements whose response nothing reads: DDL around the model, session
+# settings, grants and comments. Statements that write rows or build a
+# relation from a query (every materialization's ``main``) are not listed, so
+# they run at once and keep their own response and errors.
+_HOLDABLE = re.compile(
+    r"(?:set|use|grant|revoke|comment\s+on"
+    r"|(?:create|drop|alter)\s+(?:database|schema|namespace)"
+    r"|(?:alter|drop)\s+(?:table|view)"
+    r"|create(?:\s+or\s+replace)?(?:\s+global)?\s+temporary\s+view)\b",
+    re.IGNORECASE,
+)
+
+
+class BatchStatementError(DbtDatabaseError):
+    """A statement inside a batch failed; later statements did not run.
+
+    ``results`` holds the outcome of every statement that ran, in order;
+    ``index`` is the position of the failing one.
+    """
+
+    def __init__(self, msg: str, index: int, results: List[Dict[str, Any]]) -> None:
+        super().__init__(msg)
+        self.index = index
+        self.results = results
+
+
+def holdable(sql: str) -> bool:
+    """True if every statement in ``sql`` may be held back for a later batch."""
+    statements = sql_lexer.split_statements(sql)
+    return bool(statements) and all(_HOLDABLE.match(statement) for statement in statements)
+
+
+def build_script(statements: Sequence[str]) -> str:
+    return _SCRIPT.format(statements=repr(json.dumps(list(statements))), marker=RESULT_MARKER)
+
+
+def parse_results(result: dict, statements: Sequence[str]) -> List[Dict[str, Any]]:
+    """Return one ``{"status": ...}`` dict per statement from a batch statement body.
+
+    Raises :class:`BatchStatementError` naming the first failing statement.
+    """
+    output = result.get("output", {})
+    if output.get("status") != "ok":
+        raise DbtDatabaseError(
+            "Error while executing statement batch: " + output.get("evalue", "<no evalue>")
+        )
+    text = output.get("data", {}).get("text/plain", "")
+    results: List[Dict[str, Any]] = []
+    for line in str(text).splitlines():
+        if line.startswith(RESULT_MARKER):
+            results = json.loads(line[len(RESULT_MARKER) :])
+    if not results:
+        raise DbtDatabaseError(f"Statement batch returned no results: {text[:500]}")
+    for index, outcome in enumerate(results):
+        if outcome.get("status") != "ok":
+            raise BatchStatementError(
+                f"Error while executing query (statement {index + 1} of {len(statements)} "
+                f"in batch): {outcome.get('evalue', '<no evalue>')}\n{statements[index][:1000]}",
+                index,
+                results,
+            )
+    return results
@@ -0,0 +1,289 @@
+"""Describe many relations for the catalog in one Livy statement.
+
+``dbt docs generate`` needs ``describe table extended`` output for every
+relation in every schema. Sent one by one, that is a submit plus at least one
+poll round trip per relation, sequentially within each schema thread.
+:func:`build_script` instead wraps the describes in a small ``pyspark``
+program that runs them on the driver and prints every result as compressed
+JSON; :func:`parse_results` turns that back into one outcome per relation.
+
+A relation that fails to describe (dropped meanwhile, unreadable shortcut,
+...) gets an ``{"error": ...}`` outcome; the other relations are unaffected.
+
+With ``catalog_cache_file`` set, the describe rows are also kept in a
+:class:`CatalogCache` together with a fingerprint per relation: the newest
+commit file in a Delta table's ``_delta_log`` (every commit, including schema
+and comment changes, adds one) or a hash of a view's listing. The same
+statement computes the fingerprints of the whole schema in bulk first, from
+one ``show table extended`` listing and one file listing of every table's
+``_delta_log``, and only describes relations whose fingerprint changed or that
+are new; the others reuse their cached rows. Relations the bulk pass cannot
+fingerprint (no listing, location not matched) fall back to ``describe
+detail`` / ``show create table`` one by one. Non-Delta tables have no
+fingerprint and are always described.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import tempfile
+import threading
+import zlib
+from typing import Any, Collection, Dict, List, Optional, Sequence
+
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+RESULT_MARKER = "__dbt_fabricspark_catalog__"
+# Relations per statement; bounds the size of one statement's output.
+RELATIONS_PER_STATEMENT = 500
+
+_SCRIPT = """import base64 as _dbt_b64, hashlib as _dbt_hashlib, json as _dbt_json, zlib as _dbt_zlib
+_dbt_known = _dbt_json.loads({known})
+
+
+def _dbt_bulk_fingerprints(_dbt_scope, _dbt_names):
+    _dbt_wanted = {{_n.rsplit(".", 1)[-1].strip("`").lower(): _n for _n in _dbt_names}}
+    _dbt_fingerprints = {{}}
+    _dbt_locations = {{}}
+    try:
+        _dbt_listing = spark.sql("show table extended in " + _dbt_scope + " like '*'").collect()
+        for _dbt_row in _dbt_listing:
+            _dbt_name = _dbt_wanted.get(str(_dbt_row[1]).lower())
+            if _dbt_name is None or _dbt_row[2]:
+                continue
+            _dbt_info = str(_dbt_row[3])
+            _dbt_fields = dict(_l.split(": ", 1) for _l in _dbt_info.splitlines() if ": " in _l)
+            if _dbt_fields.get("Type", "").strip().upper() == "VIEW":
+                _dbt_hash = _dbt_hashlib.sha256(_dbt_info.encode("utf-8")).hexdigest()
+                _dbt_fingerprints[_dbt_name] = "view:" + _dbt_hash
+            elif _dbt_fields.get("Provider", "").strip().lower() != "delta":
+                _dbt_fingerprints[_dbt_name] = None
+            elif _dbt_fields.get("Location"):
+                _dbt_locations[_dbt_fields["Location"].strip().rstrip("/")] = _dbt_name
+        if _dbt_locations:
+            # One job lists every table's commit files and keeps the newest.
+            _dbt_commits = (
+                spark.read.format("binaryFile")
+                .option("pathGlobFilter", "*.json")
+                .load([_l + "/_delta_log" for _l in _dbt_locations])
+                .selectExpr(
+                    "regexp_extract(path, '^(.*)/_delta_log/[^/]*$', 1) as location",
+                    "struct(path, modificationTime) as latest",
+                )
+                .groupBy("location")
+                .agg({{"latest": "max"}})
+                .collect()
+            )
+            for _dbt_location, _dbt_latest in _dbt_commits:
+                _dbt_name = _dbt_locations.get(str(_dbt_location).rstrip("/"))
+                if _dbt_name is not None:
+                    _dbt_commit = str(_dbt_latest[0]).rsplit("/", 1)[-1]
+                    _dbt_fingerprints[_dbt_name] = "delta:%s@%s" % (_dbt_commit, _dbt_latest[1])
+    except Exception:
+        pass
+    return _dbt_fingerprints
+
+
+def _dbt_fingerprint(_dbt_name, _dbt_is_view):
+    try:
+        if _dbt_is_view:
+            _dbt_ddl = spark.sql("show create table " + _dbt_name).collect()[0][0]
+            return "view:" + _dbt_hashlib.sha256(_dbt_ddl.encode("utf-8")).hexdigest()
+        _dbt_detail = spark.sql("describe detail " + _dbt_name).collect()[0].asDict()
+        if str(_dbt_detail.get("format")).lower() == "delta":
+            return "delta:" + str(_dbt_detail.get("lastModified"))
+    except Exception:
+        pass
+    return None
+
+
+_dbt_tables = _dbt_json.loads({tables})
+_dbt_bulk = {{}}
+if _dbt_known is not None and {scope}:
+    _dbt_bulk = _dbt_bulk_fingerprints({scope}, [_n for _n, _v in _dbt_tables])
+_dbt_described = []
+for _dbt_name, _dbt_is_view in _dbt_tables:
+    _dbt_outcome = {{}}
+    try:
+        if _dbt_known is not None:
+            if _dbt_name in _dbt_bulk:
+                _dbt_outcome["fingerprint"] = _dbt_bulk[_dbt_name]
+            else:
+                _dbt_outcome["fingerprint"] = _dbt_fingerprint(_dbt_name, _dbt_is_view)
+            if _dbt_outcome["fingerprint"] and _dbt_known.get(_dbt_name) == _dbt_outcome["fingerprint"]:
+                _dbt_outcome["unchanged"] = True
+                _dbt_described.append(_dbt_outcome)
+                continue
+        _dbt_rows = spark.sql("describe table extended " + _dbt_name).collect()
+        _dbt_outcome["rows"] = [[_r[0], _r[1]] for _r in _dbt_rows]
+    except Exception as _dbt_error:
+        _dbt_outcome = {{"error": str(_dbt_error)}}
+    _dbt_described.append(_dbt_outcome)
+_dbt_payload = _dbt_zlib.compress(_dbt_json.dumps(_dbt_described).encode("utf-8"), 1)
+print({marker!r} + _dbt_b64.b64encode(_dbt_payload).decode("ascii"))"""
+
+
+def build_script(
+    tables: Sequence[str],
+    views: Collection[str] = (),
+    known: Optional[Dict[str, str]] = None,
+    scope: str = "",
+) -> str:
+    """Return the describe program; with ``known`` fingerprints, skip unchanged relations.
+
+    ``scope`` is the schema all ``tables`` belong to; it lets the program
+    fingerprint them in bulk from the schema's listing.
+    """
+    return _SCRIPT.format(
+        tables=repr(json.dumps([[name, name in views] for name in tables])),
+        known=repr(json.dumps(known)),
+        scope=repr(scope),
+        marker=RESULT_MARKER,
+    )
+
+
+def parse_results(result: dict, tables: Sequence[str]) -> List[Dict[str, Any]]:
+    """Return one outcome per table from a catalog statement body.
+
+    Each outcome is ``{"rows": [{"col_name": ..., "data_type": ...}, ...]}``,
+    ``{"unchanged": True}`` or ``{"error": "<message>"}``; with fingerprints
+    requested, non-error outcomes also carry ``"fingerprint"``.
+    """
+    output = result.get("output", {})
+    if output.get("status") != "ok":
+        raise DbtDatabaseError(
+            "Error while describing relations for the catalog: "
+            + output.get("evalue", "<no evalue>")
+        )
+    text = str(output.get("data", {}).get("text/plain", ""))
+    for line in text.splitlines():
+        if line.startswith(RESULT_MARKER):
+            payload = base64.b64decode(line[len(RESULT_MARKER) :])
+            described = json.loads(zlib.decompress(payload))
+            break
+    else:
+        raise DbtDatabaseError(f"Catalog statement returned no results: {text[:500]}")
+    if len(described) != len(tables):
+        raise DbtDatabaseError(
+            f"Catalog statement described {len(described)} of {len(tables)} relations"
+        )
+    for outcome in described:
+        if "rows" in outcome:
+            outcome["rows"] = [
+                {"col_name": name, "data_type": type_} for name, type_ in outcome["rows"]
+            ]
+    return described
+
+
+def describe(
+    connections: Any,
+    tables: Sequence[str],
+    views: Collection[str] = (),
+    cache: Optional[CatalogCache] = None,
+    scope: str = "",
+) -> List[Dict[str, Any]]:
+    """Describe ``tables`` in as few statements as possible; one outcome per table.
+
+    With a ``cache``, relations of ``scope`` whose fingerprint is unchanged
+    get their cached rows back and only the others are described; the cache
+    entry for ``scope`` is then replaced by the current relations.
+    """
+    entries = cache.entries(scope) if cache is not None else {}
+    known = {name: entry["fingerprint"] for name, entry in entries.items()}
+    outcomes: List[Dict[str, Any]] = []
+    for start in range(0, len(tables), RELATIONS_PER_STATEMENT):
+        chunk = tables[start : start + RELATIONS_PER_STATEMENT]
+        result = connections.execute_code(
+            build_script(chunk, views, known if cache is not None else None, scope),
+            f"-- describe table extended for {len(chunk)} relations",
+        )
+        outcomes.extend(parse_results(result, chunk))
+    if cache is None:
+        return outcomes
+
+    fresh: Dict[str, Dict[str, Any]] = {}
+    unchanged = 0
+    for name, outcome in zip(tables, outcomes):
+        if outcome.pop("unchanged", False):
+            outcome["rows"] = entries[name]["rows"]
+            unchanged += 1
+        if outcome.get("fingerprint") and "rows" in outcome:
+            fresh[name] = {"fingerprint": outcome["fingerprint"], "rows": outcome["rows"]}
+    cache.replace(scope, fresh)
+    logger.debug(
+        f"Catalog of {scope}: described {len(tables) - unchanged} relations, "
+        f"reused {unchanged} unchanged ones"
+    )
+    return outcomes
+
+
+class CatalogCache:
+    """Describe rows and fingerprints from earlier catalog runs, per schema.
+
+    Stored as JSON in ``path`` (``0600``, replaced atomically), like the
+    statement registry.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._scopes: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._scopes is None:
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                data = {}
+            except (OSError, ValueError) as ex:
+                logger.debug(f"Ignoring unreadable catalog cache {self.path}: {ex}")
+                data = {}
+            self._scopes = data if isinstance(data, dict) else {}
+        return self._scopes
+
+    def entries(self, scope: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            entries = self._load().get(scope)
+        return dict(entries) if isinstance(entries, dict) else {}
+
+    def replace(self, scope: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            scopes = self._load()
+            scopes[scope] = entries
+            directory = os.path.dirname(self.path) or "."
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=directory, prefix=".catalog-")
+                try:
+                    os.chmod(tmp, 0o600)
+                    with os.fdopen(fd, "w") as f:
+                        json.dump(scopes, f, separators=(",", ":"))
+                    os.replace(tmp, self.path)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+            except OSError as ex:
+                logger.debug(f"Unable to write catalog cache {self.path}: {ex}")
+
+
+_caches_lock = threading.Lock()
+_caches: Dict[str, CatalogCache] = {}
+
+
+def get_cache(credentials: Any) -> Optional[CatalogCache]:
+    """Return the cache for ``credentials.catalog_cache_file``, or None if unset."""
+    path = credentials.catalog_cache_file
+    if not path:
+        return None
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = CatalogCache(path)
+        return cache
@@ -0,0 +1,153 @@
+"""Per-run cache of the columns of relations.
+
+``get_columns_in_relation`` runs a ``describe table extended`` each time it
+is called, and one incremental model asks for the columns of its target
+several times (``get_insert_overwrite_sql`` / ``get_insert_into_sql`` /
+``fabricspark__get_merge_sql``, ``process_schema_changes``, snapshots'
+``get_missing_columns``). :class:`ColumnCache` keeps the answer per rendered
+relation for the rest of the run.
+
+Entries are invalidated by the statements that can change them: every SQL
+statement the adapter runs goes through :meth:`ColumnCache.invalidate_sql`,
+which drops the entries of relations targeted by ``create``, ``replace``,
+``alter``, ``drop`` or ``merge into`` (Delta schema evolution). Names are
+compared without backticks and case-insensitively, and an unqualified or
+partially qualified target also drops every entry it could refer to.
+
+Relations listed by ``show table extended`` during this run carry their
+schema in ``information``; they are registered with
+:meth:`ColumnCache.add_listed` and their columns parsed on first use, as long
+as every column type maps onto the name ``describe`` would report
+(:func:`describe_type`).
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from dbt.adapters.fabricspark import sql_lexer
+
+_NAME = r"(?:`[^`]*`|[\w$]+)(?:\s*\.\s*(?:`[^`]*`|[\w$]+))*"
+_DDL_TARGET = re.compile(
+    r"(?:create(?:\s+or\s+replace)?(?:\s+(?:global\s+)?temporary)?"
+    r"(?:\s+materialized\s+lake)?\s+(?:table|view)(?:\s+if\s+not\s+exists)?"
+    r"|replace\s+table"
+    r"|alter\s+(?:table|view|materialized\s+lake\s+view)"
+    r"|drop\s+(?:table|view|materialized\s+lake\s+view)(?:\s+if\s+exists)?"
+    r"|merge\s+into)"
+    r"\s+(" + _NAME + r")",
+    re.IGNORECASE,
+)
+_RENAME_TARGET = re.compile(r"\brename\s+to\s+(" + _NAME + r")", re.IGNORECASE)
+# Cheap pre-check so statements that cannot be DDL are not lexed.
+_DDL_HINT = re.compile(r"\b(?:create|replace|alter|drop|merge)\b", re.IGNORECASE)
+
+# ``show table extended`` prints the schema with DataType.typeName, describe
+# with its SQL name; types not listed here (struct, array, map, ...) are
+# abbreviated in ``information`` and need a describe.
+_DESCRIBE_TYPES = {
+    "integer": "int",
+    "long": "bigint",
+    "short": "smallint",
+    "byte": "tinyint",
+    "null": "void",
+    **{
+        name: name
+        for name in (
+            "string",
+            "double",
+            "float",
+            "boolean",
+            "date",
+            "timestamp",
+            "timestamp_ntz",
+            "binary",
+        )
+    },
+}
+_DECIMAL = re.compile(r"decimal\(\d+,\d+\)")
+
+
+def relation_key(name: str) -> str:
+    """Return the cache key of a rendered relation name."""
+    return re.sub(r"\s*\.\s*", ".", name.replace("`", "")).strip().lower()
+
+
+def keys_overlap(key: str, target: str) -> bool:
+    """True if two relation keys may name the same relation (one qualifies the other)."""
+    return key == target or key.endswith("." + target) or target.endswith("." + key)
+
+
+def ddl_targets(sql: str) -> Iterator[str]:
+    """Yield the relations whose columns the statements in ``sql`` may change."""
+    if not _DDL_HINT.search(sql):
+        return
+    for statement in sql_lexer.split_statements(sql):
+        m = _DDL_TARGET.match(statement)
+        if m:
+            yield m.group(1)
+            rename = _RENAME_TARGET.search(statement, m.end())
+            if rename:
+                yield rename.group(1)
+
+
+def describe_type(type_name: str) -> Optional[str]:
+    """Return the ``describe`` name of a ``show table extended`` type, if known."""
+    type_name = type_name.strip().lower()
+    if _DECIMAL.fullmatch(type_name):
+        return type_name
+    return _DESCRIBE_TYPES.get(type_name)
+
+
+class ColumnCache:
+    """Columns per relation, kept until a statement may have changed them."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._columns: Dict[str, List[Any]] = {}
+        self._listed: Dict[str, Any] = {}
+
+    def get(
+        self, relation: Any, from_information: Callable[[Any], Optional[List[Any]]]
+    ) -> Optional[List[Any]]:
+        """Return the cached columns of ``relation``, or None on a miss.
+
+        A relation registered by :meth:`add_listed` is parsed with
+        ``from_information`` the first time it is asked for.
+        """
+        key = relation_key(str(relation))
+        with self._lock:
+            columns = self._columns.get(key)
+            if columns is None:
+                listed = self._listed.pop(key, None)
+                if listed is not None:
+                    columns = from_information(listed)
+                    if columns:
+                        self._columns[key] = columns
+        return list(columns) if columns else None
+
+    def set(self, relation: Any, columns: List[Any]) -> None:
+        with self._lock:
+            self._columns[relation_key(str(relation))] = list(columns)
+
+    def add_listed(self, relation: Any) -> None:
+        """Register a relation whose ``information`` holds its schema."""
+        key = relation_key(str(relation))
+        with self._lock:
+            if key not in self._columns:
+                self._listed[key] = relation
+
+    def invalidate(self, name: str) -> None:
+        """Drop every entry ``name`` may refer to."""
+        target = relation_key(name)
+        with self._lock:
+            for entries in (self._columns, self._listed):
+                for key in [k for k in entries if keys_overlap(k, target)]:
+                    del entries[key]
+
+    def invalidate_sql(self, sql: str) -> None:
+        """Drop the entries of every relation a DDL statement in ``sql`` targets."""
+        for name in ddl_targets(sql):
+            self.invalidate(name)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import atexit
-import datetime as dt
+import copy
 import hashlib
 import json
-import re
+import math
+import random
 import threading
 import time
 import uuid
@@ -13,18 +15,26 @@ from typing import Any, Optional
 
 import requests
 from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
-from dbt_common.utils.encoding import DECIMALS
 
 from dbt.adapters.events.logging import AdapterLogger
 from dbt.adapters.exceptions import FailedToConnectError
+from dbt.adapters.fabricspark import (
+    _http_utils,
+    batch,
+    livy_engine,
+    session_broker,
+    sql_binding,
+    sql_lexer,
+    statement_poller,
+    statement_registry,
+)
 from dbt.adapters.fabricspark import livysession as _livy_helpers
-from dbt.adapters.fabricspark._http_utils import parse_retry_after
 from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
 from dbt.adapters.fabricspark.livy_backend import LivyBackend
+from dbt.adapters.fabricspark.retry_policy import get_retry_policy
 from dbt.adapters.fabricspark.shortcuts import ShortcutClient
 
 logger = AdapterLogger("Microsoft Fabric-Spark")
-NUMBERS = DECIMALS + (int, float)
 
 # HC sessions whose state transitions through these values have not yet
 # produced sessionId/replId; keep polling until state leaves the set.
@@ -56,6 +66,26 @@ _shortcuts_done_lock = threading.Lock()
 _shortcuts_done: "set[tuple[str, str]]" = set()
 
 
+_repl_pools_lock = threading.Lock()
+# One REPL pool per sessionTag when ``hc_repl_pool`` is enabled, or once
+# execute_parallel needs extra REPLs.
+_repl_pools: "dict[str, HighConcurrencyReplPool]" = {}
+# The profile's thread count; sizes REPL pools and the number of shards.
+_hc_threads = 1
+# Bounded fan-out and per-acquire jitter for background pool fills.
+REPL_POOL_PARALLELISM = 4
+REPL_POOL_JITTER_SECONDS = 2.0
+# How long execute_parallel waits for each extra REPL it leases from the pool;
+# covers the pool's first acquire when it has not started yet.
+PARALLEL_LEASE_SECONDS = 300.0
+
+
+_shard_lock = threading.Lock()
+# [current, peak] REPLs per sessionTag, used to spread dbt threads evenly
+# across shards when ``hc_repls_per_session`` is set.
+_shard_occupancy: dict[str, list[int]] = {}
+
+
 def _get_headers(credentials: FabricSparkCredentials, tokenPrint: bool = False) -> dict[str, str]:
     return _livy_helpers.get_headers(credentials, tokenPrint)
 
@@ -87,6 +117,55 @@ def derive_session_tag(credentials: FabricSparkCredentials) -> str:
         return tag
 
 
+def configure_hc_threads(threads: int) -> None:
+    """Record the profile's ``threads``; sizes REPL pools and shard counts."""
+    global _hc_threads
+    _hc_threads = max(threads, 1)
+
+
+def shard_tags(credentials: FabricSparkCredentials) -> list[str]:
+    """Return the sessionTags this process spreads its REPLs across.
+
+    Without ``hc_repls_per_session`` this is just :func:`derive_session_tag`.
+    With it, ``ceil(threads / hc_repls_per_session)`` tags are derived as
+    ``<tag>-shard-0 .. <tag>-shard-k`` — deterministic whenever the base tag
+    is, so ``reuse_session`` finds the same warm shards on the next run.
+    """
+    base = derive_session_tag(credentials)
+    per_session = credentials.hc_repls_per_session
+    if not per_session or per_session <= 0:
+        return [base]
+    count = max(math.ceil(_hc_threads / per_session), 1)
+    return [f"{base}-shard-{i}" for i in range(count)]
+
+
+def assign_shard(credentials: FabricSparkCredentials) -> str:
+    """Pick the least-occupied shard tag for a new dbt thread."""
+    tags = shard_tags(credentials)
+    with _shard_lock:
+        tag = min(tags, key=lambda t: _shard_occupancy.get(t, [0, 0])[0])
+        entry = _shard_occupancy.setdefault(tag, [0, 0])
+        entry[0] += 1
+        entry[1] = max(entry[1], entry[0])
+        occupied = entry[0]
+    if len(tags) > 1:
+        logger.debug(f"HC thread assigned to {tag} ({occupied} REPL(s) on this shard)")
+    return tag
+
+
+def release_shard(tag: str) -> None:
+    with _shard_lock:
+        entry = _shard_occupancy.get(tag)
+        if entry and entry[0] > 0:
+            entry[0] -= 1
+
+
+def shard_occupancy() -> dict[str, dict[str, int]]:
+    """Per-sessionTag ``{repls, peak}`` REPL counts for this process."""
+    with _shard_lock:
+        return {tag: {"repls": cur, "peak": peak} for tag, (cur, peak) in _shard_occupancy.items()}
+
+
 class HighConcurrencySession:
     """Owns the lifecycle of one HC session (= one REPL).
 
@@ -97,11 +176,16 @@ class HighConcurrencySession:
     submission.
     """
 
-    def __init__(self, credentials: FabricSparkCredentials, spark_config: dict[str, Any]):
+    def __init__(
+        self,
+        credentials: FabricSparkCredentials,
+        spark_config: dict[str, Any],
+        session_tag: Optional[str] = None,
+    ):
         self.credential = credentials
         self.spark_config = spark_config
         self.connect_url = credentials.lakehouse_endpoint
-        self.session_tag = derive_session_tag(credentials)
+        self.session_tag = session_tag or derive_session_tag(credentials)
         self.hc_id: Optional[str] = None
         self.session_id: Optional[str] = None
         self.repl_id: Optional[str] = None
@@ -111,6 +195,10 @@ class HighConcurrencySession:
         # next statement so it can transparently re-acquire.
         self.is_dead = False
         self._lock = threading.Lock()
+        # Set when the session is leased from a HighConcurrencyReplPool (or
+        # from the session broker, via BrokeredReplPool).
+        self.pool: Optional[Any] = None
+        self.replacement_requested = False
 
     def __enter__(self) -> HighConcurrencySession:
         return self
@@ -131,42 +219,53 @@ class HighConcurrencySession:
         On success, ``self.hc_id``, ``self.session_id`` and ``self.repl_id``
         are all populated and the REPL is ready for statement submission.
         """
+        livy_engine.get_engine().run(self.acquire_async())
+
+    async def acquire_async(self) -> None:
+        """Coroutine form of :meth:`acquire`, run on the Livy engine loop."""
+        engine = livy_engine.get_engine()
         payload = self._build_acquire_payload()
         url = self.connect_url + "/highConcurrencySessions"
         logger.debug(f"Acquiring HC session (sessionTag={self.session_tag})")
 
         response = None
-        max_retries = 5
-        for attempt in range(max_retries):
+        retry = get_retry_policy().start("HC acquire", url, max_retries=4, base=5.0)
+        while True:
             try:
-                response = requests.post(
+                response = await engine.http(
+                    "POST",
                     url,
                     data=json.dumps(payload),
-                    headers=_get_headers(self.credential, False),
+                    headers=await engine.call(_get_headers, self.credential, False),
                     timeout=self.credential.http_timeout,
                 )
                 if response.status_code in (200, 201, 202):
+                    retry.record_success()
                     break
                 # Fabric returns 404 transiently after a lakehouse is
                 # provisioned before the Livy endpoint is fully wired.
-                if attempt < max_retries - 1 and (
+                if not retry.exhausted() and (
                     response.status_code == 404 or response.status_code >= 500
                 ):
-                    wait = 5 * (2**attempt)
+                    if response.status_code >= 500:
+                        retry.record_failure()
+                    wait = retry.next_delay()
                     logger.warning(
-                        f"HC acquire returned HTTP {response.status_code}, "
-                        f"retrying in {wait}s (attempt {attempt + 1}/{max_retries})"
+                        f"HC acquire returned HTTP {response.status_code}, retrying in "
+                        f"{wait:.0f}s (retry {retry.attempts}/{retry.max_retries})"
                     )
-                    time.sleep(wait)
+                    await engine.sleep(wait)
                     continue
                 response.raise_for_status()
+                break
             except (
                 requests.exceptions.ConnectionError,
                 requests.exceptions.Timeout,
             ) as exc:
-                if attempt >= max_retries - 1:
+                retry.record_failure()
+                if retry.exhausted():
                     raise FailedToConnectError(f"HC session acquire failed: {exc}") from exc
-                time.sleep(2**attempt)
+                await engine.sleep(retry.next_delay())
 
         if response is None:
             raise FailedToConnectError("HC acquire produced no response")
@@ -185,7 +284,7 @@ class HighConcurrencySession:
         with _active_sessions_lock:
             _active_sessions.add(self)
 
-        self._poll_until_idle()
+        await self._poll_until_idle()
         self.is_new_session_required = False
         self.is_dead = False
         logger.debug(
@@ -227,7 +326,8 @@ class HighConcurrencySession:
             payload["conf"] = conf
         return payload
 
-    def _poll_until_idle(self) -> None:
+    async def _poll_until_idle(self) -> None:
+        engine = livy_engine.get_engine()
         deadline = time.time() + self.credential.session_start_timeout
         url = self.connect_url + "/highConcurrencySessions/" + self.hc_id
 
@@ -238,9 +338,10 @@ class HighConcurrencySession:
                     f"{self.hc_id} to become Idle. Increase `session_start_timeout` in profiles.yml."
                 )
             try:
-                resp = requests.get(
+                resp = await engine.http(
+                    "GET",
                     url,
-                    headers=_get_headers(self.credential, False),
+                    headers=await engine.call(_get_headers, self.credential, False),
                     timeout=self.credential.http_timeout,
                 )
                 body = resp.json()
@@ -252,7 +353,7 @@ class HighConcurrencySession:
                     f"Transient error polling HC session {self.hc_id}: {exc}; "
                     f"retrying in {self.credential.poll_wait}s"
                 )
-                time.sleep(self.credential.poll_wait)
+                await engine.sleep(self.credential.poll_wait)
                 continue
 
             state = body.get("state", "")
@@ -271,7 +372,7 @@ class HighConcurrencySession:
             if state not in _ACQUIRING_STATES and state != "Idle":
                 logger.debug(f"HC session {self.hc_id} in unfamiliar state '{state}', polling on")
 
-            time.sleep(self.credential.poll_wait)
+            await engine.sleep(self.credential.poll_wait)
 
     # ---- statement URLs --------------------------------------------------
 
@@ -285,6 +386,22 @@ class HighConcurrencySession:
             + "/statements"
         )
 
+    def adopt(self, other: HighConcurrencySession) -> None:
+        """Take over ``other``'s ready REPL in place of this (dead) one.
+
+        Cursors and connections keep referencing this object, so swapping the
+        ids here moves them onto the fresh REPL without rebuilding anything.
+        """
+        self.hc_id = other.hc_id
+        self.session_id = other.session_id
+        self.repl_id = other.repl_id
+        self.is_dead = False
+        self.is_new_session_required = False
+        self.replacement_requested = False
+        with _active_sessions_lock:
+            _active_sessions.discard(other)
+            _active_sessions.add(self)
+
     # ---- release ---------------------------------------------------------
 
     def delete(self) -> None:
@@ -297,7 +414,7 @@ class HighConcurrencySession:
         if not self.hc_id:
             return
         try:
-            res = requests.delete(
+            res = _http_utils.delete(
                 self.connect_url + "/highConcurrencySessions/" + self.hc_id,
                 headers=_get_headers(self.credential, False),
                 timeout=self.credential.http_timeout,
@@ -332,6 +449,8 @@ class HighConcurrencyCursor:
         self._rows: Optional[list] = None
         self._schema: Optional[list] = None
         self._fetch_index = 0
+        self.in_flight = livy_engine.InFlightStatements()
+        self._fingerprint: Optional[str] = None
 
     def __enter__(self) -> HighConcurrencyCursor:
         return self
@@ -377,185 +496,77 @@ class HighConcurrencyCursor:
         ``is_new_session_required`` is set.
         """
         if self.hc_session.is_dead or self.hc_session.is_new_session_required:
+            if self.hc_session.pool is not None:
+                logger.debug("HC REPL marked stale — swapping in a pooled replacement")
+                self.hc_session.pool.swap(self.hc_session)
+                return
             logger.debug("HC REPL marked stale — re-acquiring")
             self.hc_session.acquire()
 
-    def _submit(self, code: str) -> requests.Response:
+    def _submit(self, code: str, kind: str = "sql") -> requests.Response:
         self._ensure_repl()
-        url = self.hc_session.statements_url()
-        data = {"code": code, "kind": "sql"}
-        logger.debug(f"Submitted: {data} {url}")
-
-        max_retries = 5
-        res = None
-        for attempt in range(max_retries):
-            try:
-                res = requests.post(
-                    url,
-                    data=json.dumps(data),
-                    headers=_get_headers(self.credential, False),
-                    timeout=self.credential.http_timeout,
-                )
-            except (
-                requests.exceptions.SSLError,
-                requests.exceptions.ConnectionError,
-                requests.exceptions.Timeout,
-                requests.exceptions.ChunkedEncodingError,
-            ) as exc:
-                if attempt >= max_retries - 1:
-                    raise DbtRuntimeError(
-                        f"HC statement submit failed after {max_retries} retries: {exc}"
-                    )
-                wait = 2**attempt
-                logger.debug(
-                    f"HC statement submit got transient network error "
-                    f"({type(exc).__name__}), retrying in {wait}s"
-                )
-                time.sleep(wait)
-                continue
-            if res.status_code == 429:
-                retry_after = parse_retry_after(res)
-                wait = max(retry_after, 2**attempt)
-                logger.debug(f"HC statement submit got HTTP 429, retrying in {wait:.0f}s")
-                time.sleep(wait)
-                continue
-            if res.status_code < 500:
-                break
-            if attempt < max_retries - 1:
-                wait = 2**attempt
-                logger.debug(
-                    f"HC statement submit got HTTP {res.status_code}, retrying in {wait}s"
-                )
-                time.sleep(wait)
-
-        if res.status_code >= 400:
-            if res.status_code == 404:
-                # The REPL or underlying session is gone — flag this thread's
-                # HC session for re-acquisition; the next add_query retry on
-                # the dbt side will rebuild it transparently.
-                self.hc_session.is_dead = True
-                self.hc_session.is_new_session_required = True
-                logger.debug("HC statement submit returned 404 — flagging REPL for re-acquire")
-            raise DbtRuntimeError(
-                f"HC statement submit failed (HTTP {res.status_code}): {res.text}"
-            )
-
-        body = res.json()
-        if "id" not in body:
-            raise DbtRuntimeError(
-                f"HC statement submit returned unexpected response (missing 'id'): {body}"
+        statements_url = self.hc_session.statements_url()
+        registry = statement_registry.get_registry(self.credential)
+        self._fingerprint = statement_registry.fingerprint(code)
+        running = registry.resume(
+            self._fingerprint, statements_url, self.credential, self._headers
+        )
+        if running is not None:
+            return livy_engine.statement_response(running)
+        res = livy_engine.get_engine().run(
+            livy_engine.get_engine().submit_statement(
+                statements_url,
+                code,
+                self.credential,
+                headers=self._headers,
+                label="HC",
+                on_not_found=self._mark_repl_dead,
+                kind=kind,
+                fingerprint=self._fingerprint,
             )
+        )
+        registry.record(self._fingerprint, statements_url, res.json()["id"])
         return res
 
     def _poll(self, submit_response: requests.Response) -> dict:
         body = submit_response.json()
-        statement_id = repr(body["id"])
-        url = self.hc_session.statements_url() + "/" + statement_id
-
-        deadline = (
-            (time.time() + self.credential.statement_timeout)
-            if self.credential.statement_timeout > 0
-            else None
-        )
-        consecutive_failures = 0
-        max_poll_retries = 30
-        poll_interval = 0.3
-        poll_cap = max(self.credential.poll_statement_wait * 3, 1.5)
-        not_found_retries = 0
-        max_not_found_retries = 20
-
-        while True:
-            if deadline is not None and time.time() > deadline:
-                raise DbtDatabaseError(
-                    f"Timeout ({self.credential.statement_timeout}s) waiting for HC statement "
-                    f"{statement_id}. Increase `statement_timeout` in profiles.yml."
-                )
-            try:
-                resp = requests.get(
-                    url,
-                    headers=_get_headers(self.credential, False),
-                    timeout=self.credential.http_timeout,
-                )
-            except (
-                requests.exceptions.SSLError,
-                requests.exceptions.ConnectionError,
-                requests.exceptions.Timeout,
-                requests.exceptions.ChunkedEncodingError,
-            ) as exc:
-                consecutive_failures += 1
-                if consecutive_failures > max_poll_retries:
-                    raise DbtRuntimeError(
-                        f"HC statement poll failed after {max_poll_retries} retries: {exc}"
-                    )
-                wait = min(2 ** (consecutive_failures - 1), 30)
-                logger.debug(f"HC statement poll got transient error, retrying in {wait}s")
-                time.sleep(wait)
-                continue
-            if resp.status_code == 429:
-                consecutive_failures += 1
-                retry_after = parse_retry_after(resp)
-                wait = max(retry_after, 2 ** (consecutive_failures - 1))
-                logger.debug(f"HC statement poll got HTTP 429, retrying in {wait:.0f}s")
-                time.sleep(wait)
-                if consecutive_failures > max_poll_retries:
-                    raise DbtRuntimeError(
-                        f"HC statement poll failed after {max_poll_retries} retries (HTTP 429)"
-                    )
-                continue
-            if resp.status_code >= 500:
-                consecutive_failures += 1
-                if consecutive_failures <= max_poll_retries:
-                    wait = 2 ** (consecutive_failures - 1)
-                    logger.debug(
-                        f"HC statement poll got HTTP {resp.status_code}, retrying in {wait}s"
-                    )
-                    time.sleep(wait)
-                    continue
-                raise DbtRuntimeError(
-                    f"HC statement poll failed after {max_poll_retries} retries "
-                    f"(HTTP {resp.status_code}): {resp.text}"
-                )
-            if resp.status_code == 404 and not_found_retries < max_not_found_retries:
-                not_found_retries += 1
-                wait = min(0.3 * (2.0 ** (not_found_retries - 1)), 5.0)
-                logger.debug(
-                    f"HC statement poll got HTTP 404, retrying in {wait:.2f}s "
-                    f"(not-found {not_found_retries}/{max_not_found_retries})"
-                )
-                time.sleep(wait)
-                continue
-            if resp.status_code >= 400:
-                if resp.status_code == 404:
-                    self.hc_session.is_dead = True
-                    self.hc_session.is_new_session_required = True
-                raise DbtRuntimeError(
-                    f"HC statement poll failed (HTTP {resp.status_code}): {resp.text}"
+        statements_url = self.hc_session.statements_url()
+        registry = statement_registry.get_registry(self.credential)
+        with (
+            registry.consuming(self._fingerprint),
+            self.in_flight.track(statements_url, body["id"], self.credential, self._headers),
+        ):
+            return livy_engine.get_engine().run(
+                livy_engine.get_engine().wait_statement(
+                    statements_url,
+                    body["id"],
+                    self.credential,
+                    headers=self._headers,
+                    label="HC",
+                    on_not_found=self._mark_repl_dead,
                 )
-            consecutive_failures = 0
+            )
 
-            body = resp.json()
-            if "state" not in body:
-                raise DbtRuntimeError(
-                    f"HC statement poll returned unexpected response (missing 'state'): {body}"
-                )
+    def _headers(self) -> dict[str, str]:
+        return _get_headers(self.credential, False)
 
-            if body["state"] == "available":
-                return body
-            if body["state"] in ("error", "cancelled", "cancelling"):
-                error_msg = body.get("output", {}).get("evalue", "Unknown error")
-                raise DbtDatabaseError(
-                    f"Statement {statement_id} failed with state '{body['state']}': {error_msg}"
-                )
-            time.sleep(poll_interval)
-            poll_interval = min(poll_interval * 1.5, poll_cap)
+    def _mark_repl_dead(self) -> None:
+        # The REPL or underlying session is gone — flag this thread's HC
+        # session for re-acquisition; the next add_query retry on the dbt
+        # side will rebuild it transparently.
+        logger.debug("HC statement returned 404 — flagging REPL for re-acquire")
+        self.hc_session.is_dead = True
+        self.hc_session.is_new_session_required = True
+        if self.hc_session.pool is not None:
+            self.hc_session.pool.request_replacement(self.hc_session)
 
     @staticmethod
     def _strip_block_comments(sql: str) -> str:
-        return re.sub(r"\s*/\*(.|\n)*?\*/\s*", "\n", sql, flags=re.DOTALL).strip()
+        return sql_lexer.clean_statement(sql)
 
     def execute(self, sql: str, *parameters: Any) -> None:
         if len(parameters) > 0:
-            sql = sql % parameters
+            sql = sql_binding.bind(sql, parameters)
         self._fetch_index = 0
 
         code = self._strip_block_comments(sql)
@@ -580,6 +591,122 @@ class HighConcurrencyCursor:
                 "Error while executing query: " + output.get("evalue", "<no evalue>")
             )
 
+    def execute_batch(self, statements: list[str]) -> list[dict]:
+        """Run ``statements`` in order as one ``pyspark`` statement on this REPL."""
+        statements = [self._strip_block_comments(sql) for sql in statements]
+        self._fetch_index = 0
+        self._rows = []
+        self._schema = []
+        result = self._poll(self._submit(batch.build_script(statements), kind="pyspark"))
+        logger.debug(result)
+        return batch.parse_results(result, statements)
+
+    def execute_code(self, code: str, kind: str = "pyspark") -> dict:
+        """Run ``code`` as one statement of ``kind`` on this REPL; return its body."""
+        self._fetch_index = 0
+        self._rows = []
+        self._schema = []
+        result = self._poll(self._submit(code, kind=kind))
+        logger.debug(f"{kind} statement {result.get('id')}: {result.get('output')}")
+        return result
+
+    def execute_parallel(self, statements: list[str], repls: int) -> int:
+        """Run independent ``statements`` concurrently on up to ``repls`` REPLs.
+
+        This REPL is one of them; the others are leased from the
+        :class:`HighConcurrencyReplPool` of its sessionTag, so they join the
+        same Livy session (and Spark application), and go back to the pool
+        once every statement has run, ready for the next call. The
+        statements must not depend on each other's order. Returns the number
+        of REPLs used; the first failing statement is raised after the ones
+        already running have finished.
+        """
+        self._ensure_repl()
+        self._fetch_index = 0
+        self._rows = []
+        self._schema = []
+        statements = [self._strip_block_comments(sql) for sql in statements]
+        errors: list[BaseException] = []
+        try:
+            return livy_engine.get_engine().run(self._execute_parallel(statements, repls, errors))
+        except KeyboardInterrupt as ex:
+            # Stop handing out statements and cancel the ones still running.
+            errors.append(ex)
+            self.in_flight.cancel_all()
+            raise
+
+    async def _execute_parallel(
+        self, statements: list[str], repls: int, errors: list[BaseException]
+    ) -> int:
+        engine = livy_engine.get_engine()
+        extra = min(repls, len(statements)) - 1
+        pool = self.hc_session.pool
+        if not isinstance(pool, HighConcurrencyReplPool):
+            pool = get_repl_pool(self.credential, self.hc_session.session_tag)
+        if extra > 0:
+            pool.grow(extra)
+
+        def lease() -> Optional[HighConcurrencySession]:
+            try:
+                return pool.lease(timeout=PARALLEL_LEASE_SECONDS)
+            except Exception as ex:
+                logger.warning(f"Could not lease an extra HC REPL, continuing without it: {ex}")
+                return None
+
+        leases = await asyncio.gather(*(engine.call(lease) for _ in range(extra)))
+        acquired = [s for s in leases if s is not None]
+        pending = list(reversed(statements))
+
+        async def worker(session: HighConcurrencySession) -> None:
+            def mark_dead() -> None:
+                session.is_dead = True
+
+            on_not_found = self._mark_repl_dead if session is self.hc_session else mark_dead
+            while pending and not errors:
+                code = pending.pop()
+                url = session.statements_url()
+                try:
+                    res = await engine.submit_statement(
+                        url, code, self.credential, self._headers, "HC", on_not_found
+                    )
+                    statement_id = res.json()["id"]
+                    with self.in_flight.registered(
+                        url, statement_id, self.credential, self._headers
+                    ):
+                        result = await engine.wait_statement(
+                            url, statement_id, self.credential, self._headers, "HC", on_not_found
+                        )
+                except statement_poller.StatementTimeoutError as ex:
+                    errors.append(ex)
+                    await engine.cancel_statement(
+                        url, statement_id, self.credential, self._headers
+                    )
+                    return
+                except Exception as ex:
+                    errors.append(ex)
+                    return
+                output = result.get("output", {})
+                if output.get("status") != "ok":
+                    errors.append(
+                        DbtDatabaseError(
+                            "Error while executing query: "
+                            + output.get("evalue", "<no evalue>")
+                            + "\n"
+                            + code[:1000]
+                        )
+                    )
+
+        sessions = [self.hc_session, *acquired]
+        logger.debug(f"Running {len(statements)} statements across {len(sessions)} HC REPLs")
+        try:
+            await asyncio.gather(*map(worker, sessions))
+        finally:
+            for session in acquired:
+                await engine.call(pool.release, session)
+        if errors:
+            raise errors[0]
+        return len(sessions)
+
     def fetchall(self):
         return self._rows
 
@@ -610,6 +737,10 @@ class HighConcurrencyConnection:
     def get_session_id(self) -> Optional[str]:
         return self.hc_session.session_id
 
+    @property
+    def in_flight(self) -> livy_engine.InFlightStatements:
+        return self._cursor.in_flight
+
     def get_headers(self) -> dict[str, str]:
         return _get_headers(self.credential, False)
 
@@ -642,23 +773,280 @@ def _maybe_create_shortcuts(credentials: FabricSparkCredentials) -> None:
         if key in _shortcuts_done:
             return
         _shortcuts_done.add(key)
-
-    # Force a header build so the module-level accessToken is populated
-    # before instantiating ShortcutClient.
-    _ = _get_headers(credentials, False)
+    marker = f"shortcuts:{key[0]}:{key[1]}"
+    if session_broker.broker_call(credentials, "meta_get", marker):
+        return
 
     try:
         shortcut_client = ShortcutClient(
-            _livy_helpers.accessToken.token,
+            _livy_helpers.get_access_token(credentials).token,
             credentials.workspaceid,
             credentials.lakehouseid,
             credentials.endpoint,
         )
         shortcut_client.create_shortcuts(credentials.shortcuts_json_str)
+        session_broker.broker_call(credentials, "meta_put", marker, True)
     except Exception as ex:
         logger.error(f"Unable to create shortcuts: {ex}")
 
 
+class ReplPoolBusyError(DbtRuntimeError):
+    """Raised by :meth:`HighConcurrencyReplPool.lease` when no REPL frees up in time."""
+
+
+class HighConcurrencyReplPool:
+    """Process-wide pool of ready HC REPLs sharing one sessionTag.
+
+    The first :meth:`lease` acquires a REPL synchronously (that is the Livy
+    cold start). As soon as it is up, the remaining ``size - 1`` REPLs are
+    acquired concurrently on the Livy engine, at most
+    ``REPL_POOL_PARALLELISM`` at a time and each after a small random delay,
+    so the rest of the dbt threads find a REPL ready instead of each paying
+    its own staggered POST + poll loop. Leases go back to the pool on
+    :meth:`release`. A REPL that dies is replaced in the background as soon
+    as the 404 is seen, and the cursor swaps onto the replacement via
+    :meth:`swap`.
+    """
+
+    def __init__(
+        self, credentials: FabricSparkCredentials, size: int, session_tag: Optional[str] = None
+    ) -> None:
+        self.credentials = credentials
+        self.size = max(size, 1)
+        self.session_tag = session_tag or derive_session_tag(credentials)
+        self._cond = threading.Condition()
+        self._idle: list[HighConcurrencySession] = []
+        self._leased = 0
+        self._pending = 0
+
+    def _new_session(self) -> HighConcurrencySession:
+        session = HighConcurrencySession(
+            self.credentials, self.credentials.spark_config, self.session_tag
+        )
+        session.pool = self
+        return session
+
+    def lease(self, timeout: Optional[float] = None) -> HighConcurrencySession:
+        """Lease a ready REPL, acquiring one while the pool is not full.
+
+        With ``timeout``, raise :class:`ReplPoolBusyError` when every REPL is
+        still leased after that many seconds instead of waiting on.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._idle:
+                    self._leased += 1
+                    return self._idle.pop()
+                # While the very first acquire is still cold-starting the
+                # Livy session, wait for it rather than racing it.
+                if self._leased + self._pending < self.size and (
+                    self._leased or not self._pending
+                ):
+                    self._pending += 1
+                    break
+                if deadline is None:
+                    self._cond.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ReplPoolBusyError(
+                        f"All {self.size} HC REPL(s) tagged {self.session_tag} are leased"
+                    )
+                self._cond.wait(remaining)
+        session = self._new_session()
+        try:
+            session.acquire()
+        except BaseException:
+            with self._cond:
+                self._pending -= 1
+                self._cond.notify_all()
+            raise
+        with self._cond:
+            # One step from pending to leased: a waiter must never see the
+            # slot as free in between and start an acquire too many.
+            self._pending -= 1
+            self._leased += 1
+            self._cond.notify_all()
+        self._fill()
+        return session
+
+    def grow(self, extra: int) -> None:
+        """Make room for ``extra`` leases beyond the ones currently out.
+
+        :meth:`HighConcurrencyCursor.execute_parallel` borrows REPLs on top of
+        one per dbt thread; the pool keeps them afterwards, ready for the
+        next parallel statement.
+        """
+        with self._cond:
+            self.size = max(self.size, self._leased + extra)
+            self._cond.notify_all()
+
+    def prestart(self) -> None:
+        """Begin acquiring this pool's first REPL in the background, if none exists."""
+        with self._cond:
+            if self._leased or self._pending or self._idle:
+                return
+            self._pending += 1
+        livy_engine.get_engine().submit(self._acquire_many(1))
+
+    def release(self, session: HighConcurrencySession) -> None:
+        with self._cond:
+            self._leased -= 1
+            if session.is_dead or session.is_new_session_required:
+                dead = session
+            else:
+                dead = None
+                self._idle.append(session)
+            self._cond.notify_all()
+        if dead is not None:
+            self._retire(dead)
+            self._fill()
+
+    def request_replacement(self, session: HighConcurrencySession) -> None:
+        """Start acquiring a spare for ``session`` without waiting for it."""
+        with self._cond:
+            if session.replacement_requested:
+                return
+            session.replacement_requested = True
+            self._pending += 1
+        livy_engine.get_engine().submit(self._acquire_many(1))
+
+    def swap(self, session: HighConcurrencySession) -> None:
+        """Move a dead leased ``session`` onto a ready REPL from the pool."""
+        self.request_replacement(session)
+        with self._cond:
+            while not self._idle and self._pending:
+                self._cond.wait()
+            fresh = self._idle.pop() if self._idle else None
+        if fresh is None:
+            # Background replacement failed; fall back to an inline acquire.
+            session.acquire()
+            session.replacement_requested = False
+            return
+        retired = copy.copy(session)
+        session.adopt(fresh)
+        self._retire(retired)
+
+    def _retire(self, session: HighConcurrencySession) -> None:
+        engine = livy_engine.get_engine()
+        engine.submit(engine.call(session.delete))
+
+    def _fill(self) -> None:
+        with self._cond:
+            missing = self.size - self._leased - self._pending - len(self._idle)
+            if missing <= 0:
+                return
+            self._pending += missing
+        logger.debug(f"Acquiring {missing} HC REPL(s) for the pool in the background")
+        livy_engine.get_engine().submit(self._acquire_many(missing))
+
+    async def _acquire_many(self, count: int) -> None:
+        engine = livy_engine.get_engine()
+        limit = asyncio.Semaphore(REPL_POOL_PARALLELISM)
+
+        async def acquire_one() -> None:
+            session: Optional[HighConcurrencySession] = self._new_session()
+            async with limit:
+                await engine.sleep(random.uniform(0, REPL_POOL_JITTER_SECONDS))
+                try:
+                    await session.acquire_async()
+                except Exception as ex:
+                    logger.warning(f"Background HC REPL acquire failed: {ex}")
+                    session = None
+            with self._cond:
+                self._pending -= 1
+                if session is not None:
+                    self._idle.append(session)
+                self._cond.notify_all()
+            if session is not None:
+                self._fill()
+
+        await asyncio.gather(*(acquire_one() for _ in range(count)))
+
+
+def get_repl_pool(
+    credentials: FabricSparkCredentials, session_tag: Optional[str] = None
+) -> HighConcurrencyReplPool:
+    """Return the pool for ``session_tag`` (default: the unsharded tag).
+
+    Each pool holds its share of ``threads`` so that, summed over all shards,
+    there is one REPL per dbt thread.
+    """
+    tags = shard_tags(credentials)
+    tag = session_tag or tags[0]
+    with _repl_pools_lock:
+        pool = _repl_pools.get(tag)
+        if pool is None:
+            size = math.ceil(_hc_threads / len(tags))
+            pool = HighConcurrencyReplPool(credentials, size, tag)
+            _repl_pools[tag] = pool
+        return pool
+
+
+def start_shard_pools(credentials: FabricSparkCredentials) -> None:
+    """Cold-start every shard's pool in parallel rather than one after another."""
+    tags = shard_tags(credentials)
+    if len(tags) > 1:
+        for tag in tags:
+            get_repl_pool(credentials, tag).prestart()
+
+
+class BrokeredReplPool:
+    """Pool-shaped view of the REPLs the session broker holds for one shard.
+
+    Leases come back from the broker as ids of an already-``Idle`` REPL, so a
+    short-lived dbt process skips the acquire entirely. The sessions are not
+    added to ``_active_sessions``: the broker owns them and this process only
+    hands them back on :meth:`release`.
+    """
+
+    def __init__(self, credentials: FabricSparkCredentials, shard: int) -> None:
+        self.credentials = credentials
+        self.shard = shard
+
+    def lease(self) -> Optional[HighConcurrencySession]:
+        """Lease a ready REPL from the broker; ``None`` if the broker is unavailable."""
+        res = session_broker.broker_call(
+            self.credentials, "lease", self.credentials, self.shard, _hc_threads
+        )
+        if res is None:
+            return None
+        if res.get("busy"):
+            logger.debug("Every brokered HC REPL is leased; acquiring one in this process")
+            return None
+        session = HighConcurrencySession(
+            self.credentials, self.credentials.spark_config, res["session_tag"]
+        )
+        session.hc_id = res["hc_id"]
+        session.session_id = res["session_id"]
+        session.repl_id = res["repl_id"]
+        session.is_new_session_required = False
+        session.pool = self
+        logger.debug(f"Leased HC REPL {session.hc_id} from the session broker")
+        return session
+
+    def release(self, session: HighConcurrencySession) -> None:
+        dead = session.is_dead or session.is_new_session_required
+        session_broker.broker_call(self.credentials, "release", session.hc_id, dead)
+
+    def request_replacement(self, session: HighConcurrencySession) -> None:
+        # The broker starts a replacement when the dead REPL is released.
+        pass
+
+    def swap(self, session: HighConcurrencySession) -> None:
+        """Hand the dead REPL back to the broker and move onto a fresh lease."""
+        session_broker.broker_call(self.credentials, "release", session.hc_id, True)
+        fresh = self.lease()
+        if fresh is None:
+            session.acquire()
+            return
+        session.adopt(fresh)
+        # The broker owns the fresh REPL; keep it out of this process's atexit release.
+        with _active_sessions_lock:
+            _active_sessions.discard(session)
+
+
 class HighConcurrencySessionManager(LivyBackend):
     """Per-dbt-thread backend. One instance owns one HC session = one REPL.
 
@@ -670,15 +1058,56 @@ class HighConcurrencySessionManager(LivyBackend):
     def __init__(self) -> None:
         self._hc_session: Optional[HighConcurrencySession] = None
         self._connection: Optional[HighConcurrencyConnection] = None
+        self._shard_tag: Optional[str] = None
+
+    def _shard(self, credentials: FabricSparkCredentials) -> str:
+        if self._shard_tag is None:
+            self._shard_tag = assign_shard(credentials)
+        return self._shard_tag
+
+    def _lease(self, credentials: FabricSparkCredentials) -> Optional[HighConcurrencySession]:
+        """Lease a ready REPL from the session broker or the in-process pool."""
+        tag = self._shard(credentials)
+        if credentials.session_broker:
+            session = BrokeredReplPool(credentials, shard_tags(credentials).index(tag)).lease()
+            if session is not None:
+                return session
+        if not credentials.hc_repl_pool:
+            return None
+        start_shard_pools(credentials)
+        return get_repl_pool(credentials, tag).lease()
 
     def connect(self, credentials: FabricSparkCredentials) -> HighConcurrencyConnection:  # type: ignore[override]
+        if self._hc_session is None and (credentials.hc_repl_pool or credentials.session_broker):
+            self._hc_session = self._lease(credentials)
+            if self._hc_session is not None:
+                _maybe_create_shortcuts(credentials)
+                self._connection = HighConcurrencyConnection(credentials, self._hc_session)
+        if self._hc_session is not None and self._hc_session.pool is not None:
+            return self._connection  # type: ignore[return-value]
         if self._hc_session is None or self._hc_session.is_new_session_required:
-            self._hc_session = HighConcurrencySession(credentials, credentials.spark_config)
+            self._hc_session = HighConcurrencySession(
+                credentials, credentials.spark_config, self._shard(credentials)
+            )
             self._hc_session.acquire()
             _maybe_create_shortcuts(credentials)
             self._connection = HighConcurrencyConnection(credentials, self._hc_session)
         return self._connection  # type: ignore[return-value]
 
+    async def connect_async(
+        self, credentials: FabricSparkCredentials
+    ) -> HighConcurrencyConnection:  # type: ignore[override]
+        if credentials.hc_repl_pool or credentials.session_broker:
+            return await livy_engine.get_engine().call(self.connect, credentials)
+        if self._hc_session is None or self._hc_session.is_new_session_required:
+            self._hc_session = HighConcurrencySession(
+                credentials, credentials.spark_config, self._shard(credentials)
+            )
+            await self._hc_session.acquire_async()
+            await livy_engine.get_engine().call(_maybe_create_shortcuts, credentials)
+            self._connection = HighConcurrencyConnection(credentials, self._hc_session)
+        return self._connection  # type: ignore[return-value]
+
     def disconnect(self) -> None:  # type: ignore[override]
         """Release this thread's HC id, unless ``reuse_session`` is set.
 
@@ -688,10 +1117,14 @@ class HighConcurrencySessionManager(LivyBackend):
         next dbt invocation (Fabric reaps it on ``session_idle_timeout``) —
         deleting the last REPL would otherwise make Fabric tear the session
         down straight away, defeating reuse. Mirrors the singleton backend's
-        ``_disconnect_impl``.
+        ``_disconnect_impl``. A REPL leased from the pool (``hc_repl_pool``) or
+        the session broker is returned to it instead; the atexit handler
+        releases pooled REPLs and the broker releases its own.
         """
         if self._hc_session is not None:
-            if not self._hc_session.credential.reuse_session:
+            if self._hc_session.pool is not None:
+                self._hc_session.pool.release(self._hc_session)
+            elif not self._hc_session.credential.reuse_session:
                 self._hc_session.delete()
             else:
                 logger.debug(
@@ -700,6 +1133,9 @@ class HighConcurrencySessionManager(LivyBackend):
                 )
             self._hc_session = None
             self._connection = None
+        if self._shard_tag is not None:
+            release_shard(self._shard_tag)
+            self._shard_tag = None
 
 
 class HighConcurrencyConnectionWrapper(object):
@@ -719,8 +1155,13 @@ class HighConcurrencyConnectionWrapper(object):
         self._cursor = self.handle.cursor()
         return self
 
+    @property
+    def in_flight(self) -> livy_engine.InFlightStatements:
+        return self.handle.in_flight
+
     def cancel(self):
-        logger.debug("NotImplemented: cancel")
+        """Cancel this connection's in-flight statements on the REPL."""
+        self.handle.in_flight.cancel_all()
 
     def close(self):
         self.handle.close()
@@ -738,30 +1179,25 @@ class HighConcurrencyConnectionWrapper(object):
         return self._cursor.fetchone()
 
     def execute(self, sql, bindings=None):
-        if sql.strip().endswith(";"):
-            sql = sql.strip()[:-1]
+        sql = sql_lexer.strip_terminator(sql)
         if bindings is None:
             self._cursor.execute(sql)
         else:
-            bindings = [self._fix_binding(b) for b in bindings]
             self._cursor.execute(sql, *bindings)
 
+    def execute_batch(self, statements):
+        return self._cursor.execute_batch(statements)
+
+    def execute_code(self, code, kind="pyspark"):
+        return self._cursor.execute_code(code, kind)
+
+    def execute_parallel(self, statements, repls):
+        return self._cursor.execute_parallel(statements, repls)
+
     @property
     def description(self):
         return self._cursor.description
 
-    @classmethod
-    def _fix_binding(cls, value) -> float | str:
-        if isinstance(value, NUMBERS):
-            return float(value)
-        elif isinstance(value, dt.datetime):
-            return f"'{value.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}'"
-        elif value is None:
-            return "''"
-        else:
-            escaped = str(value).replace("'", "\\'")
-            return f"'{escaped}'"
-
 
 def _atexit_cleanup_hc() -> None:
     """DELETE still-active HC sessions on process exit.
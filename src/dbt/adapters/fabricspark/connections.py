@@ -1,8 +1,12 @@
 import os
+import sys
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from contextlib import contextmanager
 from typing import (
+    TYPE_CHECKING,
     Any,
     Generator,
     Iterable,
@@ -14,6 +18,9 @@ from typing import (
     Union,
 )
 
+if TYPE_CHECKING:
+    import agate
+
 from dbt_common.dataclass_schema import StrEnum
 from dbt_common.events.functions import fire_event
 from dbt_common.exceptions import DbtConfigError, DbtRuntimeError
@@ -27,16 +34,29 @@ from dbt.adapters.contracts.connection import (
 from dbt.adapters.events.logging import AdapterLogger
 from dbt.adapters.events.types import AdapterEventDebug, ConnectionUsed, SQLQuery, SQLQueryStatus
 from dbt.adapters.exceptions import FailedToConnectError
+from dbt.adapters.fabricspark import (
+    _http_utils,
+    batch,
+    column_cache,
+    metadata_cache,
+    session_broker,
+)
 from dbt.adapters.fabricspark.concurrent_livy import (
     HighConcurrencyConnectionWrapper,
     HighConcurrencySessionManager,
+    configure_hc_threads,
+    shard_occupancy,
 )
+from dbt.adapters.fabricspark.livy_backend import LivyBackend
+from dbt.adapters.fabricspark.livy_engine import cancel_in_flight, get_engine
 from dbt.adapters.fabricspark.livysession import (
     LivySessionConnectionWrapper,
     LivySessionManager,
     get_lakehouse_properties,
 )
 from dbt.adapters.fabricspark.relation import FabricSparkRelation
+from dbt.adapters.fabricspark.retry_policy import configure_retry_policy, retry_metrics
+from dbt.adapters.fabricspark.token_cache import token_cache_stats
 from dbt.adapters.sql import SQLConnectionManager
 
 logger = AdapterLogger("Microsoft Fabric-Spark")
@@ -49,6 +69,35 @@ for logger_name in [
 
 NUMBERS = DECIMALS + (int, float)
 
+# dbt commands that run SQL. The others (parse, compile, ls, deps, docs
+# serve, ...) never use a session, so pre-warming one would only waste it.
+_SQL_COMMANDS = frozenset(
+    {
+        "build",
+        "clone",
+        "debug",
+        "freshness",
+        "generate",
+        "retry",
+        "run",
+        "run-operation",
+        "seed",
+        "show",
+        "snapshot",
+        "test",
+    }
+)
+
+
+def _invocation_runs_sql() -> bool:
+    """True unless the current dbt invocation is known not to run SQL."""
+    try:
+        from dbt.flags import get_flags
+    except ImportError:  # dbt-core is not installed; assume it does
+        return True
+    which = getattr(get_flags(), "WHICH", None)
+    return which is None or which in _SQL_COMMANDS
+
 
 class FabricSparkConnectionMethod(StrEnum):
     LIVY = "livy"
@@ -79,6 +128,18 @@ class FabricSparkConnectionWrapper(ABC):
     def execute(self, sql: str, bindings: Optional[List[Any]] = None) -> None:
         pass
 
+    @abstractmethod
+    def execute_batch(self, statements: List[str]) -> List[dict]:
+        pass
+
+    @abstractmethod
+    def execute_code(self, code: str, kind: str = "pyspark") -> dict:
+        pass
+
+    @abstractmethod
+    def execute_parallel(self, statements: List[str], repls: int) -> int:
+        pass
+
     @property
     @abstractmethod
     def description(
@@ -95,6 +156,90 @@ class FabricSparkConnectionManager(SQLConnectionManager):
     connection_managers = {}
     spark_version = None
     mlv_prereq_error: Optional[str] = None
+    # Background session pre-warm started at adapter construction when
+    # ``prewarm_session`` is set; the first open() adopts the warmed backend.
+    _prewarm: Optional[Future] = None
+    _prewarm_lock = threading.Lock()
+
+    def __init__(self, profile: Any, mp_context: Any) -> None:
+        super().__init__(profile, mp_context)
+        # Every dbt thread submits and polls over the shared transport, so the
+        # per-origin pool must hold at least one keep-alive connection per thread.
+        threads = getattr(profile, "threads", None) or 1
+        _http_utils.configure_transport(max(threads, _http_utils.DEFAULT_POOL_MAXSIZE))
+        configure_hc_threads(threads)
+        # Non-fetching statements held back per dbt thread when
+        # ``batch_statements`` is on; see execute() / flush_statements().
+        self._pending_statements: dict = {}
+        # Exception already being handled on each thread when its connection
+        # was last named; see finish_statements().
+        self._scope_errors: dict = {}
+        # Columns per relation for this run; see column_cache.py and
+        # invalidate_metadata().
+        self.column_cache = column_cache.ColumnCache()
+        creds = getattr(profile, "credentials", None)
+        if (
+            getattr(creds, "prewarm_session", False)
+            and creds.method == FabricSparkConnectionMethod.LIVY
+            and _invocation_runs_sql()
+        ):
+            self.start_prewarm(creds)
+
+    @staticmethod
+    def _new_backend(creds: Any) -> LivyBackend:
+        use_hc = creds.high_concurrency and not creds.is_local_mode
+        return HighConcurrencySessionManager() if use_hc else LivySessionManager()
+
+    @classmethod
+    def start_prewarm(cls, creds: Any) -> None:
+        """Start creating the Livy session / HC REPL on the Livy engine.
+
+        The adapter is constructed before dbt parses the project, so the Spark
+        cold start overlaps with parsing and compilation instead of following it.
+        """
+        with cls._prewarm_lock:
+            if cls._prewarm is not None:
+                return
+            configure_retry_policy(creds)
+            _http_utils.configure_transport(None, creds.http_max_rps)
+            logger.debug("Pre-warming Livy session in the background")
+            cls._prewarm = get_engine().submit(cls._prewarm_backend(creds))
+
+    @classmethod
+    async def _prewarm_backend(cls, creds: Any) -> LivyBackend:
+        engine = get_engine()
+        start = time.monotonic()
+        if not creds.is_local_mode:
+            # Cached process-wide, so open() does not repeat the lookup.
+            await engine.call(get_lakehouse_properties, creds)
+        backend = cls._new_backend(creds)
+        await backend.connect_async(creds)
+        logger.debug(f"Livy session pre-warm finished in {time.monotonic() - start:.1f}s")
+        return backend
+
+    @classmethod
+    def _adopt_prewarmed(cls, thread_id: Any) -> None:
+        """Wait for a pending pre-warm and hand its backend to ``thread_id``.
+
+        Threads that arrive while it is still running wait too, since their
+        own acquire would land on the same cold Spark application anyway. A
+        failed pre-warm is logged and ``open()`` connects normally.
+        """
+        with cls._prewarm_lock:
+            future = cls._prewarm
+        if future is None:
+            return
+        try:
+            backend: Optional[LivyBackend] = future.result()
+        except Exception as ex:
+            logger.warning(f"Livy session pre-warm failed, connecting normally: {ex}")
+            backend = None
+        with cls._prewarm_lock:
+            if cls._prewarm is not future:
+                return
+            cls._prewarm = None
+            if backend is not None and thread_id not in cls.connection_managers:
+                cls.connection_managers[thread_id] = backend
 
     @contextmanager
     def exception_handler(self, sql: str) -> Generator[None, None, None]:
@@ -112,6 +257,29 @@ class FabricSparkConnectionManager(SQLConnectionManager):
     def cancel(self, connection: Connection) -> None:
         connection.handle.cancel()
 
+    def cancel_open(self) -> List[str]:
+        """Cancel other threads' in-flight statements in one concurrent fan-out.
+
+        dbt calls this on Ctrl-C / shutdown. The base implementation cancels
+        connection by connection; here every tracked statement across all open
+        connections is cancelled at once so shutdown takes one round trip.
+        """
+        names = []
+        trackers = []
+        this_connection = self.get_if_exists()
+        with self.lock:
+            for connection in self.thread_connections.values():
+                if connection is this_connection:
+                    continue
+                if connection.handle is not None and connection.state == ConnectionState.OPEN:
+                    tracker = getattr(connection.handle, "in_flight", None)
+                    if tracker is not None:
+                        trackers.append(tracker)
+                if connection.name is not None:
+                    names.append(connection.name)
+        cancel_in_flight(trackers)
+        return names
+
     @classmethod
     def get_response(cls, cursor: Any) -> AdapterResponse:
         # https://github.com/dbt-labs/dbt-spark/issues/142
@@ -152,6 +320,9 @@ class FabricSparkConnectionManager(SQLConnectionManager):
         exc = None
         handle: FabricSparkConnectionWrapper = None
 
+        configure_retry_policy(creds)
+        _http_utils.configure_transport(None, creds.http_max_rps)
+
         # Fetch lakehouse properties and detect schema support (Fabric mode only).
         if not creds.is_local_mode:
             lakehouse_props = get_lakehouse_properties(creds)
@@ -170,9 +341,9 @@ class FabricSparkConnectionManager(SQLConnectionManager):
                     thread_id = cls.get_thread_identifier()
                     use_hc = creds.high_concurrency and not creds.is_local_mode
                     if thread_id not in cls.connection_managers:
-                        cls.connection_managers[thread_id] = (
-                            HighConcurrencySessionManager() if use_hc else LivySessionManager()
-                        )
+                        cls._adopt_prewarmed(thread_id)
+                    if thread_id not in cls.connection_managers:
+                        cls.connection_managers[thread_id] = cls._new_backend(creds)
                     raw_handle = cls.connection_managers[thread_id].connect(creds)
                     handle = (
                         HighConcurrencyConnectionWrapper(raw_handle)
@@ -231,9 +402,159 @@ class FabricSparkConnectionManager(SQLConnectionManager):
 
         return connection
 
-    @classmethod
+    def set_connection_name(self, name: Optional[str] = None) -> Connection:
+        self._scope_errors[self.get_thread_identifier()] = sys.exc_info()[1]
+        return super().set_connection_name(name)
+
     def release(self) -> None:
-        pass
+        # Statements still held back for batching must not outlive the node.
+        try:
+            self.finish_statements()
+        finally:
+            self._scope_errors.pop(self.get_thread_identifier(), None)
+
+    def execute(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        fetch: bool = False,
+        limit: Optional[int] = None,
+    ) -> Tuple[AdapterResponse, "agate.Table"]:
+        """Run ``sql``; with ``batch_statements``, hold DDL, settings and grants back.
+
+        Held-back statements (see :func:`batch.holdable`) answer
+        ``OK (batched)`` and are sent together, in order, as one Livy
+        statement right before the next statement that is not held, or when
+        the node finishes (``post_model_hook`` / ``release``). A node that
+        fails drops them instead. Statements that write rows, such as the
+        ``main`` statement of a materialization, always run at once.
+        """
+        if fetch or not self.profile.credentials.batch_statements or not batch.holdable(sql):
+            return super().execute(sql, auto_begin, fetch, limit)
+        from dbt_common.clients.agate_helper import empty_table
+
+        sql = self._add_query_comment(sql)
+        self._pending_statements.setdefault(self.get_thread_identifier(), []).append(sql)
+        # Invalidate now: the node may read the relation before the batch is sent.
+        self.invalidate_metadata(sql)
+        return AdapterResponse(_message="OK (batched)"), empty_table()
+
+    def invalidate_metadata(self, sql: str) -> None:
+        """Drop cached columns and listings of the relations DDL in ``sql`` targets.
+
+        Every statement this manager runs or holds back passes through here
+        once, whichever of execute / add_query / execute_batch /
+        execute_code / execute_parallel sent it.
+        """
+        targets = list(column_cache.ddl_targets(sql))
+        if not targets:
+            return
+        cache = metadata_cache.get_cache(self.profile.credentials)
+        for name in targets:
+            self.column_cache.invalidate(name)
+            if cache is not None:
+                cache.invalidate_relations(name)
+
+    def flush_statements(self) -> None:
+        """Send this thread's held-back statements, if any, as one batch."""
+        if self._pending_statements.get(self.get_thread_identifier()):
+            self.execute_batch([])
+
+    def finish_statements(self) -> None:
+        """Flush this thread's held-back statements, or drop them if the node failed.
+
+        Called from ``finally`` blocks (``post_model_hook``, ``release``). The
+        node failed if an exception other than the one already being handled
+        when its connection was named is propagating; a node run from inside
+        an enclosing ``except`` block still succeeds. The rest of a failed
+        node's statements must not run, nor raise from connection cleanup.
+        """
+        thread_id = self.get_thread_identifier()
+        error = sys.exc_info()[1]
+        if error is None or error is self._scope_errors.get(thread_id):
+            self.flush_statements()
+            return
+        pending = self._pending_statements.pop(thread_id, None)
+        if pending:
+            logger.debug(f"Dropped {len(pending)} held-back statement(s) of a failed node")
+
+    def execute_batch(self, statements: Sequence[str]) -> List[AdapterResponse]:
+        """Run ``statements`` in order as one Livy statement; one response per statement.
+
+        Statements held back by ``batch_statements`` go first, in the same
+        round trip. Execution stops at the first failing statement, whose
+        position and SQL are named in the raised error.
+        """
+        pending = self._pending_statements.pop(self.get_thread_identifier(), None) or []
+        # Held-back statements were invalidated when they were held.
+        fresh = list(statements)
+        statements = [*pending, *fresh]
+        if not statements:
+            return []
+        connection = self.get_thread_connection()
+        fire_event(ConnectionUsed(conn_type=self.TYPE, conn_name=connection.name))
+        try:
+            with self.exception_handler(";\n".join(statements)):
+                for sql in statements:
+                    fire_event(SQLQuery(conn_name=connection.name, sql=sql))
+                pre = time.time()
+                results = connection.handle.cursor().execute_batch(statements)
+                fire_event(
+                    SQLQueryStatus(
+                        status=f"OK ({len(results)} statements in one batch)",
+                        elapsed=round(time.time() - pre, 2),
+                    )
+                )
+        finally:
+            for sql in fresh:
+                self.invalidate_metadata(sql)
+        return [AdapterResponse(_message="OK") for _ in results]
+
+    def execute_code(self, code: str, description: str, kind: str = "pyspark") -> dict:
+        """Run ``code`` as one Livy statement of ``kind``; return the statement body.
+
+        ``description`` stands in for the code in query events and error logs.
+        Statements held back by ``batch_statements`` are sent first.
+        """
+        self.flush_statements()
+        connection = self.get_thread_connection()
+        fire_event(ConnectionUsed(conn_type=self.TYPE, conn_name=connection.name))
+        try:
+            with self.exception_handler(description):
+                fire_event(SQLQuery(conn_name=connection.name, sql=description))
+                pre = time.time()
+                result = connection.handle.cursor().execute_code(code, kind)
+                fire_event(SQLQueryStatus(status="OK", elapsed=round(time.time() - pre, 2)))
+        finally:
+            # Non-SQL code is opaque; its description names what it touches.
+            self.invalidate_metadata(code if kind == "sql" else description)
+        return result
+
+    def execute_parallel(self, statements: Sequence[str], description: str, repls: int) -> int:
+        """Run independent ``statements`` concurrently on up to ``repls`` REPLs.
+
+        Only high-concurrency sessions run them concurrently; a singleton
+        session runs them in order. Returns the number of REPLs used.
+        Statements held back by ``batch_statements`` are sent first.
+        """
+        self.flush_statements()
+        connection = self.get_thread_connection()
+        fire_event(ConnectionUsed(conn_type=self.TYPE, conn_name=connection.name))
+        try:
+            with self.exception_handler(description):
+                fire_event(SQLQuery(conn_name=connection.name, sql=description))
+                pre = time.time()
+                used = connection.handle.cursor().execute_parallel(list(statements), repls)
+                fire_event(
+                    SQLQueryStatus(
+                        status=f"OK ({len(statements)} statements on {used} REPLs)",
+                        elapsed=round(time.time() - pre, 2),
+                    )
+                )
+        finally:
+            for sql in statements:
+                self.invalidate_metadata(sql)
+        return used
 
     def cleanup_all(self) -> None:
         """Clean up connection manager references only.
@@ -259,6 +580,35 @@ class FabricSparkConnectionManager(SQLConnectionManager):
             except Exception as ex:
                 logger.debug(f"connection manager disconnect raised: {ex}")
         self.connection_managers.clear()
+        with self._prewarm_lock:
+            prewarm, pending = type(self)._prewarm, None
+            if prewarm is not None and prewarm.done():
+                type(self)._prewarm = None
+                pending = prewarm
+        if pending is not None and pending.exception() is None:
+            # Warmed but never adopted (e.g. `dbt parse`): release it like any other backend.
+            try:
+                pending.result().disconnect()
+            except Exception as ex:
+                logger.debug(f"pre-warmed backend disconnect raised: {ex}")
+        for tag, counts in shard_occupancy().items():
+            logger.debug(f"HC REPL occupancy {tag}: peak {counts['peak']} REPL(s)")
+        for origin, counters in _http_utils.transport_stats().items():
+            logger.debug(
+                f"HTTP transport {origin}: {counters['requests']} requests, "
+                f"{counters['opened']} connections opened, {counters['reused']} reused"
+            )
+        for key, counters in _http_utils.throttle_stats().items():
+            if counters["throttled"]:
+                logger.debug(f"HTTP throttling {key}: {counters}")
+        for operation, counters in retry_metrics().items():
+            logger.debug(f"Retry metrics {operation}: {counters}")
+        cache = token_cache_stats()
+        if cache["hits"]:
+            logger.debug(
+                f"Token cache: {cache['hits']} hits, {cache['misses']} misses, "
+                f"~{cache['saved_seconds']:.2f}s of token acquisition saved"
+            )
 
     @classmethod
     def close(cls, connection) -> None:
@@ -298,12 +648,32 @@ class FabricSparkConnectionManager(SQLConnectionManager):
             logger.debug(f"Using pre-populated Spark version: {env_version}")
             return
 
+        # A session broker remembers the probe result across dbt processes.
+        creds = connection.credentials
+        meta_key = f"spark_version:{creds.workspaceid}:{creds.lakehouseid}"
+        cached = session_broker.broker_call(creds, "meta_get", meta_key)
+        if cached:
+            FabricSparkConnectionManager.spark_version = cached
+            os.environ["DBT_SPARK_VERSION"] = cached
+            logger.debug(f"Using Spark version {cached} from the session broker")
+            return
+        disk = metadata_cache.get_cache(creds)
+        cached = disk.get(meta_key) if disk is not None else None
+        if cached:
+            FabricSparkConnectionManager.spark_version = cached
+            os.environ["DBT_SPARK_VERSION"] = cached
+            logger.debug(f"Using Spark version {cached} from the metadata cache")
+            return
+
         try:
             sql = "SELECT split(version(), ' ')[0] as version"
             cursor = connection.handle.cursor()
             cursor.execute(sql)
             res = cursor.fetchall()
             FabricSparkConnectionManager.spark_version = res[0][0]
+            session_broker.broker_call(creds, "meta_put", meta_key, res[0][0])
+            if disk is not None:
+                disk.put(meta_key, res[0][0])
 
         except Exception as ex:
             # we couldn't get the spark warehouse version, default to version 2
@@ -448,6 +818,7 @@ class FabricSparkConnectionManager(SQLConnectionManager):
                     attempt=attempt + 1,
                 )
 
+        self.flush_statements()
         connection = self.get_thread_connection()
         if auto_begin and connection.transaction_open is False:
             self.begin()
@@ -475,6 +846,8 @@ class FabricSparkConnectionManager(SQLConnectionManager):
                 )
             except Exception as ex:
                 query_exception = ex
+            finally:
+                self.invalidate_metadata(sql)
 
             elapsed_time = time.time() - pre
 
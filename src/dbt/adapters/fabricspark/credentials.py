@@ -52,6 +52,9 @@ class FabricSparkCredentials(Credentials):
     # when authentication='token_credential'.
     credential_class: Optional[str] = None
     credential_kwargs: Dict[str, Any] = field(default_factory=dict)
+    # Optional JSON file (0600) where CLI/SPN/token_credential tokens are
+    # cached across dbt invocations; unset disables the on-disk cache.
+    token_cache_file: Optional[str] = None
     connect_retries: int = 1
     connect_timeout: int = 10
     create_shortcuts: Optional[bool] = False
@@ -89,6 +92,21 @@ class FabricSparkCredentials(Credentials):
     # FIFO inside the default Spark scheduling pool.
     # Has no effect in local mode (livy_mode=local).
     high_concurrency: bool = True
+    # Lease HC REPLs from a process-wide pool of ``threads`` REPLs that are
+    # acquired concurrently once the first one is up (see HighConcurrencyReplPool).
+    hc_repl_pool: bool = False
+    # Max REPLs per underlying Livy session. When set, threads are spread over
+    # ceil(threads / hc_repls_per_session) sessionTags ("<tag>-shard-k");
+    # 0 keeps every REPL on a single tag.
+    hc_repls_per_session: int = 0
+    # Hand sessions, REPL leases, tokens and lakehouse metadata to short-lived
+    # dbt processes from a local broker daemon over a Unix socket.
+    session_broker: bool = False
+    session_broker_socket: Optional[str] = None  # default ~/.dbt/fabricspark-broker/broker.sock
+    session_broker_idle_timeout: int = 1800  # seconds without requests before the broker exits
+    # Start session creation / HC acquire in the background as soon as the
+    # adapter is constructed, overlapping the Spark cold start with parsing.
+    prewarm_session: bool = False
 
     # Livy session stability settings
     http_timeout: int = 120  # seconds for each HTTP request to Fabric API
@@ -98,6 +116,45 @@ class FabricSparkCredentials(Credentials):
     )
     poll_wait: int = 10  # seconds between polls for session start
     poll_statement_wait: float = 0.5  # seconds between polls for statement result
+    # Optional JSON file (0600) recording submitted statements until their
+    # result is read, so a re-invoked run reattaches to one still running.
+    statement_registry_file: Optional[str] = None
+    # Hold back statements whose result is not fetched and send them, in order,
+    # as one Livy statement before the next fetching query or at node end.
+    batch_statements: bool = False
+    # Load seeds of at least ``seed_bulk_min_rows`` rows by staging them in the
+    # Spark driver and inserting them with one INSERT ... SELECT (seed_loader.py).
+    seed_bulk_load: bool = True
+    seed_bulk_min_rows: int = 1000
+    # With high_concurrency, run the INSERT ... VALUES batches of seeds that are
+    # not bulk loaded on this many REPLs at once, into a staging table that is
+    # then inserted into the seed in one statement (seed_loader.py). 0/1 = off.
+    seed_parallel_repls: int = 0
+    # Describe all relations of a schema for ``docs generate`` in one pyspark
+    # statement instead of one ``describe table extended`` each (catalog.py).
+    catalog_bulk_describe: bool = True
+    # Optional JSON file keeping catalog describe rows with each relation's
+    # Delta lastModified, so the next docs generate only describes changed ones.
+    catalog_cache_file: Optional[str] = None
+    # Skip reloading a seed whose data, column types and config hash matches the
+    # one recorded in the table's TBLPROPERTIES by the previous load. Opt-in:
+    # changes to the table that do not touch the CSV go unnoticed.
+    seed_skip_unchanged: bool = False
+    # Keep get_columns_in_relation results for the run, dropping a relation's
+    # entry whenever a DDL statement targets it (column_cache.py).
+    cache_columns: bool = True
+    # Optional SQLite file keeping schema listings, lakehouse properties, the
+    # Spark version and lakehouse ids between invocations (metadata_cache.py).
+    metadata_cache_file: Optional[str] = None
+    metadata_cache_ttl: int = 3600
+
+    # Shared retry policy for Livy and Fabric REST calls (see retry_policy.py)
+    retry_base_delay: float = 1.0  # seconds; lower bound of the jittered backoff
+    retry_max_delay: float = 30.0  # seconds; upper bound of a single backoff
+    retry_budget: int = 600  # max seconds spent backing off per operation; 0 = unlimited
+    circuit_breaker_threshold: int = 10  # consecutive endpoint failures to open; 0 = disabled
+    circuit_breaker_reset: int = 30  # seconds an open circuit waits before the next probe
+    http_max_rps: float = 50.0  # steady-state request ceiling per endpoint+workspace
 
     def __repr__(self) -> str:
         """Mask sensitive fields in repr to prevent credential leakage in logs/tracebacks."""
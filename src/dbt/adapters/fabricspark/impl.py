@@ -31,9 +31,18 @@ from dbt_common.utils import AttrDict, executor
 from dbt.adapters.base import AdapterConfig, BaseRelation, available
 from dbt.adapters.base.impl import ConstraintSupport, catch_as_completed
 from dbt.adapters.base.relation import InformationSchema
+from dbt.adapters.contracts.connection import AdapterResponse
 from dbt.adapters.contracts.relation import RelationConfig, RelationType
 from dbt.adapters.events.logging import AdapterLogger
-from dbt.adapters.fabricspark import FabricSparkColumn, FabricSparkConnectionManager, mlv_api
+from dbt.adapters.fabricspark import (
+    FabricSparkColumn,
+    FabricSparkConnectionManager,
+    catalog,
+    column_cache,
+    metadata_cache,
+    mlv_api,
+    seed_loader,
+)
 from dbt.adapters.fabricspark.relation import FabricSparkRelation
 from dbt.adapters.sql import SQLAdapter
 
@@ -193,6 +202,150 @@ class FabricSparkAdapter(SQLAdapter):
         except Exception:
             return False
 
+    @available
+    def execute_batch(self, statements: List[str]) -> List[AdapterResponse]:
+        """Run ``statements`` in order as a single Livy statement.
+
+        Exposed to macros as ``adapter.execute_batch([...])`` for statements
+        whose results are not needed (DDL, ``SET``, grants, comments). Returns
+        one response per statement; the first failing statement raises.
+        """
+        return self.connections.execute_batch(statements)
+
+    @available
+    def seed_column_types(
+        self, agate_table: "agate.Table", column_override: Dict[str, str]
+    ) -> List[str]:
+        """Return the SQL type of every seed column, inferring each column once.
+
+        ``column_types`` overrides win. Inference aggregates the whole column
+        for numbers, so it must not run per cell of every insert batch.
+        """
+        return [
+            column_override[name] if name in column_override else self.convert_type(agate_table, i)
+            for i, name in enumerate(agate_table.column_names)
+        ]
+
+    @available
+    def use_bulk_seed_load(self, agate_table: "agate.Table") -> bool:
+        """Whether a seed is large enough to load with :meth:`bulk_load_seed`."""
+        creds = self.config.credentials
+        return bool(creds.seed_bulk_load) and len(agate_table.rows) >= creds.seed_bulk_min_rows
+
+    @available
+    def bulk_load_seed(
+        self, relation: BaseRelation, agate_table: "agate.Table", column_types: List[str]
+    ) -> str:
+        """Load a seed through staged ``pyspark`` statements instead of VALUES batches.
+
+        Returns the final ``insert ... select`` statement for the compiled output.
+        """
+        return seed_loader.load(
+            self.connections, relation.render(), agate_table.rows, column_types
+        )
+
+    @available
+    def use_parallel_seed_load(self, agate_table: "agate.Table") -> bool:
+        """Whether a seed's VALUES batches should run with :meth:`parallel_load_seed`."""
+        creds = self.config.credentials
+        return (
+            (creds.seed_parallel_repls or 0) > 1
+            and creds.high_concurrency
+            and not creds.is_local_mode
+            and len(agate_table.rows) > seed_loader.values_batch_size(len(agate_table.columns))
+        )
+
+    @available
+    def parallel_load_seed(
+        self, relation: BaseRelation, agate_table: "agate.Table", column_types: List[str]
+    ) -> str:
+        """Run a seed's VALUES batches on ``seed_parallel_repls`` REPLs at once.
+
+        Batches go to a staging table next to the seed; returns the single
+        ``insert ... select`` that moves them into the seed table.
+        """
+        stage = relation.incorporate(path={"identifier": f"{relation.identifier}__dbt_seed_stage"})
+        return seed_loader.load_parallel(
+            self.connections,
+            relation.render(),
+            stage.render(),
+            agate_table.rows,
+            column_types,
+            self.config.credentials.seed_parallel_repls,
+        )
+
+    @available
+    def seed_content_hash(
+        self, model: Dict[str, Any], agate_table: "agate.Table", column_types: List[str]
+    ) -> Optional[str]:
+        """Return the hash a seed load records, or None with ``seed_skip_unchanged`` off.
+
+        Uses the CSV file checksum dbt already computed when it is a content
+        hash (dbt falls back to the file path for large seeds) and otherwise
+        hashes the loaded cells. Seeds with hooks get None too: a hook may
+        change the rows, so the CSV no longer describes the table.
+        """
+        if not self.config.credentials.seed_skip_unchanged:
+            return None
+        config = model.get("config") or {}
+        if config.get("pre-hook") or config.get("post-hook"):
+            return None
+        checksum = model.get("checksum") or {}
+        if checksum.get("name") == "sha256" and checksum.get("checksum"):
+            data_digest = "file:" + checksum["checksum"]
+        else:
+            data_digest = "rows:" + seed_loader.rows_digest(agate_table.rows)
+        return seed_loader.content_hash(
+            data_digest, agate_table.column_names, column_types, config
+        )
+
+    @available
+    def seed_is_unchanged(
+        self, relation: Optional[BaseRelation], seed_hash: Optional[str]
+    ) -> bool:
+        """Whether ``relation`` was last loaded from a seed with ``seed_hash``.
+
+        Reads the table properties from the cached relation metadata; only a
+        relation cached without metadata costs a ``show tblproperties``.
+        """
+        if relation is None or not seed_hash:
+            return False
+        information = getattr(relation, "information", None)
+        if not information:
+            sql = f"show tblproperties {relation.render()} ('{seed_loader.HASH_PROPERTY}')"
+            try:
+                _, result = self.execute(sql, auto_begin=False, fetch=True)
+            except DbtRuntimeError as e:
+                logger.debug(f"Error while reading the seed hash of {relation}: {e.msg}")
+                return False
+            information = "\n".join(f"{row[0]}={row[1]}" for row in result)
+        return seed_loader.stored_hash(information) == seed_hash
+
+    @available
+    def record_seed_hash(self, relation: BaseRelation, seed_hash: Optional[str]) -> None:
+        """Store ``seed_hash`` in the table properties of a freshly loaded seed.
+
+        Without a hash (a seed with hooks) any hash left by an earlier load is
+        removed, so it cannot make a later run skip the seed.
+        """
+        if seed_hash:
+            self.execute(
+                f"alter table {relation.render()} set tblproperties "
+                f"('{seed_loader.HASH_PROPERTY}' = '{seed_hash}')",
+                auto_begin=False,
+            )
+        elif self.config.credentials.seed_skip_unchanged:
+            self.execute(
+                f"alter table {relation.render()} unset tblproperties if exists "
+                f"('{seed_loader.HASH_PROPERTY}')",
+                auto_begin=False,
+            )
+
+    def post_model_hook(self, config: Any, context: Any) -> None:
+        # Send anything ``batch_statements`` is still holding for this node,
+        # unless the node failed.
+        self.connections.finish_statements()
+
     @available
     def mlv_run_on_demand(self, lakehouse_id: Optional[str] = None) -> Dict[str, Any]:
         """Trigger an on-demand MLV lineage refresh via the Fabric REST API.
@@ -301,10 +454,12 @@ class FabricSparkAdapter(SQLAdapter):
 
     @classmethod
     def convert_number_type(cls, agate_table: "agate.Table", col_idx: int) -> str:
-        import agate
-
-        decimals = agate_table.aggregate(agate.MaxPrecision(col_idx))
-        return "double" if decimals else "bigint"
+        # Same answer as agate.MaxPrecision (does any value have a fractional
+        # part?), but stops at the first such value instead of normalizing all.
+        for value in agate_table.columns[col_idx].values_without_nulls():
+            if value.is_finite() and value != value.to_integral_value():
+                return "double"
+        return "bigint"
 
     @classmethod
     def convert_integer_type(cls, agate_table: "agate.Table", col_idx: int) -> str:
@@ -376,6 +531,41 @@ class FabricSparkAdapter(SQLAdapter):
 
         return _schema, name, information
 
+    def _relation_information_describer(
+        self, row_list: "agate.Table"
+    ) -> Callable[["agate.Row"], RelationInfo]:
+        """Describe every relation of a SHOW TABLES listing in one bulk statement.
+
+        Returns a ``relation_info_func`` serving the prefetched information;
+        if the bulk statement fails, relations are described one by one by
+        :meth:`_get_relation_information_using_describe`.
+        """
+        tables = [f"{row[0]}.{row[1]}" for row in row_list if len(row) == 3 and not row[2]]
+        try:
+            outcomes = catalog.describe(self.connections, tables) if tables else []
+        except DbtRuntimeError as e:
+            logger.debug(f"Bulk describe of {len(tables)} relations failed: {e.msg}")
+            return self._get_relation_information_using_describe
+        information: Dict[str, str] = {}
+        for table_name, outcome in zip(tables, outcomes):
+            if "error" in outcome:
+                logger.debug(
+                    f"Error while retrieving information about {table_name}: {outcome['error']}"
+                )
+            information[table_name] = "".join(
+                f"{row['col_name']}: {row['data_type']}\n"
+                for row in outcome.get("rows", [])
+                if not row["col_name"].startswith("#")
+            )
+
+        def relation_info(row: "agate.Row") -> "FabricSparkAdapter.RelationInfo":
+            table_name = f"{row[0]}.{row[1]}" if len(row) == 3 else None
+            if table_name not in information:
+                return self._get_relation_information_using_describe(row)
+            return row[0], row[1], information[table_name]
+
+        return relation_info
+
     def _build_spark_relation_list(
         self,
         row_list: "agate.Table",
@@ -425,6 +615,7 @@ class FabricSparkAdapter(SQLAdapter):
                 and not relation.identifier.startswith(active_prefix)
             ):
                 continue
+            self._register_listed(relation)
             relations.append(relation)
 
         return relations
@@ -484,6 +675,55 @@ class FabricSparkAdapter(SQLAdapter):
         ):
             schema_relation = schema_relation.include(database=True)
 
+        creds = self.config.credentials
+        cache = metadata_cache.get_cache(creds)
+        if cache is None:
+            return self._list_relations(schema_relation)
+        key = metadata_cache.relations_key(
+            creds, schema_relation.without_identifier(), self.Relation._identifier_prefix or ""
+        )
+        stored = cache.get(key)
+        if stored:
+            logger.debug(f"Relations of {schema_relation} served from the metadata cache")
+            return [self._relation_from_metadata(entry) for entry in stored]
+        relations = self._list_relations(schema_relation)
+        # An empty listing may stand for an error; list again next time.
+        if relations:
+            cache.put(key, [self._relation_to_metadata(r) for r in relations])
+        return relations
+
+    def _relation_to_metadata(self, relation: BaseRelation) -> Dict[str, Any]:
+        return {
+            "database": relation.database,
+            "schema": relation.schema,
+            "identifier": relation.identifier,
+            "type": str(relation.type) if relation.type else None,
+            "information": relation.information,
+            "is_delta": relation.is_delta,
+            "workspace": getattr(relation, "workspace", None),
+        }
+
+    def _relation_from_metadata(self, entry: Dict[str, Any]) -> BaseRelation:
+        # Not registered with the column cache: the listing may be up to
+        # ``metadata_cache_ttl`` old, and columns changed outside this process
+        # since then would build merge/insert SQL against the wrong list.
+        return self.Relation.create(
+            database=entry["database"],
+            schema=entry["schema"],
+            identifier=entry["identifier"],
+            type=RelationType(entry["type"]) if entry["type"] else None,
+            information=entry["information"],
+            is_delta=entry["is_delta"],
+            workspace=entry["workspace"],
+            _skip_prefix=True,
+        )
+
+    def _register_listed(self, relation: BaseRelation) -> None:
+        # Let get_columns_in_relation parse the schema out of the listing.
+        if self.config.credentials.cache_columns and " |-- " in (relation.information or ""):
+            self.connections.column_cache.add_listed(relation)
+
+    def _list_relations(self, schema_relation: BaseRelation) -> List[BaseRelation]:
         # In no_schema mode, use a prefix-specific LIKE pattern so Spark only
         # returns tables belonging to that prefix.
         prefix = self.Relation._identifier_prefix
@@ -546,7 +786,7 @@ class FabricSparkAdapter(SQLAdapter):
                     )
                     return self._build_spark_relation_list(
                         row_list=show_table_rows,
-                        relation_info_func=self._get_relation_information_using_describe,
+                        relation_info_func=self._relation_information_describer(show_table_rows),
                         schema_relation=schema_relation,
                     )
                 except DbtRuntimeError as e:
@@ -577,13 +817,18 @@ class FabricSparkAdapter(SQLAdapter):
     ) -> List[FabricSparkColumn]:
         # Convert the Row to a dict
         dict_rows = [dict(zip(row._keys, row._values)) for row in raw_rows]
+        return self._parse_describe_rows(relation, dict_rows)
+
+    def _parse_describe_rows(
+        self, relation: BaseRelation, dict_rows: List[dict]
+    ) -> List[FabricSparkColumn]:
         # Find the separator between the rows and the metadata provided
         # by the DESCRIBE TABLE EXTENDED statement
         pos = self.find_table_information_separator(dict_rows)
 
         # Remove rows that start with a hash, they are comments
-        rows = [row for row in raw_rows[0:pos] if not row["col_name"].startswith("#")]
-        metadata = {col["col_name"]: col["data_type"] for col in raw_rows[pos + 1 :]}
+        rows = [row for row in dict_rows[0:pos] if not row["col_name"].startswith("#")]
+        metadata = {col["col_name"]: col["data_type"] for col in dict_rows[pos + 1 :]}
 
         raw_table_stats = metadata.get(KEY_TABLE_STATISTICS)
         table_stats = FabricSparkColumn.convert_table_stats(raw_table_stats)
@@ -612,6 +857,11 @@ class FabricSparkAdapter(SQLAdapter):
         return pos
 
     def get_columns_in_relation(self, relation: BaseRelation) -> List[FabricSparkColumn]:
+        use_cache = self.config.credentials.cache_columns
+        if use_cache:
+            cached = self.connections.column_cache.get(relation, self._columns_from_information)
+            if cached is not None:
+                return cached
         columns = []
         # Retry once on transient errors — Fabric Livy sessions can
         # occasionally return errors under concurrent load.
@@ -636,8 +886,25 @@ class FabricSparkAdapter(SQLAdapter):
                     _time.sleep(2)
                     continue
                 raise e
+        if use_cache and columns:
+            self.connections.column_cache.set(relation, columns)
         return columns
 
+    def _columns_from_information(
+        self, relation: BaseRelation
+    ) -> Optional[List[FabricSparkColumn]]:
+        """Columns from a listed relation's ``information``, typed as describe types them.
+
+        None when the information has no schema or a type needs a describe.
+        """
+        columns = self.parse_columns_from_information(relation)
+        for column in columns:
+            dtype = column_cache.describe_type(column.dtype)
+            if dtype is None:
+                return None
+            column.dtype = dtype
+        return columns or None
+
     def parse_columns_from_information(self, relation: BaseRelation) -> List[FabricSparkColumn]:
         if hasattr(relation, "information"):
             information = relation.information or ""
@@ -666,7 +933,7 @@ class FabricSparkAdapter(SQLAdapter):
             columns.append(column)
         return columns
 
-    def _get_columns_for_catalog(self, relation: BaseRelation) -> Iterable[Dict[str, Any]]:
+    def _catalog_table_name(self, relation: BaseRelation) -> str:
         ws = getattr(relation, "workspace", None)
         if ws:
             ws_q = f"`{ws}`"
@@ -678,22 +945,55 @@ class FabricSparkAdapter(SQLAdapter):
             if schema_q:
                 parts.append(schema_q)
             parts.append(relation.identifier)
-            table_name = ".".join(parts)
+            return ".".join(parts)
         elif relation.database:
-            table_name = f"{relation.database}.{relation.schema}.{relation.identifier}"
+            return f"{relation.database}.{relation.schema}.{relation.identifier}"
         else:
-            table_name = f"{relation.schema}.{relation.identifier}"
-        raw_rows = None
+            return f"{relation.schema}.{relation.identifier}"
+
+    def _describe_for_catalog(
+        self, relations: List[BaseRelation]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Describe ``relations`` server side in bulk; one outcome per relation.
+
+        With ``catalog_cache_file`` set, relations unchanged since the last
+        catalog are not described again (see :mod:`catalog`). Returns None
+        when ``catalog_bulk_describe`` is off or the bulk statement itself
+        fails, in which case relations are described one by one.
+        """
+        creds = self.config.credentials
+        if not relations or not creds.catalog_bulk_describe:
+            return None
+        tables = [self._catalog_table_name(r) for r in relations]
+        views = {name for name, r in zip(tables, relations) if r.is_view}
+        scope = tables[0].rsplit(".", 1)[0]
         try:
-            raw_rows = self.execute_macro(
-                DESCRIBE_TABLE_EXTENDED_MACRO_NAME, kwargs={"table_name": table_name}
+            return catalog.describe(
+                self.connections, tables, views, catalog.get_cache(creds), scope
             )
         except DbtRuntimeError as e:
-            logger.debug(f"Error while retrieving information about {table_name}: {e.msg}")
-            raise e
+            logger.debug(f"Bulk catalog describe failed, describing one by one: {e.msg}")
+            return None
+
+    def _get_columns_for_catalog(
+        self, relation: BaseRelation, described: Optional[List[dict]] = None
+    ) -> Iterable[Dict[str, Any]]:
+        """Catalog rows for ``relation``; ``described`` holds its describe rows if fetched."""
+        if described is not None:
+            columns = self._parse_describe_rows(relation, described)
+        else:
+            table_name = self._catalog_table_name(relation)
+            raw_rows = None
+            try:
+                raw_rows = self.execute_macro(
+                    DESCRIBE_TABLE_EXTENDED_MACRO_NAME, kwargs={"table_name": table_name}
+                )
+            except DbtRuntimeError as e:
+                logger.debug(f"Error while retrieving information about {table_name}: {e.msg}")
+                raise e
 
-        # Not using parsing to extract schema and other properties using describe table extended command
-        columns = self.parse_describe_extended(relation, raw_rows)
+            # Not using parsing to extract schema and other properties using describe table extended command
+            columns = self.parse_describe_extended(relation, raw_rows)
 
         # In no_schema mode, strip the identifier prefix from table_name
         # so dbt-core can match catalog rows to manifest nodes.  Manifest
@@ -776,7 +1076,7 @@ class FabricSparkAdapter(SQLAdapter):
         logger.debug(f"database name is {database}")
         schema = list(schemas)[0]
 
-        columns: List[Dict[str, Any]] = []
+        relations: List[BaseRelation] = []
         for relation in self.list_relations(database, schema):
             # Defensive guard against cache mis-attribution: drop any relation
             # whose database does not match the catalog cell we are iterating
@@ -795,8 +1095,23 @@ class FabricSparkAdapter(SQLAdapter):
                     f"database mismatch ({relation.database!r} != {database!r})"
                 )
                 continue
+            relations.append(relation)
+
+        # One server-side statement describes the whole schema; a relation
+        # that fails to describe is reported and left out of the catalog.
+        described = self._describe_for_catalog(relations)
+        columns: List[Dict[str, Any]] = []
+        for index, relation in enumerate(relations):
             logger.debug("Getting table schema for relation {}", str(relation))
-            columns_to_add = self._get_columns_for_catalog(relation)
+            if described is None:
+                columns_to_add = self._get_columns_for_catalog(relation)
+            elif "error" in described[index]:
+                logger.warning(
+                    f"Could not describe {relation} for the catalog: {described[index]['error']}"
+                )
+                continue
+            else:
+                columns_to_add = self._get_columns_for_catalog(relation, described[index]["rows"])
             columns.extend(columns_to_add)
         import agate
 
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+from dbt.adapters.fabricspark.livy_engine import get_engine
 
 
 class LivyBackend(ABC):
@@ -19,6 +20,10 @@ class LivyBackend(ABC):
       Livy session via a deterministic ``sessionTag``. Different REPLs run in
       parallel inside the same Spark application.
 
+    Both drive Livy through the asyncio engine in
+    :mod:`dbt.adapters.fabricspark.livy_engine`; :meth:`connect_async` is the
+    coroutine entry point and :meth:`connect` its blocking facade.
+
     Selection is driven by ``FabricSparkCredentials.high_concurrency``.
     ``open()`` in :mod:`connections` instantiates one backend per thread and
     calls :meth:`connect` to obtain a DB-API-shaped connection wrapper.
@@ -41,3 +46,11 @@ class LivyBackend(ABC):
         ``reuse_session`` is true; HC mode always deletes its per-thread HC
         session so the REPL slot frees up immediately.
         """
+
+    async def connect_async(self, credentials: FabricSparkCredentials) -> Any:
+        """Coroutine form of :meth:`connect`, awaited on the Livy engine loop.
+
+        The default runs the blocking :meth:`connect` on the engine executor;
+        backends whose acquire is natively async override this.
+        """
+        return await get_engine().call(self.connect, credentials)
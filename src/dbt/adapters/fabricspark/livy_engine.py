@@ -0,0 +1,410 @@
+"""asyncio engine for Livy REST traffic.
+
+A single event-loop thread drives HC acquire, statement submit, statement
+wait and cancel as coroutines. Blocking work (HTTP through the shared
+keep-alive transport, token lookups) is pushed onto a bounded executor sized
+to the transport's connection pool, throttle waits are awaited on the loop,
+and statement waits are awaited futures from the shared
+:class:`~dbt.adapters.fabricspark.statement_poller.StatementPoller`, so an
+in-flight statement costs no OS thread of its own.
+
+dbt-core drives adapters synchronously; cursors reach the engine through
+:meth:`LivyEngine.run`, which submits a coroutine to the loop and blocks the
+calling dbt thread until it completes. Code that is already async (or that
+fans out many statements from one thread) can ``await`` the coroutines
+directly on the loop via :meth:`LivyEngine.submit`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Coroutine, Dict, Iterable, Iterator, Optional, TypeVar
+
+import requests
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark import _http_utils, statement_poller, statement_registry
+from dbt.adapters.fabricspark._http_utils import parse_retry_after
+from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+from dbt.adapters.fabricspark.retry_policy import get_retry_policy
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+T = TypeVar("T")
+
+SUBMIT_MAX_RETRIES = 5
+
+_TRANSIENT_ERRORS = (
+    requests.exceptions.SSLError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def statement_response(body: dict) -> requests.Response:
+    """Wrap a statement body in a 200 response, as if it came from the submit POST."""
+    res = requests.Response()
+    res.status_code = 200
+    res._content = json.dumps(body).encode("utf-8")
+    return res
+
+
+class LivyEngine:
+    """Event-loop thread plus the coroutines that talk to Livy."""
+
+    def __init__(self, max_workers: int = _http_utils.DEFAULT_POOL_MAXSIZE) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="livy-io")
+
+    def configure(self, max_workers: int) -> None:
+        """Grow the executor to ``max_workers``; never shrinks it.
+
+        The old executor is shut down without waiting, so work already queued
+        on it still runs.
+        """
+        with self._lock:
+            if max_workers <= self.max_workers:
+                return
+            old = self._executor
+            self.max_workers = max_workers
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="livy-io"
+            )
+        old.shutdown(wait=False)
+
+    # ---- loop management -------------------------------------------------
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or not self._thread.is_alive():
+                ready = threading.Event()
+                loop = asyncio.new_event_loop()
+
+                def _serve() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=_serve, name="livy-engine", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future:
+        """Schedule ``coro`` on the engine loop and return a concurrent future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Sync facade: run ``coro`` on the engine loop and block for its result."""
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("LivyEngine.run() called from the engine loop; await instead")
+        return self.submit(coro).result()
+
+    # ---- primitives ------------------------------------------------------
+
+    async def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on the engine's bounded executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def http(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Issue ``method`` (``GET``/``POST``/``DELETE``) over the shared transport.
+
+        The throttle token is awaited on the loop first, so a throttled
+        endpoint does not park executor threads.
+        """
+        await _http_utils.acquire_token(url)
+        fn = getattr(_http_utils, method.lower())
+        return await self.call(_http_utils.send_with_token, fn, url, **kwargs)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+    # ---- statements ------------------------------------------------------
+
+    async def submit_statement(
+        self,
+        statements_url: str,
+        code: str,
+        credential: FabricSparkCredentials,
+        headers: Callable[[], Dict[str, str]],
+        label: str = "Livy",
+        on_not_found: Optional[Callable[[], None]] = None,
+        kind: str = "sql",
+        fingerprint: Optional[str] = None,
+    ) -> requests.Response:
+        """POST a statement, retrying transient network errors, 429 and 5xx.
+
+        A final 404 means the session or REPL is gone; ``on_not_found`` lets
+        the caller flag it for re-acquisition before the error is raised.
+        With a ``fingerprint`` the code is tagged with a per-submission
+        marker, and a POST that failed on the client side is only repeated
+        if the statements collection does not already hold the tagged
+        statement (Livy may have accepted the first POST).
+        """
+        marker = None
+        if fingerprint is not None and kind == "sql":
+            code, marker = statement_registry.tag(code, fingerprint)
+        data = {"code": code, "kind": kind}
+        logger.debug(f"Submitted: {data} {statements_url}")
+
+        retry = get_retry_policy().start(
+            f"{label} submit", statements_url, max_retries=SUBMIT_MAX_RETRIES - 1
+        )
+        while True:
+            try:
+                res = await self.http(
+                    "POST",
+                    statements_url,
+                    data=json.dumps(data),
+                    headers=await self.call(headers),
+                    timeout=credential.http_timeout,
+                )
+            except _TRANSIENT_ERRORS as exc:
+                retry.record_failure()
+                if retry.exhausted():
+                    raise DbtRuntimeError(
+                        f"{label} statement submit failed after {retry.attempts} retries: {exc}"
+                    )
+                wait = retry.next_delay()
+                logger.debug(
+                    f"{label} statement submit got transient network error "
+                    f"({type(exc).__name__}: {exc}), retrying in {wait:.1f}s "
+                    f"(retry {retry.attempts}/{retry.max_retries})"
+                )
+                await self.sleep(wait)
+                if marker is not None:
+                    accepted = await self._find_submitted(
+                        statements_url, marker, headers, credential
+                    )
+                    if accepted is not None:
+                        logger.debug(
+                            f"{label} statement submit was accepted as statement "
+                            f"{accepted['id']} despite the error; reattaching"
+                        )
+                        retry.record_success()
+                        return statement_response(accepted)
+                continue
+            if res.status_code == 429 or res.status_code >= 500:
+                if res.status_code >= 500:
+                    retry.record_failure()
+                if retry.exhausted():
+                    break
+                wait = retry.next_delay(parse_retry_after(res) if res.status_code == 429 else 0)
+                logger.debug(
+                    f"{label} statement submit got HTTP {res.status_code}, retrying in "
+                    f"{wait:.1f}s (retry {retry.attempts}/{retry.max_retries})"
+                )
+                await self.sleep(wait)
+                continue
+            retry.record_success()
+            break
+
+        if res.status_code >= 400:
+            if res.status_code == 404 and on_not_found is not None:
+                on_not_found()
+            raise DbtRuntimeError(
+                f"{label} statement submit failed (HTTP {res.status_code}): {res.text}"
+            )
+        body = res.json()
+        if "id" not in body:
+            raise DbtRuntimeError(
+                f"{label} statement submit returned unexpected response (missing 'id'): {body}"
+            )
+        return res
+
+    async def _find_submitted(
+        self,
+        statements_url: str,
+        marker: str,
+        headers: Callable[[], Dict[str, str]],
+        credential: FabricSparkCredentials,
+    ) -> Optional[dict]:
+        try:
+            res = await self.http(
+                "GET",
+                statements_url,
+                headers=await self.call(headers),
+                timeout=credential.http_timeout,
+            )
+            if res.status_code >= 400:
+                return None
+            return statement_registry.find_tagged(res.json().get("statements"), marker)
+        except (requests.exceptions.RequestException, ValueError, AttributeError) as exc:
+            logger.debug(f"Unable to list statements before resubmitting: {exc}")
+            return None
+
+    async def wait_statement(
+        self,
+        statements_url: str,
+        statement_id: Any,
+        credential: FabricSparkCredentials,
+        headers: Callable[[], Dict[str, str]],
+        label: str = "Livy",
+        on_not_found: Optional[Callable[[], None]] = None,
+    ) -> dict:
+        """Await the final statement body from the shared statement poller."""
+        future = statement_poller.get_poller().watch(
+            statements_url,
+            statement_id,
+            credential,
+            headers=headers,
+            label=label,
+            on_not_found=on_not_found,
+        )
+        return await asyncio.wrap_future(future)
+
+    async def execute_statement(
+        self,
+        statements_url: str,
+        code: str,
+        credential: FabricSparkCredentials,
+        headers: Callable[[], Dict[str, str]],
+        label: str = "Livy",
+        on_not_found: Optional[Callable[[], None]] = None,
+    ) -> dict:
+        res = await self.submit_statement(
+            statements_url, code, credential, headers, label, on_not_found
+        )
+        return await self.wait_statement(
+            statements_url, res.json()["id"], credential, headers, label, on_not_found
+        )
+
+    async def cancel_statement(
+        self,
+        statements_url: str,
+        statement_id: Any,
+        credential: FabricSparkCredentials,
+        headers: Callable[[], Dict[str, str]],
+    ) -> bool:
+        """POST ``.../statements/{id}/cancel``; best-effort, returns success."""
+        url = f"{statements_url}/{statement_id}/cancel"
+        try:
+            res = await self.http(
+                "POST", url, headers=await self.call(headers), timeout=credential.http_timeout
+            )
+        except requests.exceptions.RequestException as exc:
+            logger.debug(f"Cancel of statement {statement_id} failed: {exc}")
+            return False
+        if res.status_code >= 400:
+            logger.debug(
+                f"Cancel of statement {statement_id} returned HTTP {res.status_code}: {res.text}"
+            )
+            return False
+        return True
+
+
+class InFlightStatements:
+    """Statements submitted on one connection that have not finished yet.
+
+    Cursors register a statement while they wait for it via :meth:`track`.
+    If the wait times out (``statement_timeout``) or is interrupted (Ctrl-C),
+    the statement is cancelled on Livy so it stops burning capacity and
+    frees the REPL. :meth:`cancel_all` serves dbt's cancel path for a
+    connection that another thread is still waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._statements: Dict[tuple, tuple] = {}
+
+    @contextmanager
+    def track(
+        self,
+        statements_url: str,
+        statement_id: Any,
+        credential: FabricSparkCredentials,
+        headers: Callable[[], Dict[str, str]],
+    ) -> Iterator[None]:
+        with self.registered(statements_url, statement_id, credential, headers):
+            try:
+                yield
+            except (statement_poller.StatementTimeoutError, KeyboardInterrupt):
+                logger.debug(f"Cancelling statement {statement_id} after timeout or interrupt")
+                cancel_in_flight([self])
+                raise
+
+    @contextmanager
+    def registered(
+        self,
+        statements_url: str,
+        statement_id: Any,
+        credential: FabricSparkCredentials,
+        headers: Callable[[], Dict[str, str]],
+    ) -> Iterator[None]:
+        """Record a statement as in flight for :meth:`cancel_all`, without :meth:`track`'s
+        own cancellation (which blocks, so coroutines on the engine loop use this)."""
+        key = (statements_url, statement_id)
+        with self._lock:
+            self._statements[key] = (credential, headers)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._statements.pop(key, None)
+
+    def snapshot(self) -> list:
+        """``(statements_url, statement_id, credential, headers)`` per in-flight statement."""
+        with self._lock:
+            return [(*key, *value) for key, value in self._statements.items()]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._statements)
+
+    def cancel_all(self) -> int:
+        return cancel_in_flight([self])
+
+
+def cancel_in_flight(trackers: Iterable[InFlightStatements]) -> int:
+    """Cancel every statement in ``trackers`` concurrently; returns how many succeeded."""
+    statements = [statement for tracker in trackers for statement in tracker.snapshot()]
+    if not statements:
+        return 0
+    engine = get_engine()
+
+    async def _cancel_all() -> list:
+        return await asyncio.gather(
+            *(
+                engine.cancel_statement(url, statement_id, credential, headers)
+                for url, statement_id, credential, headers in statements
+            )
+        )
+
+    cancelled = sum(engine.run(_cancel_all()))
+    logger.debug(f"Cancelled {cancelled}/{len(statements)} in-flight Livy statement(s)")
+    return cancelled
+
+
+_engine_lock = threading.Lock()
+_engine: Optional[LivyEngine] = None
+
+
+def get_engine() -> LivyEngine:
+    """Return the process-wide :class:`LivyEngine`, creating it on first use.
+
+    The executor follows the shared HTTP transport's pool, which grows with
+    the configured ``threads``, so engine I/O never queues behind fewer
+    workers than there are pooled connections, even when the engine was
+    created before the profile was read.
+    """
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = LivyEngine(max_workers=_http_utils.transport_pool_maxsize())
+        else:
+            _engine.configure(_http_utils.transport_pool_maxsize())
+        return _engine
@@ -16,8 +16,12 @@ from azure.identity import AzureCliCredential, ClientSecretCredential
 from dbt_common.exceptions import DbtRuntimeError
 
 from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark import _http_utils, metadata_cache, session_broker
 from dbt.adapters.fabricspark._http_utils import parse_retry_after
 from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+from dbt.adapters.fabricspark.retry_policy import get_retry_policy
+from dbt.adapters.fabricspark.token_cache import get_or_acquire
+from dbt.adapters.fabricspark.token_manager import TokenManager
 
 logger = AdapterLogger("Microsoft Fabric-Spark")
 
@@ -27,11 +31,10 @@ DEFAULT_POLL_WAIT = 10
 DEFAULT_POLL_STATEMENT_WAIT = 5
 AZURE_CREDENTIAL_SCOPE = "https://analysis.windows.net/powerbi/api/.default"
 FABRIC_NOTEBOOK_CREDENTIAL_SCOPE = "pbi"
+# Most recently fetched token, kept for callers that predate the per-credential
+# token manager. New code should use get_access_token(credentials).
 accessToken: AccessToken = None
 
-# Global lock to ensure thread-safe token refresh
-_token_lock = threading.Lock()
-
 # Process-level cache for lakehouse properties (avoids repeated API calls per connection open)
 _lakehouse_props_cache: dict[tuple[str, str, str], dict] = {}
 _lakehouse_props_lock = threading.Lock()
@@ -144,9 +147,12 @@ def get_cli_access_token(credentials: FabricSparkCredentials) -> AccessToken:
     out : AccessToken
         Access token.
     """
-    _ = credentials
-    accessToken = AzureCliCredential().get_token(AZURE_CREDENTIAL_SCOPE)
-    return accessToken
+    return get_or_acquire(
+        credentials.token_cache_file,
+        credentials,
+        AZURE_CREDENTIAL_SCOPE,
+        lambda: AzureCliCredential().get_token(AZURE_CREDENTIAL_SCOPE),
+    )
 
 
 def get_sp_access_token(credentials: FabricSparkCredentials) -> AccessToken:
@@ -163,10 +169,14 @@ def get_sp_access_token(credentials: FabricSparkCredentials) -> AccessToken:
     out : AccessToken
         The access token.
     """
-    accessToken = ClientSecretCredential(
-        str(credentials.tenant_id), str(credentials.client_id), str(credentials.client_secret)
-    ).get_token(AZURE_CREDENTIAL_SCOPE)
-    return accessToken
+    return get_or_acquire(
+        credentials.token_cache_file,
+        credentials,
+        AZURE_CREDENTIAL_SCOPE,
+        lambda: ClientSecretCredential(
+            str(credentials.tenant_id), str(credentials.client_id), str(credentials.client_secret)
+        ).get_token(AZURE_CREDENTIAL_SCOPE),
+    )
 
 
 def get_default_access_token(credentials: FabricSparkCredentials) -> AccessToken:
@@ -308,14 +318,20 @@ def get_token_credential_access_token(credentials: FabricSparkCredentials) -> Ac
     out : AccessToken
         The access token returned by the user-supplied credential.
     """
-    credential = _load_custom_credential(credentials)
-    result = credential.get_token(AZURE_CREDENTIAL_SCOPE)
-    if not isinstance(result, AccessToken):
-        raise DbtRuntimeError(
-            f"{credentials.credential_class!r}.get_token() must return an "
-            f"azure.core.credentials.AccessToken, got {type(result).__name__}."
-        )
-    return result
+
+    def acquire() -> AccessToken:
+        credential = _load_custom_credential(credentials)
+        result = credential.get_token(AZURE_CREDENTIAL_SCOPE)
+        if not isinstance(result, AccessToken):
+            raise DbtRuntimeError(
+                f"{credentials.credential_class!r}.get_token() must return an "
+                f"azure.core.credentials.AccessToken, got {type(result).__name__}."
+            )
+        return result
+
+    return get_or_acquire(
+        credentials.token_cache_file, credentials, AZURE_CREDENTIAL_SCOPE, acquire
+    )
 
 
 def get_fabric_notebook_access_token(credentials: FabricSparkCredentials) -> AccessToken:
@@ -368,38 +384,47 @@ def get_headers(credentials: FabricSparkCredentials, tokenPrint: bool = False) -
         # Local Livy doesn't require authentication
         return {"Content-Type": "application/json"}
 
-    global accessToken
-    with _token_lock:
-        if accessToken is None or is_token_refresh_necessary(accessToken.expires_on):
-            if credentials.authentication and credentials.authentication.lower() == "cli":
-                logger.info("Using CLI auth")
-                accessToken = get_cli_access_token(credentials)
-            elif credentials.authentication and credentials.authentication.lower() == "int_tests":
-                logger.info("Using int_tests auth")
-                accessToken = get_default_access_token(credentials)
-            elif (
-                credentials.authentication
-                and credentials.authentication.lower() == "fabric_notebook"
-            ):
-                logger.info("Using Fabric Notebook auth")
-                accessToken = get_fabric_notebook_access_token(credentials)
-            elif (
-                credentials.authentication
-                and credentials.authentication.lower() == "token_credential"
-            ):
-                logger.info(f"Using token_credential auth ({credentials.credential_class})")
-                accessToken = get_token_credential_access_token(credentials)
-            else:
-                logger.info("Using SPN auth")
-                accessToken = get_sp_access_token(credentials)
-
-    headers = {"Content-Type": "application/json", "Authorization": f"Bearer {accessToken.token}"}
+    headers = _token_manager.headers(credentials)
     if tokenPrint:
-        logger.debug(f"token is : {accessToken.token}")
+        logger.debug(f"token is : {headers['Authorization'][len('Bearer ') :]}")
 
     return headers
 
 
+def get_access_token(credentials: FabricSparkCredentials) -> AccessToken:
+    """Return the cached (or freshly fetched) access token for ``credentials``."""
+    return _token_manager.get_token(credentials)
+
+
+def _fetch_access_token(credentials: FabricSparkCredentials) -> AccessToken:
+    global accessToken
+    token = session_broker.broker_call(credentials, "token", credentials)
+    if token is not None:
+        accessToken = token
+        return token
+    if credentials.authentication and credentials.authentication.lower() == "cli":
+        logger.info("Using CLI auth")
+        token = get_cli_access_token(credentials)
+    elif credentials.authentication and credentials.authentication.lower() == "int_tests":
+        logger.info("Using int_tests auth")
+        token = get_default_access_token(credentials)
+    elif credentials.authentication and credentials.authentication.lower() == "fabric_notebook":
+        logger.info("Using Fabric Notebook auth")
+        token = get_fabric_notebook_access_token(credentials)
+    elif credentials.authentication and credentials.authentication.lower() == "token_credential":
+        logger.info(f"Using token_credential auth ({credentials.credential_class})")
+        token = get_token_credential_access_token(credentials)
+    else:
+        logger.info("Using SPN auth")
+        token = get_sp_access_token(credentials)
+    accessToken = token
+    return token
+
+
+# One cache entry per credential identity; see token_manager for the refresh policy.
+_token_manager = TokenManager(_fetch_access_token)
+
+
 def get_lakehouse_properties(credentials: FabricSparkCredentials) -> dict:
     """Fetch lakehouse properties from the Fabric REST API.
 
@@ -422,36 +447,56 @@ def get_lakehouse_properties(credentials: FabricSparkCredentials) -> dict:
             logger.debug("Lakehouse properties served from cache")
             return _lakehouse_props_cache[cache_key]
 
+    properties = session_broker.broker_call(credentials, "lakehouse_properties", credentials)
+    disk = metadata_cache.get_cache(credentials)
+    disk_key = "lakehouse_properties:" + "/".join(cache_key)
+    if properties is None and disk is not None:
+        properties = disk.get(disk_key)
+        if properties is not None:
+            logger.debug("Lakehouse properties served from the metadata cache")
+    if properties is not None:
+        with _lakehouse_props_lock:
+            _lakehouse_props_cache[cache_key] = properties
+        return properties
+
     headers = get_headers(credentials)
     url = f"{credentials.endpoint}/workspaces/{credentials.workspaceid}/lakehouses/{credentials.lakehouseid}"
 
     max_retries = 5
-    for attempt in range(max_retries):
+    retry = get_retry_policy().start(
+        "lakehouse properties", url, max_retries=max_retries - 1, base=2.0
+    )
+    while True:
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _http_utils.get(url, headers=headers, timeout=30)
             if response.status_code == 429:
-                retry_after = parse_retry_after(response)
-                wait = max(retry_after, 2**attempt * 2)  # at least 2, 4, 8, 16, 32s
+                if retry.exhausted():
+                    break
+                wait = retry.next_delay(parse_retry_after(response))
                 logger.debug(
                     f"Lakehouse properties API returned 429, "
-                    f"retrying in {wait:.0f}s (attempt {attempt + 1}/{max_retries})"
+                    f"retrying in {wait:.0f}s (attempt {retry.attempts}/{max_retries})"
                 )
                 time.sleep(wait)
                 continue
             response.raise_for_status()
+            retry.record_success()
             properties = response.json().get("properties", {})
             logger.debug(f"Lakehouse properties: {properties}")
 
             with _lakehouse_props_lock:
                 _lakehouse_props_cache[cache_key] = properties
+            if disk is not None:
+                disk.put(disk_key, properties)
 
             return properties
         except requests.exceptions.HTTPError:
-            if attempt < max_retries - 1:
-                wait = 2**attempt * 2
+            retry.record_failure()
+            if not retry.exhausted():
+                wait = retry.next_delay()
                 logger.debug(
                     f"Lakehouse properties API failed, "
-                    f"retrying in {wait}s (attempt {attempt + 1}/{max_retries})"
+                    f"retrying in {wait:.0f}s (attempt {retry.attempts}/{max_retries})"
                 )
                 time.sleep(wait)
                 continue
@@ -488,6 +533,7 @@ __all__ = [
     "get_cli_access_token",
     "get_default_access_token",
     "get_fabric_notebook_access_token",
+    "get_access_token",
     "get_headers",
     "get_lakehouse_properties",
     "get_sp_access_token",
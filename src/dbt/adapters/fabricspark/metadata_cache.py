@@ -0,0 +1,135 @@
+"""Metadata kept on disk between dbt invocations.
+
+Every dbt process starts by listing each schema with ``show table extended``
+(one large ``information`` blob per relation) and fetches the lakehouse
+properties, the Spark version and, for materialized lake views, the
+workspace's lakehouse ids. With ``metadata_cache_file`` set these are stored
+in a SQLite database, so ``dbt run -s one_model`` right after another run
+skips the full-schema listing and the REST calls.
+
+Entries expire ``metadata_cache_ttl`` seconds after they were stored. Schema
+listings are also dropped as soon as this adapter runs DDL against a
+relation of the schema (see :func:`column_cache.ddl_targets`), so the next
+invocation lists the schema again. Unqualified targets are session-scoped
+temporary views and leave the listings alone. Changes made outside dbt are
+only seen once the TTL expires.
+
+Like the session broker, the cache only accelerates: any SQLite failure is
+logged and treated as a miss.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark import column_cache
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+_RELATIONS = "relations"
+_SCHEMA = """create table if not exists metadata (
+    key text primary key,
+    stored_at real not null,
+    value text not null
+)"""
+
+
+def relations_key(credentials: Any, schema_relation: Any, prefix: str = "") -> str:
+    """Key of the listing of ``schema_relation`` from the session lakehouse."""
+    schema = column_cache.relation_key(str(schema_relation))
+    return f"{_RELATIONS}:{credentials.workspaceid}/{credentials.lakehouseid}:{schema}:{prefix}"
+
+
+class MetadataCache:
+    """JSON values by key in a SQLite database, each valid for ``ttl`` seconds."""
+
+    def __init__(self, path: str, ttl: float) -> None:
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            os.chmod(self.path, 0o600)
+            db.execute(_SCHEMA)
+            db.commit()
+            self._db = db
+        return self._db
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under ``key``, or None if missing or expired."""
+        with self._lock:
+            try:
+                row = (
+                    self._connect()
+                    .execute("select stored_at, value from metadata where key = ?", (key,))
+                    .fetchone()
+                )
+            except (OSError, sqlite3.Error) as ex:
+                logger.debug(f"Unable to read metadata cache {self.path}: {ex}")
+                return None
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return json.loads(row[1])
+
+    def put(self, key: str, value: Any) -> None:
+        data = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            try:
+                db = self._connect()
+                db.execute(
+                    "insert or replace into metadata (key, stored_at, value) values (?, ?, ?)",
+                    (key, time.time(), data),
+                )
+                db.commit()
+            except (OSError, sqlite3.Error) as ex:
+                logger.debug(f"Unable to write metadata cache {self.path}: {ex}")
+
+    def invalidate_relations(self, name: str) -> None:
+        """Drop the listings of every schema a DDL target ``name`` may belong to."""
+        target = column_cache.relation_key(name)
+        if "." not in target:
+            return
+        schema = target.rsplit(".", 1)[0]
+        with self._lock:
+            try:
+                db = self._connect()
+                keys = [
+                    key
+                    for (key,) in db.execute(
+                        "select key from metadata where key like ?", (f"{_RELATIONS}:%",)
+                    )
+                    if column_cache.keys_overlap(key.split(":")[2], schema)
+                ]
+                if keys:
+                    db.executemany("delete from metadata where key = ?", [(k,) for k in keys])
+                    db.commit()
+            except (OSError, sqlite3.Error) as ex:
+                logger.debug(f"Unable to update metadata cache {self.path}: {ex}")
+
+
+_caches_lock = threading.Lock()
+_caches: Dict[str, MetadataCache] = {}
+
+
+def get_cache(credentials: Any) -> Optional[MetadataCache]:
+    """Return the cache for ``credentials.metadata_cache_file``, or None if unset."""
+    path = getattr(credentials, "metadata_cache_file", None)
+    if not path or not isinstance(path, str):
+        return None
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = MetadataCache(path, credentials.metadata_cache_ttl)
+        return cache
@@ -18,9 +18,11 @@ import requests
 from dbt_common.exceptions import DbtRuntimeError
 
 from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark import _http_utils, metadata_cache
 from dbt.adapters.fabricspark._http_utils import parse_retry_after
 from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
 from dbt.adapters.fabricspark.livysession import get_headers
+from dbt.adapters.fabricspark.retry_policy import get_retry_policy
 
 logger = AdapterLogger("Microsoft Fabric-Spark")
 
@@ -71,6 +73,13 @@ def resolve_lakehouse_id(
         if name_lower in cached:
             return cached[name_lower]
 
+    disk = metadata_cache.get_cache(credentials)
+    disk_key = f"lakehouse_ids:{credentials.endpoint}/{workspace_id}"
+    stored = disk.get(disk_key) if disk is not None else None
+    if stored and lakehouse_name.lower() in stored:
+        _lakehouse_id_cache[workspace_id] = stored
+        return stored[lakehouse_name.lower()]
+
     # Fetch all lakehouses in the workspace
     url = f"{credentials.endpoint}/workspaces/{workspace_id}/lakehouses"
     headers = get_headers(credentials)
@@ -99,6 +108,8 @@ def resolve_lakehouse_id(
             name_to_id[display_name.lower()] = lh_id
 
     _lakehouse_id_cache[workspace_id] = name_to_id
+    if disk is not None:
+        disk.put(disk_key, name_to_id)
 
     name_lower = lakehouse_name.lower()
     if name_lower not in name_to_id:
@@ -147,7 +158,7 @@ def _request_with_retry(
     json_body: Optional[Dict[str, Any]] = None,
     max_retries: int = MAX_RETRIES,
 ) -> requests.Response:
-    """Execute an HTTP request with automatic retries and exponential back-off.
+    """Execute an HTTP request with retries under the shared jittered retry policy.
 
     For 429 responses, honours the ``Retry-After`` header (or the Fabric
     "until:" body hint) so the client waits exactly as long as the server
@@ -157,25 +168,29 @@ def _request_with_retry(
     error is encountered.
     """
     last_exception: Optional[Exception] = None
+    retry = get_retry_policy().start(
+        "MLV API", url, max_retries=max_retries - 1, base=RETRY_BACKOFF_BASE
+    )
 
     for attempt in range(1, max_retries + 1):
         try:
             logger.debug(f"MLV API {method} {url} (attempt {attempt}/{max_retries})")
-            response = requests.request(
+            response = _http_utils.request(
                 method, url, headers=headers, json=json_body, timeout=timeout
             )
 
             if response.status_code < 400:
+                retry.record_success()
                 return response
 
             # Retryable server / throttle errors
-            if response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries:
+            if response.status_code in RETRYABLE_STATUS_CODES and not retry.exhausted():
                 detail = _extract_error_detail(response)
                 if response.status_code == 429:
-                    retry_after = parse_retry_after(response)
-                    wait = max(retry_after, RETRY_BACKOFF_BASE**attempt) + random.uniform(0, 2)
+                    wait = retry.next_delay(parse_retry_after(response))
                 else:
-                    wait = RETRY_BACKOFF_BASE**attempt
+                    retry.record_failure()
+                    wait = retry.next_delay()
                 logger.warning(
                     f"MLV API {operation} returned {response.status_code} "
                     f"({detail}). Retrying in {wait:.0f}s (attempt {attempt}/{max_retries})..."
@@ -190,23 +205,19 @@ def _request_with_retry(
                 f"HTTP {response.status_code} from {method} {url} — {detail}",
             )
 
-        except requests.exceptions.ConnectionError as exc:
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
             last_exception = exc
-            if attempt < max_retries:
-                wait = RETRY_BACKOFF_BASE**attempt
-                logger.warning(
-                    f"MLV API {operation} connection error: {exc}. "
-                    f"Retrying in {wait}s (attempt {attempt}/{max_retries})..."
+            retry.record_failure()
+            if not retry.exhausted():
+                wait = retry.next_delay()
+                reason = (
+                    "timed out"
+                    if isinstance(exc, requests.exceptions.Timeout)
+                    else "connection error"
                 )
-                time.sleep(wait)
-                continue
-        except requests.exceptions.Timeout as exc:
-            last_exception = exc
-            if attempt < max_retries:
-                wait = RETRY_BACKOFF_BASE**attempt
                 logger.warning(
-                    f"MLV API {operation} timed out: {exc}. "
-                    f"Retrying in {wait}s (attempt {attempt}/{max_retries})..."
+                    f"MLV API {operation} {reason}: {exc}. "
+                    f"Retrying in {wait:.0f}s (attempt {attempt}/{max_retries})..."
                 )
                 time.sleep(wait)
                 continue
@@ -0,0 +1,235 @@
+"""Retry/backoff policy shared by every Livy and Fabric REST caller.
+
+One :class:`RetryPolicy` (configured from the profile via
+:func:`configure_retry_policy`) produces a :class:`RetryState` per operation —
+a statement submit, a statement poll, an HC acquire, an MLV call. The state
+hands out decorrelated-jitter delays (``min(cap, uniform(base, prev * 3))``)
+so threads that failed together do not retry in lockstep, and it enforces
+both a retry limit and a total backoff-time budget.
+
+Each endpoint origin also gets a :class:`CircuitBreaker`. After
+``circuit_breaker_threshold`` consecutive network/5xx failures across all
+threads the circuit opens: callers then wait out the same reset window
+together (or fail fast when that wait exceeds their remaining budget) instead
+of each burning its own retries against an endpoint that is down.
+
+Retry counts and time spent backing off are aggregated per operation and
+exposed through :func:`retry_metrics`.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from dbt_common.exceptions import DbtRuntimeError
+
+
+class CircuitOpenError(DbtRuntimeError):
+    """Raised when an endpoint's circuit is open for longer than the caller can wait."""
+
+    def __init__(self, endpoint: str, remaining: float) -> None:
+        self.endpoint = endpoint
+        self.remaining = remaining
+        super().__init__(
+            f"Circuit open for {endpoint} after repeated failures; "
+            f"next probe allowed in {remaining:.0f}s"
+        )
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one endpoint origin."""
+
+    def __init__(self, endpoint: str, threshold: int, reset_seconds: float) -> None:
+        self.endpoint = endpoint
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_until = 0.0
+        self.open_count = 0
+
+    def remaining(self) -> float:
+        """Seconds until the next probe is allowed; 0 when the circuit is closed."""
+        with self._lock:
+            return max(self._opened_until - time.monotonic(), 0.0)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_until = 0.0
+
+    def record_failure(self) -> None:
+        if self.threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            now = time.monotonic()
+            if self._failures >= self.threshold and self._opened_until <= now:
+                self._opened_until = now + self.reset_seconds
+                self.open_count += 1
+
+
+class RetryState:
+    """Per-operation retry bookkeeping handed out by :meth:`RetryPolicy.start`."""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        operation: str,
+        max_retries: int,
+        base: float,
+        cap: float,
+        breaker: Optional[CircuitBreaker],
+    ) -> None:
+        self.policy = policy
+        self.operation = operation
+        self.max_retries = max_retries
+        self.base = base
+        self.cap = cap
+        self.breaker = breaker
+        self.attempts = 0
+        self.spent = 0.0
+        self._previous = base
+
+    def exhausted(self) -> bool:
+        """True once the retry limit or the time budget has been used up."""
+        if self.attempts >= self.max_retries:
+            return True
+        return self.policy.budget > 0 and self.spent >= self.policy.budget
+
+    def next_delay(self, hint: float = 0.0) -> float:
+        """Record one retry and return how long to wait before it.
+
+        ``hint`` is a server-provided minimum (``Retry-After``). When the
+        endpoint's circuit is open the delay is stretched to the reset window
+        so every waiting thread probes together; if that does not fit in the
+        remaining budget a :class:`CircuitOpenError` is raised instead.
+        """
+        self.attempts += 1
+        self._previous = min(self.cap, random.uniform(self.base, self._previous * 3))
+        delay = max(hint, self._previous)
+        if self.breaker is not None:
+            remaining = self.breaker.remaining()
+            if remaining > 0:
+                if self.policy.budget > 0 and self.spent + remaining > self.policy.budget:
+                    raise CircuitOpenError(self.breaker.endpoint, remaining)
+                delay = max(delay, remaining)
+        if self.policy.budget > 0:
+            # Never undercut the server's Retry-After, even at the end of the budget.
+            delay = min(delay, max(self.policy.budget - self.spent, hint, 0.0))
+        self.spent += delay
+        self.policy._record(self.operation, delay)
+        return delay
+
+    def record_failure(self) -> None:
+        """Count an endpoint-level failure (network error or 5xx) toward the breaker."""
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+    def record_success(self) -> None:
+        """Reset the consecutive-retry count and close the breaker.
+
+        Time already spent backing off still counts against the budget.
+        """
+        self.attempts = 0
+        self._previous = self.base
+        if self.breaker is not None:
+            self.breaker.record_success()
+
+
+class RetryPolicy:
+    """Decorrelated-jitter backoff with a time budget and per-endpoint breakers."""
+
+    def __init__(
+        self,
+        base: float = 1.0,
+        cap: float = 30.0,
+        budget: float = 600.0,
+        breaker_threshold: int = 10,
+        breaker_reset: float = 30.0,
+    ) -> None:
+        self.base = base
+        self.cap = cap
+        self.budget = budget
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._metrics: Dict[str, Dict[str, float]] = {}
+
+    def start(
+        self,
+        operation: str,
+        url: Optional[str] = None,
+        max_retries: int = 5,
+        base: Optional[float] = None,
+        cap: Optional[float] = None,
+    ) -> RetryState:
+        """Begin retry tracking for one operation against ``url``'s endpoint."""
+        return RetryState(
+            self,
+            operation,
+            max_retries,
+            self.base if base is None else base,
+            self.cap if cap is None else cap,
+            self.breaker_for(url) if url else None,
+        )
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        parts = urlsplit(url)
+        endpoint = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, self.breaker_threshold, self.breaker_reset)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def _record(self, operation: str, delay: float) -> None:
+        with self._lock:
+            entry = self._metrics.setdefault(operation, {"retries": 0, "retry_seconds": 0.0})
+            entry["retries"] += 1
+            entry["retry_seconds"] += delay
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            result: Dict[str, Any] = {op: dict(entry) for op, entry in self._metrics.items()}
+            opens = {ep: b.open_count for ep, b in self._breakers.items() if b.open_count}
+        if opens:
+            result["circuit_opens"] = opens
+        return result
+
+
+_policy_lock = threading.Lock()
+_policy = RetryPolicy()
+
+
+def get_retry_policy() -> RetryPolicy:
+    return _policy
+
+
+def configure_retry_policy(credentials: Any) -> None:
+    """Apply the profile's retry settings to the process-wide policy.
+
+    Breakers are kept (and retuned) so an endpoint already known to be
+    failing stays open across reconfiguration.
+    """
+    with _policy_lock:
+        _policy.base = credentials.retry_base_delay
+        _policy.cap = credentials.retry_max_delay
+        _policy.budget = credentials.retry_budget
+        _policy.breaker_threshold = credentials.circuit_breaker_threshold
+        _policy.breaker_reset = credentials.circuit_breaker_reset
+        with _policy._lock:
+            for breaker in _policy._breakers.values():
+                breaker.threshold = _policy.breaker_threshold
+                breaker.reset_seconds = _policy.breaker_reset
+
+
+def retry_metrics() -> Dict[str, Any]:
+    """Per-operation ``{retries, retry_seconds}`` plus per-endpoint circuit opens."""
+    return _policy.metrics()
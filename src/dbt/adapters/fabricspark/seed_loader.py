@@ -0,0 +1,301 @@
+"""Bulk seed loading through the Livy session.
+
+The seed materialization inserts rows with ``insert into ... values`` batches
+of at most 500 rows (fewer for wide seeds), one Livy statement each, so a
+200k-row seed takes 400+ sequential round trips. For seeds of at least
+``seed_bulk_min_rows`` rows :func:`load` instead:
+
+1. ships the rows to the Spark driver in a few ``pyspark`` statements, each
+   carrying a compressed JSON slice of :data:`STAGE_ROWS_PER_STATEMENT` rows
+   that is appended to a per-load buffer in the REPL's Python globals;
+2. runs one final statement that turns the buffer into a DataFrame of string
+   columns, exposes it as a temporary view and inserts it into the seed table
+   with a single ``insert into ... select cast(c0 as <type>), ...``.
+
+Staging goes through the session rather than through OneLake ``Files/`` so
+it needs no storage-scoped token and behaves the same in ``livy_mode: local``.
+Cells are rendered to text exactly as :mod:`sql_binding` renders them into
+VALUES (empty cells stay ``''``), so both paths load identical data.
+
+With ``seed_parallel_repls`` the ``insert ... values`` batches instead run
+concurrently on several high-concurrency REPLs of the same Livy session
+(:func:`load_parallel`), into a staging Delta table that is then moved into
+the seed table in one statement.
+
+After a load the seed materialization records :func:`content_hash` of the
+data, column types and config in the table's :data:`HASH_PROPERTY`; a later
+run that computes the same hash skips the seed.
+"""
+
+from __future__ import annotations
+
+import base64
+import decimal
+import hashlib
+import json
+import re
+import uuid
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark import sql_binding
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+RESULT_MARKER = "__dbt_fabricspark_seed__"
+# Table property recording what the seed table was last loaded from.
+HASH_PROPERTY = "dbt_fabricspark.seed_hash"
+_STORED_HASH = re.compile(re.escape(HASH_PROPERTY) + r"'?\s*=\s*'?([0-9a-f]{64})")
+# Rows per staging statement; keeps each Livy request body to a few MB.
+STAGE_ROWS_PER_STATEMENT = 50_000
+# Limits of one ``insert ... values`` batch (see calc_batch_size in seed.sql).
+VALUES_BATCH_ROWS = 500
+VALUES_BATCH_PARAMETERS = 6000
+
+_STAGE = """import base64 as _dbt_b64, json as _dbt_json, zlib as _dbt_zlib
+_dbt_seed_stage = globals().setdefault("_dbt_seed_stage", {{}})
+_dbt_seed_stage.setdefault({key!r}, []).extend(
+    _dbt_json.loads(_dbt_zlib.decompress(_dbt_b64.b64decode({payload!r})))
+)
+print({marker!r} + str(len(_dbt_seed_stage[{key!r}])))"""
+
+_LOAD = """from pyspark.sql.types import StringType as _dbt_String
+from pyspark.sql.types import StructField as _dbt_Field, StructType as _dbt_Struct
+_dbt_rows = globals().get("_dbt_seed_stage", {{}}).pop({key!r}, [])
+if len(_dbt_rows) != {rows}:
+    raise RuntimeError("seed staging buffer holds %d of {rows} rows" % len(_dbt_rows))
+_dbt_schema = _dbt_Struct([_dbt_Field("c%d" % _i, _dbt_String(), True) for _i in range({columns})])
+spark.createDataFrame(_dbt_rows, _dbt_schema).createOrReplaceTempView({view!r})
+try:
+    spark.sql({insert!r})
+finally:
+    spark.catalog.dropTempView({view!r})
+print({marker!r} + str(len(_dbt_rows)))"""
+
+
+def _unquoted(render: Callable[[Any], str]) -> Callable[[Any], str]:
+    def convert(value: Any) -> str:
+        text = render(value)
+        return text[1:-1] if text[:1] == "'" else text
+
+    return convert
+
+
+def _decimal(value: decimal.Decimal) -> str:
+    return format(value, "f") if value.is_finite() else cell_text(float(value))
+
+
+# Per-type cell renderers derived from sql_binding's literal renderers; the
+# common unquoted ones are called directly.
+_CELLS: Dict[type, Callable[[Any], str]] = {
+    bool: sql_binding.converter_for(bool),
+    int: str,
+    decimal.Decimal: _decimal,
+}
+
+
+def _cell_converter(kind: type) -> Callable[[Any], str]:
+    converter = _CELLS[kind] = _unquoted(sql_binding.converter_for(kind))
+    return converter
+
+
+def cell_text(value: Any) -> str:
+    """Render a seed cell as the text its VALUES literal would contain."""
+    if value is None:
+        return ""
+    if type(value) is str:
+        return value
+    return (_CELLS.get(type(value)) or _cell_converter(type(value)))(value)
+
+
+def encode_rows(rows: Sequence[Sequence[Any]]) -> str:
+    """Return ``rows`` as base64 of zlib-compressed JSON lists of cell text."""
+    get = _CELLS.get
+    cells = [
+        [
+            ""
+            if v is None
+            else (v if type(v) is str else (get(type(v)) or _cell_converter(type(v)))(v))
+            for v in row
+        ]
+        for row in rows
+    ]
+    data = json.dumps(cells, separators=(",", ":"))
+    return base64.b64encode(zlib.compress(data.encode("utf-8"), 1)).decode("ascii")
+
+
+def insert_sql(relation: str, view: str, column_types: Sequence[str]) -> str:
+    casts = ", ".join(f"cast(c{i} as {type_})" for i, type_ in enumerate(column_types))
+    return f"insert into {relation} select {casts} from {view}"
+
+
+def build_scripts(
+    relation: str, rows: Sequence[Sequence[Any]], column_types: Sequence[str]
+) -> List[str]:
+    """Return the staging statements followed by the final load statement."""
+    token = uuid.uuid4().hex[:12]
+    key = f"{relation}:{token}"
+    view = f"_dbt_seed_{token}"
+    scripts = [
+        _STAGE.format(
+            key=key,
+            payload=encode_rows(rows[start : start + STAGE_ROWS_PER_STATEMENT]),
+            marker=RESULT_MARKER,
+        )
+        for start in range(0, len(rows), STAGE_ROWS_PER_STATEMENT)
+    ]
+    scripts.append(
+        _LOAD.format(
+            key=key,
+            rows=len(rows),
+            columns=len(column_types),
+            view=view,
+            insert=insert_sql(relation, view, column_types),
+            marker=RESULT_MARKER,
+        )
+    )
+    return scripts
+
+
+def parse_count(result: dict) -> int:
+    """Return the row count a staging or load statement printed."""
+    output = result.get("output", {})
+    if output.get("status") != "ok":
+        raise DbtDatabaseError(
+            "Error while bulk loading seed: " + output.get("evalue", "<no evalue>")
+        )
+    text = str(output.get("data", {}).get("text/plain", ""))
+    for line in text.splitlines():
+        if line.startswith(RESULT_MARKER):
+            return int(line[len(RESULT_MARKER) :])
+    raise DbtDatabaseError(f"Bulk seed statement returned no row count: {text[:500]}")
+
+
+def load(
+    connections: Any,
+    relation: str,
+    rows: Sequence[Sequence[Any]],
+    column_types: Sequence[str],
+) -> str:
+    """Load ``rows`` into ``relation``; return the INSERT that moved them."""
+    scripts = build_scripts(relation, rows, column_types)
+    logger.debug(
+        f"Bulk loading {len(rows)} rows into {relation} in {len(scripts)} Livy statements"
+    )
+    for index, script in enumerate(scripts[:-1]):
+        staged = parse_count(
+            connections.execute_code(
+                script, f"-- stage seed rows for {relation} ({index + 1}/{len(scripts) - 1})"
+            )
+        )
+        logger.debug(f"Staged {staged} rows for {relation}")
+    sql = insert_sql(relation, "<staged rows>", column_types)
+    parse_count(connections.execute_code(scripts[-1], sql))
+    return sql
+
+
+def values_batch_size(columns: int) -> int:
+    """Rows per ``insert ... values`` statement, as the seed macro batches them."""
+    return max(1, min(VALUES_BATCH_ROWS, int(VALUES_BATCH_PARAMETERS / max(columns, 1)) - 1))
+
+
+def values_statements(
+    relation: str, rows: Sequence[Sequence[Any]], column_types: Sequence[str]
+) -> List[str]:
+    """Return the rows as bound ``insert into relation values`` batches."""
+    row_sql = "(" + ",".join(f"cast(%s as {type_})" for type_ in column_types) + ")"
+    size = values_batch_size(len(column_types))
+    statements = []
+    for start in range(0, len(rows), size):
+        chunk = rows[start : start + size]
+        template = f"insert into {relation} values\n" + ",".join([row_sql] * len(chunk))
+        statements.append(sql_binding.bind(template, [v for row in chunk for v in row]))
+    return statements
+
+
+def load_parallel(
+    connections: Any,
+    relation: str,
+    stage: str,
+    rows: Sequence[Sequence[Any]],
+    column_types: Sequence[str],
+    repls: int,
+) -> str:
+    """Load ``rows`` into ``relation`` through ``stage`` on up to ``repls`` REPLs.
+
+    The VALUES batches are appended concurrently to ``stage``, an empty Delta
+    copy of ``relation`` (blind appends do not conflict), and reach
+    ``relation`` in one ``insert ... select``: a single Delta commit, so the
+    seed table never holds part of the rows. Returns that statement.
+    """
+    statements = values_statements(stage, rows, column_types)
+    connections.execute(f"drop table if exists {stage}")
+    connections.execute(
+        f"create table {stage} using delta as select * from {relation} where 1 = 0"
+    )
+    try:
+        used = connections.execute_parallel(
+            statements, f"-- insert {len(rows)} seed rows into {stage} in parallel", repls
+        )
+        logger.debug(
+            f"Staged {len(rows)} rows for {relation} in {len(statements)} batches on {used} REPLs"
+        )
+        sql = f"insert into {relation} select * from {stage}"
+        connections.execute(sql)
+    finally:
+        connections.execute(f"drop table if exists {stage}")
+    return sql
+
+
+def rows_digest(rows: Sequence[Sequence[Any]]) -> str:
+    """Return a sha256 of the seed cells as they would be loaded."""
+    digest = hashlib.sha256()
+    get = _CELLS.get
+    for row in rows:
+        cells = [
+            ""
+            if v is None
+            else (v if type(v) is str else (get(type(v)) or _cell_converter(type(v)))(v))
+            for v in row
+        ]
+        digest.update(json.dumps(cells, separators=(",", ":")).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def content_hash(
+    data_digest: str,
+    column_names: Sequence[str],
+    column_types: Sequence[str],
+    config: Dict[str, Any],
+) -> str:
+    """Return the hash stored in :data:`HASH_PROPERTY` for a loaded seed.
+
+    Covers the data, the column names and types and the whole model config,
+    so any change that could alter the table's contents or shape changes it.
+    """
+    payload = json.dumps(
+        {
+            "data": data_digest,
+            "columns": list(column_names),
+            "types": list(column_types),
+            "config": config,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def stored_hash(text: Optional[str]) -> Optional[str]:
+    """Return the seed hash found in table metadata text, if any.
+
+    Accepts the ``Table Properties: [...]`` line of ``show table extended`` /
+    ``describe table extended`` output as well as ``show tblproperties`` rows.
+    """
+    m = _STORED_HASH.search(text or "")
+    return m.group(1) if m else None
@@ -0,0 +1,406 @@
+"""Optional local broker process that keeps Livy state warm across dbt runs.
+
+With ``session_broker: true`` the first dbt process spawns
+``python -m dbt.adapters.fabricspark.session_broker`` and talks to it over a
+Unix socket (``0600``, inside a ``0700`` directory). The broker owns what is
+expensive to rebuild in every short-lived dbt process:
+
+- HC REPL leases, held in the broker's own
+  :class:`~dbt.adapters.fabricspark.concurrent_livy.HighConcurrencyReplPool`
+  instances, so a new process gets ids of an already-``Idle`` REPL instead of
+  POSTing and polling a fresh acquire;
+- access tokens (the broker's per-credential token manager);
+- lakehouse properties and small metadata such as the Spark version probe
+  and the shortcuts-created marker.
+
+The protocol is one JSON request line and one JSON response line per
+connection. Any broker failure makes the client fall back to talking to
+Fabric directly, so the broker is purely an accelerator. A lease that finds
+every REPL taken waits at most ``LEASE_WAIT_SECONDS`` and then answers
+``busy``, so the client acquires its own REPL. Each lease records the pid of
+its client; leases of clients that exited without releasing them go back to
+the pool on the next lease and periodically while idle. The broker exits
+after ``session_broker_idle_timeout`` seconds without requests; its atexit
+handler then releases REPLs like any other process. Unix only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from azure.core.credentials import AccessToken
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+DEFAULT_SOCKET_PATH = os.path.join("~", ".dbt", "fabricspark-broker", "broker.sock")
+DEFAULT_IDLE_TIMEOUT = 1800
+SPAWN_TIMEOUT_SECONDS = 15.0
+PING_TIMEOUT_SECONDS = 2.0
+LEASE_WAIT_SECONDS = 10.0
+
+
+class BrokerError(DbtRuntimeError):
+    """Raised by :class:`BrokerClient` when the broker reports a failure."""
+
+
+def resolve_socket_path(credentials: Any) -> str:
+    return os.path.expanduser(credentials.session_broker_socket or DEFAULT_SOCKET_PATH)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _wire_credentials(credentials: FabricSparkCredentials) -> Dict[str, Any]:
+    data = credentials.to_dict(omit_none=True)
+    # The broker talks to Fabric itself; it must never recurse into a broker.
+    data["session_broker"] = False
+    return data
+
+
+# ---- server -----------------------------------------------------------------
+
+
+class SessionBroker:
+    """Request handlers and state for the broker process."""
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # hc_id -> (session, pid of the client holding it)
+        self._leases: Dict[str, Tuple[Any, int]] = {}
+        self._metadata: Dict[str, Any] = {}
+        self.last_request = time.monotonic()
+        self.counters: Dict[str, int] = {}
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.last_request = time.monotonic()
+        op = request.get("op", "")
+        handler = getattr(self, f"_op_{op}", None)
+        if handler is None:
+            return {"error": f"unknown op {op!r}"}
+        with self._lock:
+            self.counters[op] = self.counters.get(op, 0) + 1
+        try:
+            return {"ok": True, **handler(request)}
+        except Exception as ex:
+            return {"error": f"{type(ex).__name__}: {ex}"}
+
+    def reclaim_orphaned(self) -> None:
+        """Return the leases of clients that exited without releasing them."""
+        with self._lock:
+            orphaned = [hc_id for hc_id, (_, pid) in self._leases.items() if not _pid_alive(pid)]
+            sessions = [self._leases.pop(hc_id)[0] for hc_id in orphaned]
+        for session in sessions:
+            logger.debug(f"Reclaiming HC REPL {session.hc_id} of an exited client")
+            session.pool.release(session)
+
+    @staticmethod
+    def _credentials(request: Dict[str, Any]) -> FabricSparkCredentials:
+        return FabricSparkCredentials.from_dict(request["credentials"])
+
+    def _op_ping(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return {"pid": os.getpid()}
+
+    def _op_lease(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        from dbt.adapters.fabricspark import concurrent_livy
+
+        owner = int(request.get("pid", 0))
+        self.reclaim_orphaned()
+        creds = self._credentials(request)
+        concurrent_livy.configure_hc_threads(
+            max(concurrent_livy._hc_threads, int(request.get("threads", 1)))
+        )
+        tags = concurrent_livy.shard_tags(creds)
+        tag = tags[min(int(request.get("shard", 0)), len(tags) - 1)]
+        try:
+            session = concurrent_livy.get_repl_pool(creds, tag).lease(timeout=LEASE_WAIT_SECONDS)
+        except concurrent_livy.ReplPoolBusyError:
+            return {"busy": True}
+        if not _pid_alive(owner):
+            # The client went away while its lease was being acquired.
+            session.pool.release(session)
+            return {"busy": True}
+        with self._lock:
+            self._leases[session.hc_id] = (session, owner)
+        return {
+            "hc_id": session.hc_id,
+            "session_id": session.session_id,
+            "repl_id": session.repl_id,
+            "session_tag": session.session_tag,
+        }
+
+    def _op_release(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            lease = self._leases.pop(request["hc_id"], None)
+        if lease is None:
+            return {"released": False}
+        session = lease[0]
+        if request.get("dead"):
+            session.is_dead = True
+            session.is_new_session_required = True
+        session.pool.release(session)
+        return {"released": True}
+
+    def _op_token(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        from dbt.adapters.fabricspark import livysession
+
+        token = livysession.get_access_token(self._credentials(request))
+        return {"token": token.token, "expires_on": token.expires_on}
+
+    def _op_lakehouse(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        from dbt.adapters.fabricspark import livysession
+
+        return {"properties": livysession.get_lakehouse_properties(self._credentials(request))}
+
+    def _op_meta_get(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            return {"value": self._metadata.get(request["key"])}
+
+    def _op_meta_put(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self._metadata[request["key"]] = request.get("value")
+        return {}
+
+    def _op_stats(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        from dbt.adapters.fabricspark import concurrent_livy
+
+        with self._lock:
+            leased = len(self._leases)
+            counters = dict(self.counters)
+        with concurrent_livy._repl_pools_lock:
+            idle = sum(len(pool._idle) for pool in concurrent_livy._repl_pools.values())
+        return {"leased": leased, "idle": idle, "requests": counters}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response: Dict[str, Any] = {"error": "malformed request"}
+        else:
+            if request.get("op") == "shutdown":
+                response = {"ok": True}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            else:
+                response = self.server.broker.handle(request)
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class BrokerServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, broker: SessionBroker) -> None:
+        self.broker = broker
+        self.socket_path = socket_path
+        directory = os.path.dirname(socket_path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, _Handler)
+        os.chmod(socket_path, 0o600)
+
+    def serve_until_idle(self) -> None:
+        """Serve requests until ``idle_timeout`` passes with none, then clean up."""
+
+        def _watch() -> None:
+            while True:
+                time.sleep(min(self.broker.idle_timeout, 30))
+                self.broker.reclaim_orphaned()
+                if time.monotonic() - self.broker.last_request > self.broker.idle_timeout:
+                    self.shutdown()
+                    return
+
+        threading.Thread(target=_watch, name="broker-idle", daemon=True).start()
+        try:
+            self.serve_forever()
+        finally:
+            self.server_close()
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="dbt-fabricspark local session broker")
+    parser.add_argument("--socket", required=True)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+    BrokerServer(args.socket, SessionBroker(args.idle_timeout)).serve_until_idle()
+
+
+# ---- client -----------------------------------------------------------------
+
+
+class BrokerClient:
+    """Client side of the broker protocol, used from dbt processes."""
+
+    def __init__(self, socket_path: str) -> None:
+        self.socket_path = socket_path
+
+    def request(self, op: str, timeout: Optional[float] = None, **payload: Any) -> Dict[str, Any]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps({"op": op, **payload}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise BrokerError(f"session broker closed the connection during {op!r}")
+        response = json.loads(line)
+        if "error" in response:
+            raise BrokerError(f"session broker {op!r} failed: {response['error']}")
+        return response
+
+    def ping(self) -> bool:
+        try:
+            self.request("ping", timeout=PING_TIMEOUT_SECONDS)
+            return True
+        except (OSError, ValueError, BrokerError):
+            return False
+
+    def lease(
+        self, credentials: FabricSparkCredentials, shard: int, threads: int
+    ) -> Dict[str, Any]:
+        return self.request(
+            "lease",
+            timeout=credentials.session_start_timeout + credentials.http_timeout,
+            credentials=_wire_credentials(credentials),
+            shard=shard,
+            threads=threads,
+            pid=os.getpid(),
+        )
+
+    def release(self, hc_id: str, dead: bool = False) -> None:
+        self.request("release", timeout=30, hc_id=hc_id, dead=dead)
+
+    def token(self, credentials: FabricSparkCredentials) -> AccessToken:
+        res = self.request(
+            "token", timeout=credentials.http_timeout, credentials=_wire_credentials(credentials)
+        )
+        return AccessToken(token=res["token"], expires_on=int(res["expires_on"]))
+
+    def lakehouse_properties(self, credentials: FabricSparkCredentials) -> dict:
+        res = self.request(
+            "lakehouse",
+            timeout=credentials.http_timeout,
+            credentials=_wire_credentials(credentials),
+        )
+        return res["properties"]
+
+    def meta_get(self, key: str) -> Any:
+        return self.request("meta_get", timeout=PING_TIMEOUT_SECONDS, key=key)["value"]
+
+    def meta_put(self, key: str, value: Any) -> None:
+        self.request("meta_put", timeout=PING_TIMEOUT_SECONDS, key=key, value=value)
+
+
+_clients_lock = threading.Lock()
+_clients: Dict[str, Optional[BrokerClient]] = {}
+
+
+def _spawn(socket_path: str, idle_timeout: int) -> None:
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "dbt.adapters.fabricspark.session_broker",
+            "--socket",
+            socket_path,
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def get_broker(credentials: Any) -> Optional[BrokerClient]:
+    """Return a live broker client, spawning the broker if needed.
+
+    Returns ``None`` when ``session_broker`` is off, on platforms without
+    Unix sockets, or when the broker cannot be reached; callers then go to
+    Fabric directly. The outcome is cached per socket path for the process.
+    """
+    if not getattr(credentials, "session_broker", False) or credentials.is_local_mode:
+        return None
+    path = resolve_socket_path(credentials)
+    with _clients_lock:
+        if path in _clients:
+            return _clients[path]
+        client: Optional[BrokerClient] = None
+        if not hasattr(socket, "AF_UNIX"):
+            logger.warning("session_broker requires Unix domain sockets; ignoring it")
+        else:
+            client = BrokerClient(path)
+            if not client.ping():
+                start = time.monotonic()
+                try:
+                    _spawn(path, credentials.session_broker_idle_timeout)
+                except OSError as ex:
+                    logger.warning(f"Unable to start session broker: {ex}")
+                    client = None
+                while client is not None and not client.ping():
+                    if time.monotonic() - start > SPAWN_TIMEOUT_SECONDS:
+                        logger.warning(f"Session broker did not come up at {path}; ignoring it")
+                        client = None
+                        break
+                    time.sleep(0.1)
+                if client is not None:
+                    logger.debug(f"Started session broker at {path}")
+        _clients[path] = client
+        return client
+
+
+def forget_broker(credentials: Any) -> None:
+    """Stop using the broker for the rest of this process (after a failure)."""
+    with _clients_lock:
+        _clients[resolve_socket_path(credentials)] = None
+
+
+def broker_call(credentials: Any, method: str, *args: Any, **kwargs: Any) -> Any:
+    """Call ``BrokerClient.<method>`` when a broker is in use.
+
+    Returns ``None`` when there is no broker or the call fails; a failure also
+    disables the broker for the rest of the process so callers fall back to
+    Fabric without paying the failure again.
+    """
+    client = get_broker(credentials)
+    if client is None:
+        return None
+    try:
+        return getattr(client, method)(*args, **kwargs)
+    except (OSError, ValueError, BrokerError) as ex:
+        logger.warning(f"Session broker {method} failed, continuing without it: {ex}")
+        forget_broker(credentials)
+        return None
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,8 @@
 import json
 import time
 
-import requests
-
 from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark import _http_utils
 from dbt.adapters.fabricspark.shortcut import Shortcut, TargetName
 
 logger = AdapterLogger("Microsoft Fabric-Spark")
@@ -96,7 +95,7 @@ class ShortcutClient:
         """
         headers = {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"}
         shortcut_url = f"{self.endpoint}/workspaces/{self.workspace_id}/items/{self.item_id}/shortcuts/{shortcut.path}/{shortcut.shortcut_name}"
-        response = requests.get(shortcut_url, headers=headers)
+        response = _http_utils.get(shortcut_url, headers=headers)
         # check if the error is ItemNotFound
         if response.status_code == 404:
             return False
@@ -127,7 +126,7 @@ class ShortcutClient:
         logger.debug(
             f"Deleting shortcut {shortcut_name} at {shortcut_path} from workspace {self.workspace_id} and item {self.item_id}"
         )
-        response = requests.delete(connect_url, headers=headers)
+        response = _http_utils.delete(connect_url, headers=headers)
         time.sleep(DEFAULT_POLL_WAIT)
         response.raise_for_status()
 
@@ -147,5 +146,5 @@ class ShortcutClient:
         headers = {"Authorization": f"Bearer {self.token}", "Content-Type": "application/json"}
         target_body = shortcut.get_target_body()
         body = {"path": shortcut.path, "name": shortcut.shortcut_name, "target": target_body}
-        response = requests.post(connect_url, headers=headers, data=json.dumps(body))
+        response = _http_utils.post(connect_url, headers=headers, data=json.dumps(body))
         response.raise_for_status()
@@ -1,29 +1,32 @@
 from __future__ import annotations
 
 import atexit
-import datetime as dt
 import json
-import re
 import threading
 import time
 from types import TracebackType
 from typing import Any, Optional
 
 import requests
-from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
-from dbt_common.utils.encoding import DECIMALS
+from dbt_common.exceptions import DbtDatabaseError
 from requests.models import Response
 
 from dbt.adapters.events.logging import AdapterLogger
 from dbt.adapters.exceptions import FailedToConnectError
+from dbt.adapters.fabricspark import (
+    _http_utils,
+    batch,
+    livy_engine,
+    sql_binding,
+    sql_lexer,
+    statement_registry,
+)
 from dbt.adapters.fabricspark import livysession as _livy_helpers
-from dbt.adapters.fabricspark._http_utils import parse_retry_after
 from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
 from dbt.adapters.fabricspark.livy_backend import LivyBackend
 from dbt.adapters.fabricspark.shortcuts import ShortcutClient
 
 logger = AdapterLogger("Microsoft Fabric-Spark")
-NUMBERS = DECIMALS + (int, float)
 
 _session_lock = threading.Lock()
 
@@ -32,6 +35,12 @@ def _get_headers(credentials: FabricSparkCredentials, tokenPrint: bool = False)
     return _livy_helpers.get_headers(credentials, tokenPrint)
 
 
+def _flag_session_for_reconnect() -> None:
+    if LivySessionManager.livy_global_session is not None:
+        LivySessionManager.livy_global_session.is_new_session_required = True
+        logger.debug("Livy statement returned 404 — flagging session for reconnect")
+
+
 class LivySession:
     def __init__(self, credentials: FabricSparkCredentials):
         self.credential = credentials
@@ -70,7 +79,7 @@ class LivySession:
             logger.debug(f"Attempting to reuse existing session: {session_id}")
             self.session_id = session_id
 
-            res = requests.get(
+            res = _http_utils.get(
                 self.connect_url + "/sessions/" + session_id,
                 headers=_get_headers(self.credential, False),
                 timeout=self.credential.http_timeout,
@@ -147,7 +156,7 @@ class LivySession:
         deadline = time.time() + self.credential.session_start_timeout
 
         while time.time() < deadline:
-            res = requests.get(
+            res = _http_utils.get(
                 self.connect_url + "/sessions/" + session_id,
                 headers=_get_headers(self.credential, False),
                 timeout=self.credential.http_timeout,
@@ -201,7 +210,7 @@ class LivySession:
         max_create_retries = 5
         for attempt in range(max_create_retries):
             try:
-                response = requests.post(
+                response = _http_utils.post(
                     self.connect_url + "/sessions",
                     data=json.dumps(session_data),
                     headers=_get_headers(self.credential, False),
@@ -260,7 +269,7 @@ class LivySession:
                     f"{self.session_id} to start. Increase `session_start_timeout` in profiles.yml."
                 )
             try:
-                response = requests.get(
+                response = _http_utils.get(
                     self.connect_url + "/sessions/" + self.session_id,
                     headers=_get_headers(self.credential, False),
                     timeout=self.credential.http_timeout,
@@ -311,7 +320,7 @@ class LivySession:
 
     def delete_session(self) -> None:
         try:
-            res = requests.delete(
+            res = _http_utils.delete(
                 self.connect_url + "/sessions/" + self.session_id,
                 headers=_get_headers(self.credential, False),
                 timeout=self.credential.http_timeout,
@@ -329,7 +338,7 @@ class LivySession:
             logger.error("Session ID is None")
             return False
         try:
-            res = requests.get(
+            res = _http_utils.get(
                 self.connect_url + "/sessions/" + self.session_id,
                 headers=_get_headers(self.credential, False),
                 timeout=self.credential.http_timeout,
@@ -368,6 +377,8 @@ class LivyCursor:
         self.session_id = livy_session.session_id
         self.livy_session = livy_session
         self.is_local_mode = credential.is_local_mode
+        self.in_flight = livy_engine.InFlightStatements()
+        self._fingerprint: Optional[str] = None
 
     def __enter__(self) -> LivyCursor:
         return self
@@ -405,206 +416,70 @@ class LivyCursor:
     def close(self) -> None:
         self._rows = None
 
-    def _submitLivyCode(self, code) -> Response:
+    def _submitLivyCode(self, code, kind: str = "sql") -> Response:
         if self.livy_session.is_new_session_required:
             LivySessionManager._connect_impl(self.credential)
             # connect() may swap in a new LivySession; resync our reference.
             self.livy_session = LivySessionManager.livy_global_session
             self.session_id = self.livy_session.session_id
 
-        data = {"code": code, "kind": "sql"}
-        url = self.connect_url + "/sessions/" + self.session_id + "/statements"
-        logger.debug(f"Submitted: {data} {url}")
-
-        max_retries = 5
-        res = None
-        for attempt in range(max_retries):
-            try:
-                res = requests.post(
-                    url,
-                    data=json.dumps(data),
-                    headers=_get_headers(self.credential, False),
-                    timeout=self.credential.http_timeout,
-                )
-            except (
-                requests.exceptions.SSLError,
-                requests.exceptions.ConnectionError,
-                requests.exceptions.Timeout,
-                requests.exceptions.ChunkedEncodingError,
-            ) as exc:
-                if attempt >= max_retries - 1:
-                    raise DbtRuntimeError(
-                        f"Livy statement submit failed after {max_retries} retries: {exc}"
-                    )
-                wait_time = 2**attempt * 1
-                logger.debug(
-                    f"Livy statement submit got transient network error "
-                    f"({type(exc).__name__}: {exc}), retrying in {wait_time}s "
-                    f"(attempt {attempt + 1}/{max_retries})"
-                )
-                time.sleep(wait_time)
-                continue
-            if res.status_code == 429:
-                retry_after = parse_retry_after(res)
-                wait_time = max(retry_after, 2**attempt * 1)
-                logger.debug(
-                    f"Livy statement submit got HTTP 429, "
-                    f"retrying in {wait_time:.0f}s (attempt {attempt + 1}/{max_retries})"
-                )
-                time.sleep(wait_time)
-                continue
-            if res.status_code < 500:
-                break
-            if attempt < max_retries - 1:
-                wait_time = 2**attempt * 1
-                logger.debug(
-                    f"Livy statement submit got HTTP {res.status_code}, "
-                    f"retrying in {wait_time}s (attempt {attempt + 1}/{max_retries})"
-                )
-                time.sleep(wait_time)
-
-        if res.status_code >= 400:
-            if res.status_code == 404 and LivySessionManager.livy_global_session is not None:
-                LivySessionManager.livy_global_session.is_new_session_required = True
-                logger.debug("Livy statement submit returned 404 — flagging session for reconnect")
-            raise DbtRuntimeError(
-                f"Livy statement submit failed (HTTP {res.status_code}): {res.text}"
-            )
-        json_body = res.json()
-        if "id" not in json_body:
-            raise DbtRuntimeError(
-                f"Livy statement submit returned unexpected response (missing 'id'): {json_body}"
+        engine = livy_engine.get_engine()
+        statements_url = self.connect_url + "/sessions/" + self.session_id + "/statements"
+        registry = statement_registry.get_registry(self.credential)
+        self._fingerprint = statement_registry.fingerprint(code)
+        running = registry.resume(
+            self._fingerprint, statements_url, self.credential, self._headers
+        )
+        if running is not None:
+            return livy_engine.statement_response(running)
+        res = engine.run(
+            engine.submit_statement(
+                statements_url,
+                code,
+                self.credential,
+                headers=self._headers,
+                label="Livy",
+                on_not_found=_flag_session_for_reconnect,
+                kind=kind,
+                fingerprint=self._fingerprint,
             )
+        )
+        registry.record(self._fingerprint, statements_url, res.json()["id"])
         return res
 
     def _getLivySQL(self, sql) -> str:
         # The Livy SQL submit path interpolates this string into a code block
-        # for the server-side interpreter, so embedded /* ... */ comments are
-        # stripped here before submission. Client-side escaping is unnecessary
-        # because submission uses POST JSON, not URL encoding.
-        code = re.sub(r"\s*/\*(.|\n)*?\*/\s*", "\n", sql, flags=re.DOTALL).strip()
-        return code
+        # for the server-side interpreter, so comments and trailing semicolons
+        # are stripped here before submission. Client-side escaping is
+        # unnecessary because submission uses POST JSON, not URL encoding.
+        return sql_lexer.clean_statement(sql)
 
     def _getLivyResult(self, res_obj) -> Response:
         json_res = res_obj.json()
-        statement_id = repr(json_res["id"])
-        url = self.connect_url + "/sessions/" + self.session_id + "/statements/" + statement_id
-        deadline = (
-            (time.time() + self.credential.statement_timeout)
-            if self.credential.statement_timeout > 0
-            else None
-        )
-        consecutive_failures = 0
-        max_poll_retries = 30
-        _poll_interval = 0.3
-        _poll_interval_cap = max(self.credential.poll_statement_wait * 3, 1.5)
-        # 404 can appear transiently right after submit before the statement id
-        # is registered, or when the Fabric Livy service briefly loses track of
-        # the session/statement. Retry with exponential backoff before giving up.
-        not_found_retries = 0
-        max_not_found_retries = 20
-        while True:
-            if deadline is not None and time.time() > deadline:
-                raise DbtDatabaseError(
-                    f"Timeout ({self.credential.statement_timeout}s) waiting for statement "
-                    f"{statement_id} to complete. Increase `statement_timeout` in profiles.yml."
-                )
-            try:
-                poll_res = requests.get(
-                    url,
-                    headers=_get_headers(self.credential, False),
-                    timeout=self.credential.http_timeout,
-                )
-            except (
-                requests.exceptions.SSLError,
-                requests.exceptions.ConnectionError,
-                requests.exceptions.Timeout,
-                requests.exceptions.ChunkedEncodingError,
-            ) as exc:
-                consecutive_failures += 1
-                if consecutive_failures > max_poll_retries:
-                    raise DbtRuntimeError(
-                        f"Livy statement poll failed after {max_poll_retries} retries "
-                        f"({type(exc).__name__}: {exc})"
-                    )
-                wait_time = min(2 ** (consecutive_failures - 1), 30)
-                logger.debug(
-                    f"Livy statement poll got transient network error "
-                    f"({type(exc).__name__}: {exc}), retrying in {wait_time}s "
-                    f"(attempt {consecutive_failures}/{max_poll_retries})"
-                )
-                time.sleep(wait_time)
-                continue
-            if poll_res.status_code == 429:
-                consecutive_failures += 1
-                retry_after = parse_retry_after(poll_res)
-                wait_time = max(retry_after, 2 ** (consecutive_failures - 1) * 1)
-                logger.debug(
-                    f"Livy statement poll got HTTP 429, "
-                    f"retrying in {wait_time:.0f}s (attempt {consecutive_failures}/{max_poll_retries})"
-                )
-                time.sleep(wait_time)
-                if consecutive_failures > max_poll_retries:
-                    raise DbtRuntimeError(
-                        f"Livy statement poll failed after {max_poll_retries} retries "
-                        f"(HTTP 429): {poll_res.text}"
-                    )
-                continue
-            if poll_res.status_code >= 500:
-                consecutive_failures += 1
-                if consecutive_failures <= max_poll_retries:
-                    wait_time = 2 ** (consecutive_failures - 1) * 1
-                    logger.debug(
-                        f"Livy statement poll got HTTP {poll_res.status_code}, "
-                        f"retrying in {wait_time}s (attempt {consecutive_failures}/{max_poll_retries})"
-                    )
-                    time.sleep(wait_time)
-                    continue
-                raise DbtRuntimeError(
-                    f"Livy statement poll failed after {max_poll_retries} retries "
-                    f"(HTTP {poll_res.status_code}): {poll_res.text}"
-                )
-            if poll_res.status_code == 404 and not_found_retries < max_not_found_retries:
-                not_found_retries += 1
-                wait_time = min(0.3 * (2.0 ** (not_found_retries - 1)), 5.0)
-                logger.debug(
-                    f"Livy statement poll got HTTP 404, retrying in {wait_time:.2f}s "
-                    f"(not-found attempt {not_found_retries}/{max_not_found_retries})"
-                )
-                time.sleep(wait_time)
-                continue
-            if poll_res.status_code >= 400:
-                if (
-                    poll_res.status_code == 404
-                    and LivySessionManager.livy_global_session is not None
-                ):
-                    LivySessionManager.livy_global_session.is_new_session_required = True
-                    logger.debug(
-                        "Livy statement poll exhausted 404 retries — flagging session for reconnect"
-                    )
-                raise DbtRuntimeError(
-                    f"Livy statement poll failed (HTTP {poll_res.status_code}): {poll_res.text}"
-                )
-            consecutive_failures = 0
-            res = poll_res.json()
-            if "state" not in res:
-                raise DbtRuntimeError(
-                    f"Livy statement poll returned unexpected response (missing 'state'): {res}"
+        engine = livy_engine.get_engine()
+        statements_url = self.connect_url + "/sessions/" + self.session_id + "/statements"
+        registry = statement_registry.get_registry(self.credential)
+        with (
+            registry.consuming(self._fingerprint),
+            self.in_flight.track(statements_url, json_res["id"], self.credential, self._headers),
+        ):
+            return engine.run(
+                engine.wait_statement(
+                    statements_url,
+                    json_res["id"],
+                    self.credential,
+                    headers=self._headers,
+                    label="Livy",
+                    on_not_found=_flag_session_for_reconnect,
                 )
+            )
 
-            if res["state"] == "available":
-                return res
-            elif res["state"] in ("error", "cancelled", "cancelling"):
-                error_msg = res.get("output", {}).get("evalue", "Unknown error")
-                raise DbtDatabaseError(
-                    f"Statement {statement_id} failed with state '{res['state']}': {error_msg}"
-                )
-            time.sleep(_poll_interval)
-            _poll_interval = min(_poll_interval * 1.5, _poll_interval_cap)
+    def _headers(self) -> dict[str, str]:
+        return _get_headers(self.credential, False)
 
     def execute(self, sql: str, *parameters: Any) -> None:
         if len(parameters) > 0:
-            sql = sql % parameters
+            sql = sql_binding.bind(sql, parameters)
 
         # Reset fetch position for the new query
         self._fetch_index = 0
@@ -645,6 +520,33 @@ class LivyCursor:
 
             raise DbtDatabaseError("Error while executing query: " + res["output"]["evalue"])
 
+    def execute_batch(self, statements: list[str]) -> list[dict]:
+        """Run ``statements`` in order as one ``pyspark`` statement on the session."""
+        statements = [self._getLivySQL(sql) for sql in statements]
+        self._fetch_index = 0
+        self._rows = []
+        self._schema = []
+        res = self._getLivyResult(
+            self._submitLivyCode(batch.build_script(statements), kind="pyspark")
+        )
+        logger.debug(res)
+        return batch.parse_results(res, statements)
+
+    def execute_code(self, code: str, kind: str = "pyspark") -> dict:
+        """Run ``code`` as one statement of ``kind`` on the session; return its body."""
+        self._fetch_index = 0
+        self._rows = []
+        self._schema = []
+        res = self._getLivyResult(self._submitLivyCode(code, kind=kind))
+        logger.debug(f"{kind} statement {res.get('id')}: {res.get('output')}")
+        return res
+
+    def execute_parallel(self, statements: list[str], repls: int) -> int:
+        """Run ``statements`` one after another; a singleton session has one REPL."""
+        for sql in statements:
+            self.execute(sql)
+        return 1
+
     def fetchall(self):
         return self._rows
 
@@ -687,6 +589,10 @@ class LivyConnection:
     def get_session_id(self) -> str:
         return self.session_id
 
+    @property
+    def in_flight(self) -> livy_engine.InFlightStatements:
+        return self._cursor.in_flight
+
     def get_headers(self) -> dict[str, str]:
         return _get_headers(self.credential, False)
 
@@ -865,7 +771,7 @@ class LivySessionManager(LivyBackend):
         if credentials.create_shortcuts:
             try:
                 shortcut_client = ShortcutClient(
-                    _livy_helpers.accessToken.token,
+                    _livy_helpers.get_access_token(credentials).token,
                     credentials.workspaceid,
                     credentials.lakehouseid,
                     credentials.endpoint,
@@ -924,8 +830,13 @@ class LivySessionConnectionWrapper(object):
         self._cursor = self.handle.cursor()
         return self
 
+    @property
+    def in_flight(self) -> livy_engine.InFlightStatements:
+        return self.handle.in_flight
+
     def cancel(self):
-        logger.debug("NotImplemented: cancel")
+        """Cancel this connection's in-flight statements on the Livy session."""
+        self.handle.in_flight.cancel_all()
 
     def close(self):
         self.handle.close()
@@ -943,29 +854,21 @@ class LivySessionConnectionWrapper(object):
         return self._cursor.fetchone()
 
     def execute(self, sql, bindings=None):
-        if sql.strip().endswith(";"):
-            sql = sql.strip()[:-1]
-
+        sql = sql_lexer.strip_terminator(sql)
         if bindings is None:
             self._cursor.execute(sql)
         else:
-            bindings = [self._fix_binding(binding) for binding in bindings]
             self._cursor.execute(sql, *bindings)
 
+    def execute_batch(self, statements):
+        return self._cursor.execute_batch(statements)
+
+    def execute_code(self, code, kind="pyspark"):
+        return self._cursor.execute_code(code, kind)
+
+    def execute_parallel(self, statements, repls):
+        return self._cursor.execute_parallel(statements, repls)
+
     @property
     def description(self):
         return self._cursor.description
-
-    @classmethod
-    def _fix_binding(cls, value) -> float | str:
-        """Convert complex datatypes to primitives that can be loaded by
-        the Spark driver"""
-        if isinstance(value, NUMBERS):
-            return float(value)
-        elif isinstance(value, dt.datetime):
-            return f"'{value.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}'"
-        elif value is None:
-            return "''"
-        else:
-            escaped = str(value).replace("'", "\\'")
-            return f"'{escaped}'"
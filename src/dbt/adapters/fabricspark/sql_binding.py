@@ -0,0 +1,176 @@
+"""Bind parameter values into SQL text before it is submitted to Livy.
+
+Livy has no server-side parameter binding, so bound statements (seed inserts
+above all) are rendered client side. That used to mean a Python conversion
+per value followed by ``sql % parameters``: a full format pass over templates
+holding up to 6000 ``%s`` placeholders, which also failed on any other ``%``
+in the SQL (``like 'a%'``, ``a % b``).
+
+A :class:`BindingPlan` splits a template at its placeholders once; every seed
+batch of the same shape reuses it through :func:`compile_plan`. Rendering
+converts all values with a per-type converter table and assembles the
+statement with a single ``join``.
+
+Placeholders are ``%s`` outside string literals, backtick identifiers and
+comments; ``%%`` there renders as ``%`` and any other ``%`` is left alone.
+Strings are escaped for Spark SQL literals, which process backslash escapes:
+backslashes are doubled and single quotes escaped, everything else
+(including non-ASCII text) is kept verbatim.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import decimal
+import functools
+import math
+import re
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from dbt_common.exceptions import DbtRuntimeError
+
+_TOKEN = re.compile(
+    r"""'[^'\\]*(?:\\.[^'\\]*)*'?"""
+    r"""|"[^"\\]*(?:\\.[^"\\]*)*"?"""
+    r"""|`[^`]*`?"""
+    r"""|--[^\n]*"""
+    r"""|/\*.*?(?:\*/|$)"""
+    r"""|%[%s]""",
+    re.DOTALL,
+)
+
+
+class BindingPlan:
+    """A statement template split at its placeholders."""
+
+    __slots__ = ("chunks",)
+
+    def __init__(self, template: str) -> None:
+        chunks: List[str] = []
+        current: List[str] = []
+        pos = 0
+        for m in _TOKEN.finditer(template):
+            token = m.group()
+            if token == "%s":
+                current.append(template[pos : m.start()])
+                chunks.append("".join(current))
+                current = []
+                pos = m.end()
+            elif token == "%%":
+                current.append(template[pos : m.start()] + "%")
+                pos = m.end()
+        current.append(template[pos:])
+        chunks.append("".join(current))
+        self.chunks: Tuple[str, ...] = tuple(chunks)
+
+    @property
+    def placeholders(self) -> int:
+        return len(self.chunks) - 1
+
+    def render(self, values: Sequence[Any]) -> str:
+        if len(values) != self.placeholders:
+            raise DbtRuntimeError(
+                f"Statement has {self.placeholders} placeholders but "
+                f"{len(values)} bindings were given"
+            )
+        if not values:
+            return self.chunks[0]
+        parts: List[str] = [""] * (2 * len(values) + 1)
+        parts[0::2] = self.chunks
+        parts[1::2] = literals(values)
+        return "".join(parts)
+
+
+@functools.lru_cache(maxsize=64)
+def compile_plan(template: str) -> BindingPlan:
+    return BindingPlan(template)
+
+
+def bind(sql: str, values: Sequence[Any]) -> str:
+    """Return ``sql`` with its placeholders replaced by ``values`` as SQL literals."""
+    return compile_plan(sql).render(values)
+
+
+def _string(value: str) -> str:
+    if "'" in value or "\\" in value:
+        value = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{value}'"
+
+
+def _text(value: Any) -> str:
+    return _string(str(value))
+
+
+def _none(value: None) -> str:
+    # Empty CSV cells have always been loaded as '' and cast from there.
+    return "''"
+
+
+def _bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _int(value: int) -> str:
+    return str(int(value))
+
+
+def _float(value: float) -> str:
+    if math.isfinite(value):
+        return repr(float(value))
+    return "'NaN'" if math.isnan(value) else ("'Infinity'" if value > 0 else "'-Infinity'")
+
+
+def _decimal(value: decimal.Decimal) -> str:
+    if value.is_finite():
+        return format(value, "f")
+    return _float(float(value))
+
+
+def _datetime(value: dt.datetime) -> str:
+    return f"'{value.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}'"
+
+
+# Checked in order for types not yet in ``_CONVERTERS``; bool before int.
+_BY_BASE: Tuple[Tuple[type, Callable[[Any], str]], ...] = (
+    (type(None), _none),
+    (bool, _bool),
+    (int, _int),
+    (float, _float),
+    (decimal.Decimal, _decimal),
+    (dt.datetime, _datetime),
+    (str, _string),
+)
+_CONVERTERS: Dict[type, Callable[[Any], str]] = {int: repr, str: _string}
+
+
+def converter_for(kind: type) -> Callable[[Any], str]:
+    """Return the literal renderer for values of exactly type ``kind``."""
+    return _CONVERTERS.get(kind) or _converter(kind)
+
+
+def _converter(kind: type) -> Callable[[Any], str]:
+    for base, converter in _BY_BASE:
+        if issubclass(kind, base):
+            break
+    else:
+        converter = _text
+    _CONVERTERS[kind] = converter
+    return converter
+
+
+def literal(value: Any) -> str:
+    """Render one value as a Spark SQL literal."""
+    kind = type(value)
+    return (_CONVERTERS.get(kind) or _converter(kind))(value)
+
+
+def literals(values: Sequence[Any]) -> List[str]:
+    """Render every value in ``values`` as a Spark SQL literal."""
+    get = _CONVERTERS.get
+    # Seed batches are mostly strings and empty cells; keep those inline.
+    return [
+        "''"
+        if v is None
+        else (_string(v) if type(v) is str else (get(type(v)) or _converter(type(v)))(v))
+        for v in values
+    ]
@@ -0,0 +1,134 @@
+"""Single-pass lexer for the SQL text the cursors submit to Livy.
+
+Every statement used to go through ``re.sub(r"\\s*/\\*(.|\\n)*?\\*/\\s*", ...)``,
+whose per-character alternation backtracks heavily on multi-megabyte compiled
+models and which also removed ``/*`` sequences inside string literals. This
+module walks the text once instead:
+
+- string literals (``'...'``, ``"..."``, with backslash escapes, and raw
+  ``r'...'``) and backtick identifiers are copied verbatim;
+- ``/* ... */`` comments (nested, as Spark allows) are replaced, together with
+  the whitespace around them, by a single newline. Optimizer hints
+  (``/*+ ... */``) are kept;
+- ``--`` comments are dropped up to the end of the line;
+- top-level ``;`` separators are recorded so the text can be split into
+  statements or have its trailing semicolons removed.
+
+Runs of ordinary text and literals are consumed by one compiled pattern
+without nested ambiguity, so the cost stays linear in the input size.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, Tuple
+
+# Everything that is neither a comment start nor a ``;``: plain text, string
+# literals and quoted identifiers. Unterminated literals run to the end.
+_PLAIN = re.compile(
+    r"""(?:[^'"`;/\-]+"""
+    r"""|(?<![rR])'[^'\\]*(?:\\.[^'\\]*)*'?"""
+    r"""|(?<![rR])"[^"\\]*(?:\\.[^"\\]*)*"?"""
+    r"""|(?<=[rR])'[^']*'?"""
+    r"""|(?<=[rR])"[^"]*"?"""
+    r"""|`[^`]*`?"""
+    r"""|-(?!-)|/(?!\*))*""",
+    re.DOTALL,
+)
+# A non-hint block comment without nesting, plus the whitespace after it.
+_BLOCK = re.compile(r"/\*(?!\+)[^*]*\*+(?:[^/*][^*]*\*+)*/\s*")
+_BLOCK_DELIMITER = re.compile(r"/\*|\*/")
+_WHITESPACE = re.compile(r"\s*")
+
+
+def _block_end(sql: str, start: int) -> int:
+    """Return the offset just past the comment opened at ``start``, or -1."""
+    depth = 0
+    pos = start
+    while True:
+        m = _BLOCK_DELIMITER.search(sql, pos)
+        if m is None:
+            return -1
+        depth += 1 if m.group() == "/*" else -1
+        pos = m.end()
+        if depth == 0:
+            return pos
+
+
+def _scan(sql: str) -> Tuple[List[str], List[int]]:
+    """Return the comment-free pieces of ``sql`` and the indexes of ``;`` pieces."""
+    pieces: List[str] = []
+    separators: List[int] = []
+    pos, end = 0, len(sql)
+    while pos < end:
+        stop = _PLAIN.match(sql, pos).end()
+        if stop > pos:
+            pieces.append(sql[pos:stop])
+            pos = stop
+            if pos >= end:
+                break
+        if sql.startswith("--", pos):
+            newline = sql.find("\n", pos)
+            pos = end if newline < 0 else newline
+        elif sql.startswith("/*", pos):
+            m = _BLOCK.match(sql, pos)
+            if m is not None and "/*" not in sql[pos + 2 : m.end()]:
+                if pieces:
+                    pieces[-1] = pieces[-1].rstrip()
+                pieces.append("\n")
+                pos = m.end()
+                continue
+            close = _block_end(sql, pos)
+            if close < 0:
+                # Unterminated: leave it for Spark to report.
+                pieces.append(sql[pos:])
+                break
+            if sql.startswith("/*+", pos):
+                pieces.append(sql[pos:close])
+                pos = close
+            else:
+                if pieces:
+                    pieces[-1] = pieces[-1].rstrip()
+                pieces.append("\n")
+                pos = _WHITESPACE.match(sql, close).end()
+        elif sql[pos] == ";":
+            separators.append(len(pieces))
+            pieces.append(";")
+            pos += 1
+        else:
+            # A lone backslash ending an unterminated literal.
+            pieces.append(sql[pos])
+            pos += 1
+    return pieces, separators
+
+
+def strip_comments(sql: str) -> str:
+    """Return ``sql`` without comments and surrounding whitespace."""
+    pieces, _ = _scan(sql)
+    return "".join(pieces).strip()
+
+
+def strip_terminator(sql: str) -> str:
+    """Return ``sql`` without surrounding whitespace and trailing ``;`` separators."""
+    code = sql.strip()
+    while code.endswith(";"):
+        code = code[:-1].rstrip()
+    return code
+
+
+def clean_statement(sql: str) -> str:
+    """Return a single statement ready to submit: no comments, no trailing ``;``."""
+    return strip_terminator(strip_comments(sql))
+
+
+def split_statements(sql: str) -> List[str]:
+    """Split a script on top-level ``;`` into cleaned, non-empty statements."""
+    pieces, separators = _scan(sql)
+    statements = []
+    start = 0
+    for index in separators + [len(pieces)]:
+        statement = "".join(pieces[start:index]).strip()
+        if statement:
+            statements.append(statement)
+        start = index + 1
+    return statements
@@ -0,0 +1,408 @@
+"""Shared background poller for in-flight Livy statements.
+
+Every dbt thread used to run its own ``GET .../statements/{id}`` + ``sleep``
+loop. :class:`StatementPoller` owns all in-flight statements instead: a single
+scheduler thread tracks when each statement is next due, refreshes due
+statements, and resolves a :class:`concurrent.futures.Future` per statement
+once it reaches a terminal state. The submitting thread simply blocks on that
+future.
+
+Statements that share a statements collection (several dbt threads on one
+singleton Livy session, for instance) are refreshed together with one
+``GET .../statements?from=&size=`` list call instead of one GET each.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark import _http_utils
+from dbt.adapters.fabricspark._http_utils import parse_retry_after
+from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+from dbt.adapters.fabricspark.retry_policy import get_retry_policy
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+MAX_POLL_RETRIES = 30
+# 404 can appear transiently right after submit before the statement id is
+# registered, or when the Fabric Livy service briefly loses track of the
+# session/statement. Retry with exponential backoff before giving up.
+MAX_NOT_FOUND_RETRIES = 20
+INITIAL_POLL_INTERVAL = 0.3
+# Upper bound on concurrent poll requests issued by the poller.
+POLL_WORKERS = 8
+
+_TRANSIENT_ERRORS = (
+    requests.exceptions.SSLError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+_FAILED_STATES = ("error", "cancelled", "cancelling")
+
+
+class StatementTimeoutError(DbtDatabaseError):
+    """A statement did not finish within ``statement_timeout``."""
+
+
+class _Watch:
+    """Polling state for one in-flight statement."""
+
+    def __init__(
+        self,
+        statements_url: str,
+        statement_id: Any,
+        credential: FabricSparkCredentials,
+        headers: Callable[[], Dict[str, str]],
+        label: str,
+        on_not_found: Optional[Callable[[], None]],
+    ) -> None:
+        self.statements_url = statements_url
+        self.statement_id = statement_id
+        self.credential = credential
+        self.headers = headers
+        self.label = label
+        self.on_not_found = on_not_found
+        self.future: Future = Future()
+        self.deadline = (
+            time.monotonic() + credential.statement_timeout
+            if credential.statement_timeout > 0
+            else None
+        )
+        policy = get_retry_policy()
+        self.retry = policy.start(f"{label} poll", statements_url, max_retries=MAX_POLL_RETRIES)
+        self.not_found = policy.start(
+            f"{label} poll 404", max_retries=MAX_NOT_FOUND_RETRIES, base=0.3, cap=5.0
+        )
+        self.interval = INITIAL_POLL_INTERVAL
+        self.interval_cap = max(credential.poll_statement_wait * 3, 1.5)
+        self.next_poll = time.monotonic()
+        # Set when the list endpoint did not return this statement; the next
+        # refresh falls back to the per-statement GET.
+        self.poll_individually = False
+
+    @property
+    def url(self) -> str:
+        return f"{self.statements_url}/{self.statement_id}"
+
+    def resolve(self, body: dict) -> None:
+        if not self.future.done():
+            self.future.set_result(body)
+
+    def fail(self, exc: Exception) -> None:
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+    def retry_in(self, seconds: float) -> None:
+        self.next_poll = time.monotonic() + seconds
+
+    def timed_out(self) -> bool:
+        return self.deadline is not None and time.monotonic() > self.deadline
+
+
+class StatementPoller:
+    """Background service that polls every in-flight Livy statement.
+
+    Submitters call :meth:`watch` (or :meth:`wait`) with the statements
+    collection URL and the id returned by the submit call. The scheduler
+    thread groups watches by collection URL; a group with two or more due
+    statements is refreshed via the list endpoint, otherwise the statement is
+    fetched directly. Retry, 404 and timeout semantics match the per-thread
+    poll loops this replaces.
+    """
+
+    def __init__(self, max_workers: int = POLL_WORKERS) -> None:
+        self._cond = threading.Condition()
+        self._groups: Dict[str, List[_Watch]] = {}
+        self._busy: set = set()
+        # Collections whose list endpoint rejected a ranged query; polled
+        # per-statement from then on.
+        self._no_list: set = set()
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self.request_count = 0
+
+    # ---- public API ------------------------------------------------------
+
+    def watch(
+        self,
+        statements_url: str,
+        statement_id: Any,
+        credential: FabricSparkCredentials,
+        headers: Callable[[], Dict[str, str]],
+        label: str = "Livy",
+        on_not_found: Optional[Callable[[], None]] = None,
+    ) -> Future:
+        """Register a submitted statement; the future resolves to its final body."""
+        watch = _Watch(statements_url, statement_id, credential, headers, label, on_not_found)
+        with self._cond:
+            self._ensure_started()
+            self._groups.setdefault(statements_url, []).append(watch)
+            self._cond.notify_all()
+        return watch.future
+
+    def wait(self, *args: Any, **kwargs: Any) -> dict:
+        """Blocking form of :meth:`watch`."""
+        return self.watch(*args, **kwargs).result()
+
+    def _count_request(self) -> None:
+        with self._cond:
+            self.request_count += 1
+
+    def in_flight(self) -> int:
+        with self._cond:
+            return sum(
+                1 for watches in self._groups.values() for w in watches if not w.future.done()
+            )
+
+    # ---- scheduler -------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="livy-poll"
+            )
+        self._thread = threading.Thread(
+            target=self._run, name="livy-statement-poller", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                batches = self._collect_due()
+                if not batches:
+                    self._cond.wait(timeout=self._next_wakeup())
+                    continue
+                self._busy.update(batches)
+            for url, watches in batches.items():
+                try:
+                    self._executor.submit(self._refresh_group, url, watches)
+                except RuntimeError as ex:
+                    # Interpreter shutdown: nothing can be polled any more.
+                    for watch in watches:
+                        watch.fail(DbtRuntimeError(f"Livy statement poller stopped: {ex}"))
+                    return
+
+    def _collect_due(self) -> Dict[str, List[_Watch]]:
+        now = time.monotonic()
+        batches: Dict[str, List[_Watch]] = {}
+        for url, watches in list(self._groups.items()):
+            for w in watches:
+                if w.timed_out():
+                    w.fail(self._timeout_error(w))
+            live = [w for w in watches if not w.future.done()]
+            if not live:
+                del self._groups[url]
+                continue
+            self._groups[url] = live
+            if url in self._busy:
+                continue
+            due = [w for w in live if w.next_poll <= now]
+            if due:
+                batches[url] = due
+        return batches
+
+    def _next_wakeup(self) -> Optional[float]:
+        pending = [
+            w.next_poll
+            for url, watches in self._groups.items()
+            if url not in self._busy
+            for w in watches
+        ]
+        if not pending:
+            return None
+        return max(min(pending) - time.monotonic(), 0.01)
+
+    def _refresh_group(self, url: str, watches: List[_Watch]) -> None:
+        try:
+            batched = [w for w in watches if not w.poll_individually]
+            if len(batched) >= 2 and url not in self._no_list:
+                handled = self._refresh_via_list(url, batched)
+                watches = [w for w in watches if w not in handled]
+            for watch in watches:
+                watch.poll_individually = False
+                self._refresh_one(watch)
+        except Exception as ex:
+            for watch in watches:
+                watch.fail(ex)
+        finally:
+            with self._cond:
+                self._busy.discard(url)
+                self._cond.notify_all()
+
+    def _refresh_via_list(self, url: str, watches: List[_Watch]) -> List[_Watch]:
+        """Refresh ``watches`` with one list call; return the watches it handled."""
+        ids = [int(w.statement_id) for w in watches]
+        params = {"from": min(ids), "size": max(ids) - min(ids) + 1}
+        try:
+            self._count_request()
+            resp = _http_utils.get(
+                url,
+                params=params,
+                headers=watches[0].headers(),
+                timeout=watches[0].credential.http_timeout,
+            )
+        except _TRANSIENT_ERRORS as exc:
+            for watch in watches:
+                self._on_transient(watch, exc)
+            return watches
+        if resp.status_code == 429 or resp.status_code >= 500:
+            for watch in watches:
+                self._on_status(watch, resp)
+            return watches
+        if resp.status_code >= 400:
+            logger.debug(
+                f"Livy statement list returned HTTP {resp.status_code}; "
+                "falling back to per-statement polling"
+            )
+            self._no_list.add(url)
+            return []
+        try:
+            listed = {
+                str(body.get("id")): body for body in resp.json().get("statements", []) or []
+            }
+        except ValueError:
+            return []
+        handled = []
+        for watch in watches:
+            body = listed.get(str(watch.statement_id))
+            if body is None:
+                watch.poll_individually = True
+                continue
+            handled.append(watch)
+            self._on_body(watch, body)
+        return handled
+
+    def _refresh_one(self, watch: _Watch) -> None:
+        if watch.timed_out():
+            watch.fail(self._timeout_error(watch))
+            return
+        try:
+            self._count_request()
+            resp = _http_utils.get(
+                watch.url,
+                headers=watch.headers(),
+                timeout=watch.credential.http_timeout,
+            )
+        except _TRANSIENT_ERRORS as exc:
+            self._on_transient(watch, exc)
+            return
+        if resp.status_code == 429 or resp.status_code >= 400:
+            self._on_status(watch, resp)
+            return
+        try:
+            body = resp.json()
+        except ValueError as exc:
+            self._on_transient(watch, exc)
+            return
+        self._on_body(watch, body)
+
+    # ---- outcome handling ------------------------------------------------
+
+    def _on_transient(self, watch: _Watch, exc: Exception) -> None:
+        watch.retry.record_failure()
+        if watch.retry.exhausted():
+            watch.fail(
+                DbtRuntimeError(
+                    f"{watch.label} statement poll failed after {watch.retry.attempts} retries "
+                    f"({type(exc).__name__}: {exc})"
+                )
+            )
+            return
+        wait = watch.retry.next_delay()
+        logger.debug(
+            f"{watch.label} statement poll got transient network error "
+            f"({type(exc).__name__}: {exc}), retrying in {wait:.1f}s "
+            f"(retry {watch.retry.attempts}/{watch.retry.max_retries})"
+        )
+        watch.retry_in(wait)
+
+    def _on_status(self, watch: _Watch, resp: requests.Response) -> None:
+        status = resp.status_code
+        if status == 429 or status >= 500:
+            if status >= 500:
+                watch.retry.record_failure()
+            if watch.retry.exhausted():
+                watch.fail(
+                    DbtRuntimeError(
+                        f"{watch.label} statement poll failed after {watch.retry.attempts} "
+                        f"retries (HTTP {status}): {resp.text}"
+                    )
+                )
+                return
+            wait = watch.retry.next_delay(parse_retry_after(resp) if status == 429 else 0)
+            logger.debug(
+                f"{watch.label} statement poll got HTTP {status}, retrying in {wait:.1f}s "
+                f"(retry {watch.retry.attempts}/{watch.retry.max_retries})"
+            )
+            watch.retry_in(wait)
+            return
+        if status == 404 and not watch.not_found.exhausted():
+            wait = watch.not_found.next_delay()
+            logger.debug(
+                f"{watch.label} statement poll got HTTP 404, retrying in {wait:.2f}s "
+                f"(not-found retry {watch.not_found.attempts}/{watch.not_found.max_retries})"
+            )
+            watch.retry_in(wait)
+            return
+        if status == 404 and watch.on_not_found is not None:
+            watch.on_not_found()
+        watch.fail(
+            DbtRuntimeError(f"{watch.label} statement poll failed (HTTP {status}): {resp.text}")
+        )
+
+    def _on_body(self, watch: _Watch, body: Any) -> None:
+        watch.retry.record_success()
+        if not isinstance(body, dict) or "state" not in body:
+            watch.fail(
+                DbtRuntimeError(
+                    f"{watch.label} statement poll returned unexpected response "
+                    f"(missing 'state'): {body}"
+                )
+            )
+            return
+        state = body["state"]
+        if state == "available":
+            watch.resolve(body)
+            return
+        if state in _FAILED_STATES:
+            error_msg = body.get("output", {}).get("evalue", "Unknown error")
+            watch.fail(
+                DbtDatabaseError(
+                    f"Statement {watch.statement_id} failed with state '{state}': {error_msg}"
+                )
+            )
+            return
+        watch.retry_in(watch.interval)
+        watch.interval = min(watch.interval * 1.5, watch.interval_cap)
+
+    @staticmethod
+    def _timeout_error(watch: _Watch) -> StatementTimeoutError:
+        return StatementTimeoutError(
+            f"Timeout ({watch.credential.statement_timeout}s) waiting for statement "
+            f"{watch.statement_id} to complete. Increase `statement_timeout` in profiles.yml."
+        )
+
+
+_poller_lock = threading.Lock()
+_poller: Optional[StatementPoller] = None
+
+
+def get_poller() -> StatementPoller:
+    """Return the process-wide :class:`StatementPoller`, creating it on first use."""
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = StatementPoller()
+        return _poller
@@ -0,0 +1,296 @@
+"""Client-side statement fingerprints so resubmissions reattach instead of re-running.
+
+Every statement the cursors submit carries a fingerprint (SHA-256 of its
+code) plus a per-submission nonce, appended as a trailing ``--`` comment. Two
+situations used to run the same heavy statement twice:
+
+- a submit POST that timed out on the client after Livy had accepted it was
+  simply POSTed again; :meth:`LivyEngine.submit_statement` now lists the
+  statements collection first and reattaches to the one carrying its marker;
+- a dbt-level retry (``add_query``) or a re-invoked dbt run re-executed SQL
+  whose statement was still running. Submitted statements are recorded here
+  until their result has been consumed, so the cursor waits on the existing
+  statement instead.
+
+Records belong to the thread and process that submitted them, one per
+thread: identical SQL submitted concurrently by two dbt threads, or by two dbt
+processes, runs twice as it should, and a thread's next submission replaces
+whatever an earlier one left behind. A thread reattaches to its own statement
+while it is ``waiting``/``running``; a finished (``available``) one only when
+the same SQL is retried within ``RETRY_WINDOW_SECONDS`` of the poll that broke,
+so later runs of identical SQL (``refresh table``, audit inserts in hooks)
+execute again. Records live in SQLite, in memory or, with
+``statement_registry_file``, in that file (``0600``), so concurrent dbt
+processes share it without losing each other's records and the next dbt
+invocation can find a statement that is still running; it only adopts the
+statements of processes that are no longer alive.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark import _http_utils
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+MARKER_PREFIX = "-- dbt-fabricspark statement "
+RUNNING_STATES = ("waiting", "running")
+# Records older than this are dropped; no statement outlives it.
+MAX_RECORD_AGE_SECONDS = 24 * 60 * 60
+# How long after its poll broke a finished statement may still be reattached.
+RETRY_WINDOW_SECONDS = 120
+
+_SCHEMA = """create table if not exists statements (
+    owner text primary key,
+    fingerprint text not null,
+    url text not null,
+    id integer not null,
+    pid integer not null,
+    submitted real not null,
+    kept real
+)"""
+
+
+def fingerprint(code: str) -> str:
+    return hashlib.sha256(code.encode("utf-8")).hexdigest()[:32]
+
+
+def tag(code: str, statement_fingerprint: str) -> Tuple[str, str]:
+    """Return ``(tagged_code, marker)`` with a fresh per-submission nonce."""
+    marker = f"{MARKER_PREFIX}{statement_fingerprint}:{uuid.uuid4().hex[:12]}"
+    return f"{code}\n{marker}", marker
+
+
+def _owner_key() -> str:
+    return f"{os.getpid()}:{threading.get_ident()}"
+
+
+def _pid_alive(pid: Any) -> bool:
+    """Whether process ``pid`` may still be running; unknown counts as alive."""
+    if not isinstance(pid, int) or pid <= 0 or sys.platform == "win32":
+        # os.kill(pid, 0) terminates the process on Windows.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def find_tagged(statements: Any, marker: str) -> Optional[dict]:
+    """Return the statement in a Livy list body whose code ends with ``marker``."""
+    for statement in statements or []:
+        if isinstance(statement, dict) and str(statement.get("code", "")).endswith(marker):
+            return statement
+    return None
+
+
+class StatementRegistry:
+    """Submitted statements whose result has not been consumed yet."""
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = os.path.expanduser(path) if path else None
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            if self.path is None:
+                db = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+            else:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                db = sqlite3.connect(
+                    self.path, timeout=5, check_same_thread=False, isolation_level=None
+                )
+                os.chmod(self.path, 0o600)
+            db.row_factory = sqlite3.Row
+            db.execute(_SCHEMA)
+            self._db = db
+        return self._db
+
+    def _run(self, action: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run ``action`` in one write transaction; a failure is logged and returns None."""
+        with self._lock:
+            try:
+                db = self._connect()
+                db.execute("begin immediate")
+                try:
+                    result = action(db)
+                except BaseException:
+                    db.execute("rollback")
+                    raise
+                db.execute("commit")
+                return result
+            except (OSError, sqlite3.Error) as ex:
+                logger.debug(f"Unable to use statement registry {self.path or ':memory:'}: {ex}")
+                return None
+
+    def record(self, statement_fingerprint: str, statements_url: str, statement_id: Any) -> None:
+        """Record a statement submitted by the calling thread, replacing its previous one."""
+
+        def record(db: sqlite3.Connection) -> None:
+            now = time.time()
+            db.execute(
+                "delete from statements where submitted < ?", (now - MAX_RECORD_AGE_SECONDS,)
+            )
+            db.execute(
+                "insert or replace into statements "
+                "(owner, fingerprint, url, id, pid, submitted, kept) "
+                "values (?, ?, ?, ?, ?, ?, null)",
+                (
+                    _owner_key(),
+                    statement_fingerprint,
+                    statements_url,
+                    statement_id,
+                    os.getpid(),
+                    now,
+                ),
+            )
+
+        self._run(record)
+
+    def lookup(self, statement_fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return the calling thread's record for ``statement_fingerprint``."""
+        row = self._run(
+            lambda db: db.execute(
+                "select * from statements where owner = ? and fingerprint = ?",
+                (_owner_key(), statement_fingerprint),
+            ).fetchone()
+        )
+        return dict(row) if row is not None else None
+
+    def forget(self, statement_fingerprint: str) -> None:
+        self._run(
+            lambda db: db.execute(
+                "delete from statements where owner = ? and fingerprint = ?",
+                (_owner_key(), statement_fingerprint),
+            )
+        )
+
+    def _keep(self, statement_fingerprint: str) -> None:
+        """Start the retry window of a record whose poll broke."""
+        self._run(
+            lambda db: db.execute(
+                "update statements set kept = ? where owner = ? and fingerprint = ?",
+                (time.time(), _owner_key(), statement_fingerprint),
+            )
+        )
+
+    def _claim(self, statement_fingerprint: str, statements_url: str) -> Optional[Dict[str, Any]]:
+        """Return the record to reattach to: the thread's own, else an orphaned one.
+
+        An orphan (its process is gone) is moved under the calling thread so
+        that consuming the result forgets it.
+        """
+        own = _owner_key()
+
+        def claim(db: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+            entry = db.execute("select * from statements where owner = ?", (own,)).fetchone()
+            if entry is not None and entry["fingerprint"] == statement_fingerprint:
+                return dict(entry) if entry["url"] == statements_url else None
+            candidates = db.execute(
+                "select * from statements where fingerprint = ? and url = ? and pid != ?",
+                (statement_fingerprint, statements_url, os.getpid()),
+            ).fetchall()
+            for candidate in candidates:
+                if not _pid_alive(candidate["pid"]):
+                    db.execute("delete from statements where owner = ?", (own,))
+                    db.execute(
+                        "update statements set owner = ? where owner = ?",
+                        (own, candidate["owner"]),
+                    )
+                    return dict(candidate)
+            return None
+
+        return self._run(claim)
+
+    @contextmanager
+    def consuming(self, statement_fingerprint: str) -> Iterator[None]:
+        """Forget the record once the wait inside the block settles the statement.
+
+        A result, a statement failure, a timeout or an interrupt settle it. Any
+        other error (the poll itself broke) keeps the record so a retry can
+        reattach to the statement, which may still be running.
+        """
+        try:
+            yield
+        except DbtDatabaseError:
+            self.forget(statement_fingerprint)
+            raise
+        except Exception:
+            self._keep(statement_fingerprint)
+            raise
+        except BaseException:
+            self.forget(statement_fingerprint)
+            raise
+        self.forget(statement_fingerprint)
+
+    def resume(
+        self,
+        statement_fingerprint: str,
+        statements_url: str,
+        credential: Any,
+        headers: Callable[[], Dict[str, str]],
+    ) -> Optional[dict]:
+        """Return the body of a recorded statement worth reattaching to, if any.
+
+        Only statements in ``statements_url`` submitted by the calling thread,
+        or by a process that has exited, qualify. A record whose statement
+        has gone or failed, or finished outside the retry window, is dropped
+        so the caller submits afresh.
+        """
+        entry = self._claim(statement_fingerprint, statements_url)
+        if entry is None:
+            return None
+        try:
+            resp = _http_utils.get(
+                f"{statements_url}/{entry['id']}",
+                headers=headers(),
+                timeout=credential.http_timeout,
+            )
+            body = resp.json() if resp.status_code < 400 else None
+        except Exception as ex:
+            logger.debug(f"Unable to look up statement {entry['id']} for reattach: {ex}")
+            return None
+        state = body.get("state") if isinstance(body, dict) else None
+        kept = entry.get("kept")
+        retrying = kept is not None and time.time() - kept <= RETRY_WINDOW_SECONDS
+        if state in RUNNING_STATES or (
+            state == "available" and entry.get("pid") == os.getpid() and retrying
+        ):
+            logger.debug(
+                f"Reattaching to statement {entry['id']} ({state}) instead of resubmitting"
+            )
+            return body
+        self.forget(statement_fingerprint)
+        return None
+
+
+_registries_lock = threading.Lock()
+_registries: Dict[Optional[str], StatementRegistry] = {}
+
+
+def get_registry(credentials: Any) -> StatementRegistry:
+    """Return the registry for ``credentials.statement_registry_file`` (in memory if unset)."""
+    path = credentials.statement_registry_file or None
+    with _registries_lock:
+        registry = _registries.get(path)
+        if registry is None:
+            registry = _registries[path] = StatementRegistry(path)
+        return registry
@@ -0,0 +1,174 @@
+"""Process-wide request throttling for Fabric REST endpoints.
+
+Fabric rate-limits per workspace. When each thread handles its own 429, the
+other N-1 threads keep hitting the endpoint and extend the throttle window.
+:class:`ThrottleCoordinator` keeps one adaptive token bucket per
+``(origin, workspace)``. Every request through the shared HTTP transport
+takes a token first, and a 429 from any thread pauses the whole bucket until
+the ``Retry-After`` deadline. After the pause the allowed rate restarts low
+and climbs back additively with each successful response.
+
+Threads block in :meth:`TokenBucket.acquire`; coroutines on the Livy engine
+loop await :meth:`TokenBucket.acquire_async` instead, so a paused bucket
+holds no executor thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+DEFAULT_MAX_RPS = 50.0
+# Floor for the adaptive rate after repeated throttling.
+MIN_RPS = 1.0
+# Minimum pause applied on a 429 that carries no usable Retry-After hint.
+MIN_PAUSE_SECONDS = 1.0
+
+_WORKSPACE_RE = re.compile(r"/workspaces/([^/]+)", re.IGNORECASE)
+
+
+class TokenBucket:
+    """Adaptive token bucket for one endpoint+workspace.
+
+    Rate is multiplicatively decreased on throttling and additively
+    increased on success (AIMD), bounded by ``[MIN_RPS, max_rps]``.
+    """
+
+    def __init__(self, max_rps: float) -> None:
+        self._lock = threading.Lock()
+        self.max_rps = max_rps
+        self.rate = max_rps
+        self.tokens = max_rps
+        self._updated = time.monotonic()
+        self.paused_until = 0.0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def _refill(self, now: float) -> None:
+        start = max(self._updated, self.paused_until)
+        if now > start:
+            self.tokens = min(self.rate, self.tokens + (now - start) * self.rate)
+        self._updated = now
+
+    def _take(self, waited: float) -> Optional[float]:
+        """Take a token and return None, or return how long to wait for one."""
+        with self._lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return self.paused_until - now
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.wait_seconds += waited
+                return None
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; return seconds spent waiting."""
+        waited = 0.0
+        while True:
+            wait = self._take(waited)
+            if wait is None:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self) -> float:
+        """Like :meth:`acquire`, but wait with ``asyncio.sleep`` on the running loop."""
+        waited = 0.0
+        while True:
+            wait = self._take(waited)
+            if wait is None:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def on_throttled(self, retry_after: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self.paused_until = max(self.paused_until, now + max(retry_after, MIN_PAUSE_SECONDS))
+            self.rate = max(self.rate / 4, MIN_RPS)
+            self.tokens = 0.0
+            self._updated = now
+            self.throttled += 1
+
+    def on_success(self) -> None:
+        if self.rate >= self.max_rps:
+            return
+        with self._lock:
+            self.rate = min(self.rate + max(self.max_rps / 100, 0.1), self.max_rps)
+
+
+class ThrottleCoordinator:
+    """Registry of :class:`TokenBucket` instances keyed by endpoint and workspace."""
+
+    def __init__(self, max_rps: float = DEFAULT_MAX_RPS) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self.max_rps = max_rps
+
+    def configure(self, max_rps: Optional[float]) -> None:
+        if not max_rps or max_rps <= 0:
+            return
+        with self._lock:
+            self.max_rps = max_rps
+            for bucket in self._buckets.values():
+                bucket.max_rps = max_rps
+                bucket.rate = min(bucket.rate, max_rps)
+
+    @staticmethod
+    def key_for(url: str) -> Tuple[str, str]:
+        parts = urlsplit(url)
+        match = _WORKSPACE_RE.search(parts.path)
+        return f"{parts.scheme}://{parts.netloc}", (match.group(1).lower() if match else "")
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        key = self.key_for(url)
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            return bucket
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.max_rps)
+                self._buckets[key] = bucket
+            return bucket
+
+    def before_request(self, url: str) -> None:
+        self.bucket_for(url).acquire()
+
+    async def before_request_async(self, url: str) -> None:
+        await self.bucket_for(url).acquire_async()
+
+    def after_response(self, url: str, status_code: int, retry_after: float = 0.0) -> None:
+        bucket = self.bucket_for(url)
+        if status_code == 429:
+            bucket.on_throttled(retry_after)
+            origin, workspace = self.key_for(url)
+            logger.debug(
+                f"HTTP 429 from {origin} (workspace {workspace or '-'}); pausing all "
+                f"requests for {max(retry_after, MIN_PAUSE_SECONDS):.0f}s, "
+                f"rate now {bucket.rate:.1f} req/s"
+            )
+        elif status_code < 400:
+            bucket.on_success()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            f"{origin} workspace={workspace or '-'}": {
+                "throttled": bucket.throttled,
+                "wait_seconds": round(bucket.wait_seconds, 2),
+                "rate": round(bucket.rate, 2),
+            }
+            for (origin, workspace), bucket in buckets.items()
+        }
@@ -0,0 +1,126 @@
+"""Optional file-backed access-token cache shared across dbt invocations.
+
+Acquiring a token with ``authentication: CLI`` shells out to ``az``, which
+costs 1-3 s per process. When ``token_cache_file`` is set in the profile,
+tokens are written to that JSON file (created with ``0600`` permissions,
+replaced atomically) keyed by a SHA-256 of scope + tenant + identity (for
+CLI auth, the account ``az`` is signed in with), and the
+next process reuses a token while it still has more than
+``MIN_REMAINING_SECONDS`` left. Any problem reading or writing the file falls
+back to a normal acquisition.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from azure.core.credentials import AccessToken
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.fabricspark.token_manager import (
+    REFRESH_AHEAD_SECONDS,
+    REFRESH_MARGIN_SECONDS,
+    TokenManager,
+)
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+# Tokens closer to expiry than this are not handed out from the file, so the
+# in-process background refresh still gets a genuinely new token.
+MIN_REMAINING_SECONDS = REFRESH_MARGIN_SECONDS + REFRESH_AHEAD_SECONDS
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, float] = {"hits": 0, "misses": 0, "saved_seconds": 0.0}
+
+
+def cache_key(credentials: Any, scope: str) -> str:
+    raw = json.dumps([scope, *TokenManager.key_for(credentials)])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _read(path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as ex:
+        logger.debug(f"Ignoring unreadable token cache {path}: {ex}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write(path: str, data: Dict[str, Dict[str, Any]]) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".token-cache-")
+    try:
+        os.chmod(tmp, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def get_or_acquire(
+    path: Optional[str],
+    credentials: Any,
+    scope: str,
+    acquire: Callable[[], AccessToken],
+) -> AccessToken:
+    """Return a cached token for ``credentials`` or call ``acquire`` and persist it."""
+    if not path:
+        return acquire()
+    path = os.path.expanduser(path)
+    key = cache_key(credentials, scope)
+    now = time.time()
+
+    entry = _read(path).get(key)
+    if isinstance(entry, dict) and entry.get("expires_on", 0) - now > MIN_REMAINING_SECONDS:
+        saved = float(entry.get("acquire_seconds", 0))
+        with _stats_lock:
+            _stats["hits"] += 1
+            _stats["saved_seconds"] += saved
+        logger.debug(
+            f"Reused access token from {path}; skipped token acquisition (saved ~{saved:.2f}s)"
+        )
+        return AccessToken(token=entry["token"], expires_on=int(entry["expires_on"]))
+
+    start = time.monotonic()
+    token = acquire()
+    elapsed = time.monotonic() - start
+    with _stats_lock:
+        _stats["misses"] += 1
+    try:
+        data = {
+            k: v
+            for k, v in _read(path).items()
+            if isinstance(v, dict) and v.get("expires_on", 0) > now
+        }
+        data[key] = {
+            "token": token.token,
+            "expires_on": token.expires_on,
+            "acquire_seconds": round(elapsed, 3),
+        }
+        _write(path, data)
+        logger.debug(f"Cached access token in {path} (acquisition took {elapsed:.2f}s)")
+    except OSError as ex:
+        logger.debug(f"Unable to write token cache {path}: {ex}")
+    return token
+
+
+def token_cache_stats() -> Dict[str, float]:
+    """Process-wide ``{hits, misses, saved_seconds}`` for the file token cache."""
+    with _stats_lock:
+        return {**_stats, "saved_seconds": round(_stats["saved_seconds"], 2)}
@@ -0,0 +1,171 @@
+"""Per-credential Azure access-token cache with proactive background refresh.
+
+Each distinct identity (authentication method, tenant, client id,
+``credential_class`` + kwargs, or for CLI auth the account ``az`` is signed
+in with) gets its own cache entry, so several
+profiles/targets in one process never share or overwrite a token. Entries are
+immutable and swapped atomically, which lets :meth:`TokenManager.headers`
+read them without taking a lock. A blocking fetch only happens when there is
+no token yet or the cached one is within ``REFRESH_MARGIN_SECONDS`` of
+expiry; otherwise a daemon timer refreshes the token ``REFRESH_AHEAD_SECONDS``
+before that point so no request pays the ``az``/MSAL latency.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+from azure.core.credentials import AccessToken
+
+from dbt.adapters.events.logging import AdapterLogger
+
+logger = AdapterLogger("Microsoft Fabric-Spark")
+
+# A cached token this close to expiry is refreshed inline before use.
+REFRESH_MARGIN_SECONDS = 5 * 60
+# Background refresh fires this long before the inline margin is reached.
+REFRESH_AHEAD_SECONDS = 10 * 60
+
+TokenKey = Tuple[str, str, str]
+
+# ((profile path, mtime), identity) of the last az profile read.
+_az_identity: Tuple[Tuple[str, int], str] = (("", 0), "")
+
+
+def az_cli_identity() -> str:
+    """Return the user and tenant ``az`` signs in with by default.
+
+    Read from the default subscription in ``azureProfile.json``, which
+    ``az login`` and ``az account set`` rewrite; the file is only parsed
+    again when its mtime changes. An unreadable profile yields its mtime, so
+    a change still moves CLI tokens to a new key.
+    """
+    global _az_identity
+    directory = os.environ.get("AZURE_CONFIG_DIR") or os.path.join("~", ".azure")
+    path = os.path.join(os.path.expanduser(directory), "azureProfile.json")
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return ""
+    cached = _az_identity
+    if cached[0] == (path, mtime):
+        return cached[1]
+    try:
+        with open(path, encoding="utf-8-sig") as f:
+            subscriptions = json.load(f).get("subscriptions") or []
+        default = next((sub for sub in subscriptions if sub.get("isDefault")), {})
+        user = default.get("user") or {}
+        identity = f"{user.get('type', '')}:{user.get('name', '')}@{default.get('tenantId', '')}"
+    except (OSError, ValueError, AttributeError) as ex:
+        logger.debug(f"Unable to read az profile {path}: {ex}")
+        identity = f"profile@{mtime}"
+    _az_identity = ((path, mtime), identity)
+    return identity
+
+
+class _Entry(NamedTuple):
+    token: AccessToken
+    headers: Dict[str, str]
+
+
+class TokenManager:
+    """Cache of :class:`AccessToken` instances keyed by credential identity."""
+
+    def __init__(self, fetch: Callable[[Any], AccessToken]) -> None:
+        self._fetch = fetch
+        self._entries: Dict[TokenKey, _Entry] = {}
+        self._locks: Dict[TokenKey, threading.Lock] = {}
+        self._timers: Dict[TokenKey, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(credentials: Any) -> TokenKey:
+        auth = (credentials.authentication or "").lower()
+        if auth == "token_credential":
+            kwargs = credentials.credential_kwargs or {}
+            identity = f"{credentials.credential_class}:{sorted(kwargs.items())!r}"
+        elif auth == "cli":
+            identity = f"{credentials.client_id or ''}:{az_cli_identity()}"
+        else:
+            identity = credentials.client_id or ""
+        return auth, credentials.tenant_id or "", identity
+
+    @staticmethod
+    def _fresh(entry: Optional[_Entry]) -> bool:
+        return entry is not None and entry.token.expires_on - time.time() > REFRESH_MARGIN_SECONDS
+
+    def get_token(self, credentials: Any) -> AccessToken:
+        entry = self._entries.get(self.key_for(credentials))
+        if self._fresh(entry):
+            return entry.token
+        return self._refresh(credentials).token
+
+    def headers(self, credentials: Any) -> Dict[str, str]:
+        """Return a copy of the cached ``Authorization`` headers for ``credentials``."""
+        entry = self._entries.get(self.key_for(credentials))
+        if not self._fresh(entry):
+            entry = self._refresh(credentials)
+        return dict(entry.headers)
+
+    def _key_lock(self, key: TokenKey) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _refresh(self, credentials: Any, background: bool = False) -> _Entry:
+        key = self.key_for(credentials)
+        with self._key_lock(key):
+            previous = self._entries.get(key)
+            # Another thread refreshed while we waited for the lock.
+            if self._fresh(previous) and not background:
+                return previous
+            token = self._fetch(credentials)
+            entry = _Entry(
+                token,
+                {"Content-Type": "application/json", "Authorization": f"Bearer {token.token}"},
+            )
+            self._entries[key] = entry
+        if previous is None or token.expires_on > previous.token.expires_on:
+            self._schedule(key, credentials, token.expires_on)
+        return entry
+
+    def _schedule(self, key: TokenKey, credentials: Any, expires_on: int) -> None:
+        delay = expires_on - REFRESH_MARGIN_SECONDS - REFRESH_AHEAD_SECONDS - time.time()
+        if delay <= 0:
+            return
+        timer = threading.Timer(delay, self._background_refresh, args=(key, credentials))
+        timer.daemon = True
+        with self._lock:
+            old = self._timers.get(key)
+            self._timers[key] = timer
+        if old is not None:
+            old.cancel()
+        timer.start()
+
+    def _background_refresh(self, key: TokenKey, credentials: Any) -> None:
+        try:
+            self._refresh(credentials, background=True)
+            logger.debug(f"Refreshed access token in the background for {key[0] or 'spn'} auth")
+        except Exception as ex:
+            # The inline path retries once the token enters the refresh margin.
+            logger.debug(f"Background token refresh failed: {ex}")
+
+    def invalidate(self, credentials: Any) -> None:
+        """Drop the cached token for ``credentials`` so the next read refetches."""
+        key = self.key_for(credentials)
+        with self._lock:
+            timer = self._timers.pop(key, None)
+            self._entries.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+    def clear(self) -> None:
+        with self._lock:
+            timers = list(self._timers.values())
+            self._timers.clear()
+            self._entries.clear()
+        for timer in timers:
+            timer.cancel()
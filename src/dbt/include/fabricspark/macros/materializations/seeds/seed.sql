@@ -37,26 +37,40 @@
 
   {{ run_hooks(pre_hooks, inside_transaction=True) }}
 
-  -- build model
-  {% set create_table_sql = "" %}
-  {% if exists_as_view %}
-    {#-- Fabric Spark: drop the stale view so we can seed a table in its place --#}
-    {{ log("Dropping view " ~ old_relation.render() ~ " to replace with seed table") }}
-    {% do adapter.drop_relation(old_relation) %}
-    {% set create_table_sql = create_csv_table(model, agate_table) %}
-  {% elif exists_as_table %}
-    {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation, agate_table) %}
+  {#-- Seeds whose data, column types and config match the hash recorded by the
+       previous load are left alone --#}
+  {%- set column_types = adapter.seed_column_types(agate_table, model['config'].get('column_types', {})) -%}
+  {%- set seed_hash = adapter.seed_content_hash(model, agate_table, column_types) -%}
+  {%- set unchanged = exists_as_table and not full_refresh_mode and adapter.seed_is_unchanged(old_relation, seed_hash) -%}
+
+  {% if unchanged %}
+    {{ log("Seed " ~ old_relation.render() ~ " is unchanged, skipping load") }}
+    {% call noop_statement('main', 'NO-OP', 'NO-OP', 0) %}
+      -- {{ this.render() }} is unchanged since its last load
+    {% endcall %}
   {% else %}
-    {% set create_table_sql = create_csv_table(model, agate_table) %}
-  {% endif %}
+    -- build model
+    {% set create_table_sql = "" %}
+    {% if exists_as_view %}
+      {#-- Fabric Spark: drop the stale view so we can seed a table in its place --#}
+      {{ log("Dropping view " ~ old_relation.render() ~ " to replace with seed table") }}
+      {% do adapter.drop_relation(old_relation) %}
+      {% set create_table_sql = create_csv_table(model, agate_table) %}
+    {% elif exists_as_table %}
+      {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation, agate_table) %}
+    {% else %}
+      {% set create_table_sql = create_csv_table(model, agate_table) %}
+    {% endif %}
 
-  {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
-  {% set rows_affected = (agate_table.rows | length) %}
-  {% set sql = load_csv_rows(model, agate_table) %}
+    {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
+    {% set rows_affected = (agate_table.rows | length) %}
+    {% set sql = load_csv_rows(model, agate_table) %}
+    {% do adapter.record_seed_hash(this, seed_hash) %}
 
-  {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
-    {{ get_csv_sql(create_table_sql, sql) }};
-  {% endcall %}
+    {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
+      {{ get_csv_sql(create_table_sql, sql) }};
+    {% endcall %}
+  {% endif %}
 
   {% set target_relation = this.incorporate(type='table') %}
 
@@ -107,8 +121,30 @@
 
 {% macro fabricspark__load_csv_rows(model, agate_table) %}
 
-  {% set batch_size = calc_batch_size(agate_table.column_names|length) %}
   {% set column_override = model['config'].get('column_types', {}) %}
+  {#-- Infer each column's type once, not once per cell of every batch --#}
+  {% set column_types = adapter.seed_column_types(agate_table, column_override) %}
+
+  {#-- Large seeds are staged in the Spark driver and inserted in one statement --#}
+  {% if adapter.use_bulk_seed_load(agate_table) %}
+      {{ log("Bulk loading " ~ (agate_table.rows | length) ~ " records") }}
+      {{ return(adapter.bulk_load_seed(this, agate_table, column_types)) }}
+  {% endif %}
+
+  {#-- With seed_parallel_repls, the VALUES batches run on several HC REPLs at once --#}
+  {% if adapter.use_parallel_seed_load(agate_table) %}
+      {{ log("Inserting " ~ (agate_table.rows | length) ~ " records on parallel REPLs") }}
+      {{ return(adapter.parallel_load_seed(this, agate_table, column_types)) }}
+  {% endif %}
+
+  {% set batch_size = calc_batch_size(agate_table.column_names|length) %}
+  {% set binding_char = get_binding_char() %}
+  {% set row_sql -%}
+      ({%- for type in column_types -%}
+          cast({{ binding_char }} as {{ type }})
+          {%- if not loop.last %},{% endif -%}
+      {%- endfor -%})
+  {%- endset %}
 
   {% set statements = [] %}
   {{ log("Inserting batches of " ~ batch_size ~ " records") }}
@@ -119,18 +155,7 @@
           {% do bindings.extend(row) %}
       {% endfor %}
 
-      {% set sql %}
-          insert into {{ this.render() }} values
-          {% for row in chunk -%}
-              ({%- for col_name in agate_table.column_names -%}
-                  {%- set inferred_type = adapter.convert_type(agate_table, loop.index0) -%}
-                  {%- set type = column_override.get(col_name, inferred_type) -%}
-                    cast({{ get_binding_char() }} as {{type}})
-                  {%- if not loop.last%},{%- endif %}
-              {%- endfor -%})
-              {%- if not loop.last%},{%- endif %}
-          {%- endfor %}
-      {% endset %}
+      {% set sql = "insert into " ~ this.render() ~ " values\n" ~ ([row_sql] * (chunk | length)) | join(",") %}
 
       {% do adapter.add_query(sql, bindings=bindings, abridge_sql_log=True) %}
 
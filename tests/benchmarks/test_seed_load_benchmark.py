@@ -0,0 +1,59 @@
+"""Compare the VALUES seed path with bulk loading at 1k / 100k / 1M rows.
+
+Both paths are measured client side: the Livy statements each would send and
+the time spent building them. Every statement also costs at least one submit
+and one poll round trip on the cluster, which the statement count stands for.
+The VALUES timing leaves out rendering the Jinja template for each batch.
+Run with ``python -m pytest tests/benchmarks -s`` to see the numbers.
+"""
+
+import time
+from decimal import Decimal
+
+import pytest
+
+from dbt.adapters.fabricspark import seed_loader, sql_binding
+
+COLUMNS = 10
+TYPES = ["bigint", "string", "double", "string", "boolean"] * 2
+
+
+def _rows(count):
+    return [
+        (i, f"name '{i}'", Decimal(i) / 4, None if i % 3 else "x", i % 2 == 0) * 2
+        for i in range(count)
+    ]
+
+
+def _values_path(rows):
+    batch_size = min(500, int(6000 / COLUMNS) - 1)
+    row_sql = "(" + ",".join(f"cast(%s as {t})" for t in TYPES) + ")"
+    statements = []
+    for start in range(0, len(rows), batch_size):
+        chunk = rows[start : start + batch_size]
+        template = "insert into lh.dbo.seed values " + ",".join([row_sql] * len(chunk))
+        statements.append(sql_binding.bind(template, [v for row in chunk for v in row]))
+    return statements
+
+
+def _bulk_path(rows):
+    return seed_loader.build_scripts("lh.dbo.seed", rows, TYPES)
+
+
+@pytest.mark.parametrize("count", [1_000, 100_000, 1_000_000])
+def test_bulk_path_sends_far_fewer_statements(count):
+    rows = _rows(count)
+    started = time.perf_counter()
+    values = _values_path(rows)
+    values_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    bulk = _bulk_path(rows)
+    bulk_seconds = time.perf_counter() - started
+
+    print(
+        f"\n{count} rows: VALUES {len(values)} statements, {sum(map(len, values)) / 1e6:.1f} MB, "
+        f"{values_seconds:.2f}s | bulk {len(bulk)} statements, "
+        f"{sum(map(len, bulk)) / 1e6:.1f} MB, {bulk_seconds:.2f}s"
+    )
+    assert len(bulk) * 50 < len(values) or count < 100_000
+    assert sum(map(len, bulk)) < sum(map(len, values))
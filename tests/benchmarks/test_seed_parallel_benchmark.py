@@ -0,0 +1,82 @@
+"""Time VALUES seed batches run on one REPL against several HC REPLs.
+
+Each statement is given a fixed simulated latency (submit, Spark work and the
+final poll), so the wall time shows what overlapping batches across REPLs of
+one Livy session saves. Staging and the final ``insert ... select`` add two
+statements on top. Run with ``python -m pytest tests/benchmarks -s``.
+"""
+
+import asyncio
+import itertools
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dbt.adapters.fabricspark import seed_loader
+from dbt.adapters.fabricspark.concurrent_livy import HighConcurrencyCursor, HighConcurrencySession
+from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+
+LATENCY = 0.05
+TYPES = ["bigint", "string", "double", "string", "boolean"] * 2
+
+
+def _cursor():
+    creds = FabricSparkCredentials(
+        method="livy",
+        livy_mode="fabric",
+        authentication="CLI",
+        workspaceid="1de8390c-9aca-4790-bee8-72049109c0f4",
+        lakehouseid="8c5bc260-bc3a-4898-9ada-01e433d461ba",
+        lakehouse="tests",
+        endpoint="https://api.fabric.microsoft.com/v1",
+        spark_config={"name": "bench"},
+    )
+    session = HighConcurrencySession(creds, creds.spark_config)
+    session.hc_id, session.session_id, session.repl_id = "hc", "s", "r"
+    session.is_new_session_required = False
+    return HighConcurrencyCursor(creds, session)
+
+
+def _run(statements, repls):
+    ids = itertools.count()
+
+    async def acquire(session):
+        n = next(ids)
+        session.hc_id, session.session_id, session.repl_id = f"hc-{n}", "s", f"r-{n}"
+        session.is_new_session_required = False
+
+    async def submit(engine, url, code, *args, **kwargs):
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"id": next(ids)}
+        return response
+
+    async def wait(engine, *args, **kwargs):
+        await asyncio.sleep(LATENCY)
+        return {"output": {"status": "ok"}}
+
+    with (
+        patch.object(HighConcurrencySession, "acquire_async", acquire),
+        patch.object(HighConcurrencySession, "delete"),
+        patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.submit_statement", submit),
+        patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.wait_statement", wait),
+    ):
+        started = time.perf_counter()
+        _cursor().execute_parallel(statements, repls)
+        return time.perf_counter() - started
+
+
+@pytest.mark.parametrize("count", [10_000, 50_000])
+def test_parallel_repls_cut_wall_time(count):
+    rows = [(i, f"n{i}", i / 3, None, i % 2 == 0) * 2 for i in range(count)]
+    statements = seed_loader.values_statements("lh.dbo.seed__stage", rows, TYPES)
+
+    sequential = _run(statements, 1)
+    parallel = _run(statements, 8)
+
+    print(
+        f"\n{count} rows, {len(statements)} batches at {LATENCY * 1000:.0f} ms each: "
+        f"1 REPL {sequential:.2f}s | 8 REPLs {parallel:.2f}s "
+        f"({sequential / parallel:.1f}x)"
+    )
+    assert parallel * 4 < sequential
@@ -0,0 +1,56 @@
+"""Compile-side cost of rendering seed VALUES batches, 50k rows x 20 columns.
+
+The old macro called ``adapter.convert_type`` for every cell of every batch.
+For number columns that runs an ``agate.MaxPrecision`` aggregate over the
+whole table, so rendering was O(rows^2 x cols). Running it to completion
+takes far too long, so its time is estimated as one measured call of the old
+``convert_type`` per cell. The current macro is rendered in full.
+Run with ``python -m pytest tests/benchmarks -s`` to see the numbers.
+"""
+
+import time
+from decimal import Decimal
+
+import agate
+
+from dbt.adapters.fabricspark.impl import FabricSparkAdapter
+from tests.unit.test_seed_macro import load_csv_rows_macro
+
+ROWS = 50_000
+COLUMNS = 20
+
+
+def _table():
+    names = [f"c{i}" for i in range(COLUMNS)]
+    kinds = [agate.Number() if i % 2 == 0 else agate.Text() for i in range(COLUMNS)]
+    rows = [
+        [Decimal(r) / 4 if i % 2 == 0 else f"v{r}" for i in range(COLUMNS)] for r in range(ROWS)
+    ]
+    return agate.Table(rows, names, kinds)
+
+
+def _old_convert_type(table, idx):
+    if isinstance(table.column_types[idx], agate.Number):
+        return "double" if table.aggregate(agate.MaxPrecision(idx)) else "bigint"
+    return FabricSparkAdapter.convert_type(table, idx)
+
+
+def test_seed_render_is_sub_second():
+    table = _table()
+    started = time.perf_counter()
+    for idx in range(COLUMNS):
+        _old_convert_type(table, idx)
+    per_call = (time.perf_counter() - started) / COLUMNS
+    old_estimate = per_call * ROWS * COLUMNS
+
+    render, adapter = load_csv_rows_macro()
+    started = time.perf_counter()
+    render(table)
+    new_seconds = time.perf_counter() - started
+
+    print(
+        f"\n{ROWS} x {COLUMNS} seed: per-cell inference ~{old_estimate / 60:.0f} min (estimated), "
+        f"per-column plan {new_seconds:.2f}s for {len(adapter.queries)} batches"
+    )
+    assert new_seconds < 1.0
+    assert new_seconds * 100 < old_estimate
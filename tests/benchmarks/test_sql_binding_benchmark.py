@@ -0,0 +1,55 @@
+"""Benchmark seed-batch binding against per-value conversion plus ``%`` formatting.
+
+Run with ``python -m pytest tests/benchmarks -s`` to see the timings.
+"""
+
+import datetime as dt
+import time
+from decimal import Decimal
+
+from dbt.adapters.fabricspark import sql_binding
+
+
+def _old_fix_binding(value):
+    if isinstance(value, (Decimal, int, float)):
+        return float(value)
+    elif isinstance(value, dt.datetime):
+        return f"'{value.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]}'"
+    elif value is None:
+        return "''"
+    escaped = str(value).replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def _old_bind(template, values):
+    return template % tuple(_old_fix_binding(v) for v in values)
+
+
+def _wide_seed_batch(columns=40, rows=149):
+    """One full seed batch: ``(6000 / columns) - 1`` rows of mixed values."""
+    row_sql = "(" + ",".join(["cast(%s as string)"] * columns) + ")"
+    template = "insert into lh.dbo.wide_seed values " + ",".join([row_sql] * rows)
+    row = [i if i % 4 == 0 else (f"value '{i}'" if i % 4 == 1 else None) for i in range(columns)]
+    return template, row * rows
+
+
+def _best_of(func, *args, runs=20):
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def test_binding_plan_beats_percent_formatting():
+    template, values = _wide_seed_batch()
+    old_seconds, _ = _best_of(_old_bind, template, values)
+    new_seconds, sql = _best_of(sql_binding.bind, template, values)
+
+    print(
+        f"\n{len(values)} bindings: % formatting {old_seconds * 1000:.2f} ms, "
+        f"plan {new_seconds * 1000:.2f} ms ({old_seconds / new_seconds:.1f}x)"
+    )
+    assert "%s" not in sql
+    assert new_seconds < old_seconds
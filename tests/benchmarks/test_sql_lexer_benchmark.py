@@ -0,0 +1,70 @@
+"""Benchmark the SQL lexer against the comment-stripping regex it replaced.
+
+Not part of the default unit run (``testpaths`` is ``tests/unit``); run with
+``python -m pytest tests/benchmarks -s`` to see the timings.
+"""
+
+import re
+import time
+
+import pytest
+
+from dbt.adapters.fabricspark import sql_lexer
+
+SIZES = {"10KB": 10 * 1024, "1MB": 1024 * 1024, "10MB": 10 * 1024 * 1024}
+
+
+def _regex_strip(sql: str) -> str:
+    return re.sub(r"\s*/\*(.|\n)*?\*/\s*", "\n", sql, flags=re.DOTALL).strip()
+
+
+def _compiled_model(size: int) -> str:
+    """A macro-generated union shaped like compiled dbt output.
+
+    Jinja control blocks leave indented blank lines behind, and column
+    descriptions end up as block comments.
+    """
+    header = '/* {"app": "dbt", "node_id": "model.jaffle.big_union"} */\n'
+    block = (
+        "\n        \n            \n"
+        "    select\n"
+        "        cast(id as bigint) as id,  /* surrogate key\n       from the source */\n"
+        "        'src_{n}' as source_name,\n"
+        "        `weird/col` as payload\n"
+        "    from lakehouse.raw.events_{n}\n"
+        "        \n"
+        "    union all\n"
+    )
+    parts = [header]
+    total = len(header)
+    n = 0
+    while total < size:
+        part = block.format(n=n)
+        parts.append(part)
+        total += len(part)
+        n += 1
+    parts.append("    select null, null, null from lakehouse.raw.empty")
+    return "".join(parts)
+
+
+def _best_of(func, sql, runs=3):
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = func(sql)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+@pytest.mark.parametrize("label", list(SIZES))
+def test_lexer_beats_regex(label):
+    sql = _compiled_model(SIZES[label])
+    regex_seconds, expected = _best_of(_regex_strip, sql)
+    lexer_seconds, actual = _best_of(sql_lexer.clean_statement, sql)
+
+    print(
+        f"\n{label}: regex {regex_seconds * 1000:.1f} ms, lexer {lexer_seconds * 1000:.1f} ms "
+        f"({regex_seconds / lexer_seconds:.1f}x)"
+    )
+    assert actual == expected
+    assert lexer_seconds < regex_seconds
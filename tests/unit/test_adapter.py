@@ -1388,3 +1388,344 @@ class TestCatalogPerLakehouseScoping(unittest.TestCase):
                 self.assertEqual(schemas, {"finance"})
         finally:
             FabricSparkRelation._schemas_enabled = False
+
+    def _seed(self, checksum=None, config=None):
+        import agate
+
+        model = {
+            "checksum": checksum or {"name": "path", "checksum": "seeds/s.csv"},
+            "config": config or {"column_types": {}},
+        }
+        table = agate.Table([(1, "a"), (2, "b")], ["id", "v"], [agate.Number(), agate.Text()])
+        return model, table
+
+    def test_seed_hash_prefers_file_checksum(self):
+        adapter = self._adapter()
+        adapter.config.credentials.seed_skip_unchanged = True
+        model, table = self._seed()
+        rows_hash = adapter.seed_content_hash(model, table, ["bigint", "string"])
+        self.assertEqual(rows_hash, adapter.seed_content_hash(model, table, ["bigint", "string"]))
+
+        model["checksum"] = {"name": "sha256", "checksum": "f" * 64}
+        with mock.patch("dbt.adapters.fabricspark.seed_loader.rows_digest") as rows_digest:
+            file_hash = adapter.seed_content_hash(model, table, ["bigint", "string"])
+        rows_digest.assert_not_called()
+        self.assertNotEqual(file_hash, rows_hash)
+
+        adapter.config.credentials.seed_skip_unchanged = False
+        self.assertIsNone(adapter.seed_content_hash(model, table, ["bigint", "string"]))
+
+    def test_seed_hash_is_off_by_default_and_for_seeds_with_hooks(self):
+        adapter = self._adapter()
+        model, table = self._seed()
+        self.assertIsNone(adapter.seed_content_hash(model, table, ["bigint", "string"]))
+
+        adapter.config.credentials.seed_skip_unchanged = True
+        model, table = self._seed(
+            config={"column_types": {}, "pre-hook": [{"sql": "delete from {{ this }}"}]}
+        )
+        self.assertIsNone(adapter.seed_content_hash(model, table, ["bigint", "string"]))
+
+        relation = FabricSparkRelation.create(schema="dbo", identifier="s")
+        with mock.patch.object(adapter, "execute") as execute:
+            adapter.record_seed_hash(relation, None)
+        self.assertIn("unset tblproperties if exists", execute.call_args.args[0])
+
+    def test_seed_is_unchanged_reads_cached_table_properties(self):
+        adapter = self._adapter()
+        seed_hash = "0" * 64
+        relation = FabricSparkRelation.create(
+            schema="dbo",
+            identifier="s",
+            type=RelationType.Table,
+            information=f"Table Properties: [dbt_fabricspark.seed_hash={seed_hash}]\n",
+        )
+        with mock.patch.object(adapter, "execute") as execute:
+            self.assertTrue(adapter.seed_is_unchanged(relation, seed_hash))
+            self.assertFalse(adapter.seed_is_unchanged(relation, "1" * 64))
+            self.assertFalse(adapter.seed_is_unchanged(None, seed_hash))
+        execute.assert_not_called()
+
+    def test_seed_is_unchanged_falls_back_to_show_tblproperties(self):
+        adapter = self._adapter()
+        seed_hash = "0" * 64
+        relation = FabricSparkRelation.create(
+            schema="dbo", identifier="s", type=RelationType.Table
+        )
+        result = [("dbt_fabricspark.seed_hash", seed_hash)]
+        with mock.patch.object(adapter, "execute", return_value=(None, result)) as execute:
+            self.assertTrue(adapter.seed_is_unchanged(relation, seed_hash))
+        self.assertIn("show tblproperties", execute.call_args.args[0])
+
+    def test_parallel_seed_load_needs_hc_and_more_than_one_batch(self):
+        import agate
+
+        adapter = self._adapter()
+        creds = adapter.config.credentials
+        many = agate.Table([(i,) for i in range(600)], ["id"], [agate.Number()])
+        one_batch = agate.Table([(i,) for i in range(10)], ["id"], [agate.Number()])
+        self.assertFalse(adapter.use_parallel_seed_load(many))
+
+        creds.seed_parallel_repls = 4
+        self.assertTrue(adapter.use_parallel_seed_load(many))
+        self.assertFalse(adapter.use_parallel_seed_load(one_batch))
+        creds.high_concurrency = False
+        self.assertFalse(adapter.use_parallel_seed_load(many))
+
+    def test_get_one_catalog_describes_the_schema_in_bulk(self):
+        from dbt.adapters.base.relation import InformationSchema
+
+        adapter = self._adapter()
+        orders, gone = (
+            FabricSparkRelation.create(schema="dbo", identifier=name, type=RelationType.Table)
+            for name in ("orders", "gone")
+        )
+        outcomes = [
+            {
+                "rows": [
+                    {"col_name": "id", "data_type": "bigint"},
+                    {"col_name": "amount", "data_type": "double"},
+                    {"col_name": "", "data_type": ""},
+                    {"col_name": "Owner", "data_type": "me"},
+                ]
+            },
+            {"error": "[TABLE_OR_VIEW_NOT_FOUND] dbo.gone"},
+        ]
+        info_schema = InformationSchema.from_relation(
+            FabricSparkRelation.create(schema="dbo", identifier="x"), None
+        )
+        with (
+            mock.patch.object(adapter, "list_relations", return_value=[orders, gone]),
+            mock.patch(
+                "dbt.adapters.fabricspark.catalog.describe", return_value=outcomes
+            ) as describe,
+            mock.patch.object(adapter, "execute_macro") as execute_macro,
+        ):
+            table = adapter._get_one_catalog(info_schema, {"dbo"}, frozenset())
+
+        describe.assert_called_once()
+        self.assertEqual(describe.call_args.args[1], ["dbo.orders", "dbo.gone"])
+        execute_macro.assert_not_called()
+        self.assertEqual(
+            [(row["table_name"], row["column_name"], row["column_type"]) for row in table],
+            [("orders", "id", "bigint"), ("orders", "amount", "double")],
+        )
+        self.assertEqual({row["table_owner"] for row in table}, {"me"})
+
+    def test_get_one_catalog_falls_back_to_one_describe_per_relation(self):
+        from dbt.adapters.base.relation import InformationSchema
+        from dbt_common.exceptions import DbtDatabaseError
+
+        adapter = self._adapter()
+        orders = FabricSparkRelation.create(
+            schema="dbo", identifier="orders", type=RelationType.Table
+        )
+        info_schema = InformationSchema.from_relation(orders, None)
+        with (
+            mock.patch.object(adapter, "list_relations", return_value=[orders]),
+            mock.patch(
+                "dbt.adapters.fabricspark.catalog.describe",
+                side_effect=DbtDatabaseError("pyspark statements are not supported"),
+            ),
+            mock.patch.object(
+                adapter, "_get_columns_for_catalog", return_value=[]
+            ) as per_relation,
+        ):
+            adapter._get_one_catalog(info_schema, {"dbo"}, frozenset())
+
+        per_relation.assert_called_once_with(orders)
+
+    def test_v2_listing_describes_all_relations_in_one_bulk_statement(self):
+        from dbt_common.exceptions import DbtRuntimeError
+
+        adapter = self._adapter()
+        keys = ["namespace", "tableName", "isTemporary"]
+        show_tables = [
+            Row(["dbo", "orders", False], keys),
+            Row(["dbo", "v_orders", False], keys),
+            Row(["dbo", "tmp", True], keys),
+        ]
+        outcomes = [
+            {
+                "rows": [
+                    {"col_name": "id", "data_type": "bigint"},
+                    {"col_name": "# Detailed Table Information", "data_type": ""},
+                    {"col_name": "Provider", "data_type": "delta"},
+                    {"col_name": "Type", "data_type": "MANAGED"},
+                ]
+            },
+            {"rows": [{"col_name": "Type", "data_type": "VIEW"}]},
+        ]
+
+        def fake_execute_macro(macro_name, kwargs):
+            if macro_name == "list_relations_without_caching":
+                raise DbtRuntimeError("SHOW TABLE EXTENDED is not supported for v2 tables")
+            return show_tables
+
+        with (
+            mock.patch.object(adapter, "execute_macro", side_effect=fake_execute_macro) as macro,
+            mock.patch(
+                "dbt.adapters.fabricspark.catalog.describe", return_value=outcomes
+            ) as describe,
+        ):
+            relations = adapter.list_relations_without_caching(
+                FabricSparkRelation.create(schema="dbo", identifier="x")
+            )
+
+        self.assertEqual(macro.call_count, 2)
+        describe.assert_called_once()
+        self.assertEqual(describe.call_args.args[1], ["dbo.orders", "dbo.v_orders"])
+        self.assertEqual(
+            [(r.identifier, r.type, r.is_delta) for r in relations],
+            [("orders", RelationType.Table, True), ("v_orders", RelationType.View, False)],
+        )
+        self.assertIn("id: bigint\n", relations[0].information)
+
+    def test_v2_listing_falls_back_to_per_relation_describe(self):
+        from dbt_common.exceptions import DbtRuntimeError
+
+        adapter = self._adapter()
+        keys = ["namespace", "tableName", "isTemporary"]
+        show_tables = [Row(["dbo", "orders", False], keys), Row(["dbo", "items", False], keys)]
+        described = []
+
+        def fake_execute_macro(macro_name, kwargs):
+            if macro_name == "list_relations_without_caching":
+                raise DbtRuntimeError("SHOW TABLE EXTENDED is not supported for v2 tables")
+            if macro_name == "describe_table_extended_without_caching":
+                described.append(kwargs["table_name"])
+                return [("Provider", "delta", "")]
+            return show_tables
+
+        with (
+            mock.patch.object(adapter, "execute_macro", side_effect=fake_execute_macro),
+            mock.patch(
+                "dbt.adapters.fabricspark.catalog.describe",
+                side_effect=DbtRuntimeError("statement failed"),
+            ),
+        ):
+            relations = adapter.list_relations_without_caching(
+                FabricSparkRelation.create(schema="dbo", identifier="x")
+            )
+
+        self.assertEqual(described, ["dbo.orders", "dbo.items"])
+        self.assertTrue(all(r.is_delta for r in relations))
+
+    def test_columns_are_cached_until_ddl_targets_the_relation(self):
+        adapter = self._adapter()
+        keys = ["col_name", "data_type", "comment"]
+        described = [Row(["id", "bigint", None], keys), Row(["name", "string", None], keys)]
+        relation = FabricSparkRelation.create(schema="dbo", identifier="orders")
+        connection = mock.MagicMock()
+        connection.name = "model.test.orders"
+
+        with (
+            mock.patch.object(adapter, "execute_macro", return_value=described) as macro,
+            mock.patch.object(
+                adapter.connections, "get_thread_connection", return_value=connection
+            ),
+        ):
+            first = adapter.get_columns_in_relation(relation)
+            second = adapter.get_columns_in_relation(relation)
+            self.assertEqual(macro.call_count, 1)
+            self.assertEqual([c.name for c in second], [c.name for c in first])
+
+            adapter.execute(f"insert into {relation} select * from dbo.stage")
+            adapter.get_columns_in_relation(relation)
+            self.assertEqual(macro.call_count, 1)
+
+            adapter.execute(f"alter table {relation} add columns (note string)")
+            adapter.get_columns_in_relation(relation)
+            self.assertEqual(macro.call_count, 2)
+
+    def test_listed_relation_columns_come_from_information(self):
+        adapter = self._adapter()
+        keys = ["namespace", "tableName", "isTemporary", "information"]
+        information = (
+            "Type: MANAGED\nProvider: delta\nSchema: root\n"
+            " |-- id: long (nullable = true)\n"
+            " |-- amount: decimal(10,2) (nullable = true)\n"
+        )
+        nested = information + " |-- tags: array (nullable = true)\n"
+        show_rows = [
+            Row(["dbo", "orders", False, information], keys),
+            Row(["dbo", "events", False, nested], keys),
+        ]
+        with mock.patch.object(adapter, "execute_macro", return_value=show_rows):
+            relations = adapter.list_relations_without_caching(
+                FabricSparkRelation.create(schema="dbo", identifier="x")
+            )
+
+        with mock.patch.object(adapter, "execute_macro", return_value=[]) as macro:
+            columns = adapter.get_columns_in_relation(relations[0])
+            adapter.get_columns_in_relation(relations[1])
+
+        self.assertEqual(
+            [(c.name, c.dtype) for c in columns], [("id", "bigint"), ("amount", "decimal(10,2)")]
+        )
+        # ``array`` is abbreviated in the information, so events is described.
+        macro.assert_called_once()
+
+    def test_listing_is_reused_from_the_metadata_cache_until_ddl(self):
+        import tempfile
+
+        adapter = self._adapter()
+        keys = ["namespace", "tableName", "isTemporary", "information"]
+        show_rows = [Row(["dbo", "orders", False, "Type: MANAGED\nProvider: delta\n"], keys)]
+        schema_relation = FabricSparkRelation.create(schema="dbo", identifier="x")
+        connection = mock.MagicMock()
+        connection.name = "model.test.orders"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            adapter.config.credentials.metadata_cache_file = f"{tmp}/metadata.db"
+            with (
+                mock.patch.object(adapter, "execute_macro", return_value=show_rows) as macro,
+                mock.patch.object(
+                    adapter.connections, "get_thread_connection", return_value=connection
+                ),
+            ):
+                adapter.list_relations_without_caching(schema_relation)
+                relations = adapter.list_relations_without_caching(schema_relation)
+                self.assertEqual(macro.call_count, 1)
+                self.assertEqual(
+                    [(r.identifier, r.type, r.is_delta) for r in relations],
+                    [("orders", RelationType.Table, True)],
+                )
+
+                adapter.execute("create or replace temporary view orders__dbt_tmp as select 1")
+                adapter.list_relations_without_caching(schema_relation)
+                self.assertEqual(macro.call_count, 1)
+
+                adapter.execute(f"create or replace table {relations[0]} as select 1")
+                adapter.list_relations_without_caching(schema_relation)
+                self.assertEqual(macro.call_count, 2)
+
+    def test_listing_from_the_metadata_cache_does_not_prefill_columns(self):
+        import tempfile
+
+        keys = ["namespace", "tableName", "isTemporary", "information"]
+        information = (
+            "Type: MANAGED\nProvider: delta\nSchema: root\n |-- id: long (nullable = true)\n"
+        )
+        show_rows = [Row(["dbo", "orders", False, information], keys)]
+        described = [
+            Row(["id", "bigint", None], ["col_name", "data_type", "comment"]),
+            Row(["note", "string", None], ["col_name", "data_type", "comment"]),
+        ]
+        schema_relation = FabricSparkRelation.create(schema="dbo", identifier="x")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            first = self._adapter()
+            first.config.credentials.metadata_cache_file = f"{tmp}/metadata.db"
+            with mock.patch.object(first, "execute_macro", return_value=show_rows):
+                first.list_relations_without_caching(schema_relation)
+
+            # The next invocation; meanwhile another process added ``note``.
+            later = self._adapter()
+            later.config.credentials.metadata_cache_file = f"{tmp}/metadata.db"
+            with mock.patch.object(later, "execute_macro", return_value=described) as macro:
+                relations = later.list_relations_without_caching(schema_relation)
+                columns = later.get_columns_in_relation(relations[0])
+
+        macro.assert_called_once()
+        self.assertEqual([c.name for c in columns], ["id", "note"])
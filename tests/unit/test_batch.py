@@ -0,0 +1,225 @@
+"""Unit tests for multi-statement batches."""
+
+import contextlib
+import io
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.fabricspark import batch, concurrent_livy
+from dbt.adapters.fabricspark.batch import BatchStatementError
+from dbt.adapters.fabricspark.concurrent_livy import HighConcurrencyCursor, HighConcurrencySession
+from dbt.adapters.fabricspark.connections import FabricSparkConnectionManager
+from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+from dbt.adapters.fabricspark.impl import FabricSparkAdapter
+from dbt.adapters.fabricspark.livy_engine import LivyEngine
+
+
+def _run_script(statements, failing=()):
+    """Execute the generated pyspark program against a fake ``spark``."""
+    spark = MagicMock()
+
+    def fake_sql(sql):
+        if sql in failing:
+            raise RuntimeError(f"[TABLE_OR_VIEW_NOT_FOUND] {sql}")
+
+    spark.sql.side_effect = fake_sql
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        exec(batch.build_script(statements), {"spark": spark})
+    body = {"output": {"status": "ok", "data": {"text/plain": out.getvalue()}}}
+    return spark, body
+
+
+def test_script_runs_statements_in_order():
+    statements = ["create database if not exists s", "drop view if exists s.v", 'it\'s "quoted"']
+    spark, body = _run_script(statements)
+
+    assert [c.args[0] for c in spark.sql.call_args_list] == statements
+    assert batch.parse_results(body, statements) == [{"status": "ok"}] * 3
+
+
+def test_first_failure_stops_the_batch_and_names_the_statement():
+    statements = ["create view v as select 1", "merge into missing", "drop view v"]
+    spark, body = _run_script(statements, failing={"merge into missing"})
+
+    assert spark.sql.call_count == 2
+    with pytest.raises(BatchStatementError, match="statement 2 of 3") as exc:
+        batch.parse_results(body, statements)
+    assert exc.value.index == 1
+    assert exc.value.results[0] == {"status": "ok"}
+    assert "TABLE_OR_VIEW_NOT_FOUND" in str(exc.value)
+
+
+def test_script_level_error_is_raised():
+    body = {"output": {"status": "error", "evalue": "NameError: spark"}}
+    with pytest.raises(DbtDatabaseError, match="NameError"):
+        batch.parse_results(body, ["select 1"])
+
+
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_hc_cursor_sends_one_pyspark_statement(mock_post):
+    creds = FabricSparkCredentials(
+        method="livy",
+        livy_mode="fabric",
+        authentication="CLI",
+        workspaceid="1de8390c-9aca-4790-bee8-72049109c0f4",
+        lakehouseid="8c5bc260-bc3a-4898-9ada-01e433d461ba",
+        lakehouse="tests",
+        endpoint="https://api.fabric.microsoft.com/v1",
+        spark_config={"name": "test-session"},
+    )
+    hc = HighConcurrencySession(creds, creds.spark_config)
+    hc.hc_id, hc.session_id, hc.repl_id = "hc", "s", "r"
+    hc.is_new_session_required = False
+    post = MagicMock(status_code=200)
+    post.json.return_value = {"id": 1}
+    mock_post.return_value = post
+    statements = [
+        "set spark.sql.sources.partitionOverwriteMode = dynamic",
+        "drop view if exists v",
+    ]
+    _, body = _run_script(statements)
+
+    with (
+        patch.object(concurrent_livy, "_get_headers", return_value={}),
+        patch.object(LivyEngine, "wait_statement", AsyncMock(return_value=body)),
+    ):
+        results = HighConcurrencyCursor(creds, hc).execute_batch(statements)
+
+    assert results == [{"status": "ok"}, {"status": "ok"}]
+    mock_post.assert_called_once()
+    assert '"kind": "pyspark"' in mock_post.call_args.kwargs["data"]
+
+
+def _manager(batch_statements=True):
+    profile = MagicMock()
+    profile.threads = 1
+    profile.credentials.batch_statements = batch_statements
+    profile.credentials.prewarm_session = False
+    manager = FabricSparkConnectionManager(profile, MagicMock())
+    connection = MagicMock()
+    connection.name = "model.test.m"
+    connection.handle.cursor.return_value.execute_batch.side_effect = lambda s: [
+        {"status": "ok"} for _ in s
+    ]
+    manager.get_thread_connection = MagicMock(return_value=connection)
+    return manager, connection.handle.cursor.return_value
+
+
+def test_batching_mode_holds_statements_until_flushed():
+    manager, cursor = _manager()
+    response, _ = manager.execute("create database if not exists s")
+    manager.execute("drop view if exists s.v")
+    assert response._message == "OK (batched)"
+    cursor.execute_batch.assert_not_called()
+
+    responses = manager.execute_batch(["alter table s.t set tblproperties ('a'='b')"])
+    cursor.execute_batch.assert_called_once_with(
+        [
+            "create database if not exists s",
+            "drop view if exists s.v",
+            "alter table s.t set tblproperties ('a'='b')",
+        ]
+    )
+    assert len(responses) == 3
+
+    manager.flush_statements()
+    assert cursor.execute_batch.call_count == 1
+
+
+def test_release_flushes_held_statements():
+    manager, cursor = _manager()
+    manager.execute("comment on table s.t is 'x'")
+    manager.release()
+    cursor.execute_batch.assert_called_once_with(["comment on table s.t is 'x'"])
+
+
+def test_held_statements_are_dropped_when_the_node_fails():
+    manager, cursor = _manager()
+    adapter = MagicMock(connections=manager)
+    with pytest.raises(DbtDatabaseError, match="merge failed"):
+        try:
+            try:
+                manager.execute("alter table s.t set tblproperties ('a'='b')")
+                manager.execute("grant select on s.t to analysts")
+                raise DbtDatabaseError("merge failed")
+            finally:
+                FabricSparkAdapter.post_model_hook(adapter, {}, None)
+        finally:
+            manager.release()
+    cursor.execute_batch.assert_not_called()
+
+    manager.execute("comment on table s.t is 'x'")
+    FabricSparkAdapter.post_model_hook(adapter, {}, None)
+    cursor.execute_batch.assert_called_once_with(["comment on table s.t is 'x'"])
+
+
+def test_node_run_inside_an_except_block_still_flushes():
+    manager, cursor = _manager()
+    adapter = MagicMock(connections=manager)
+    try:
+        raise ValueError("handled by the caller")
+    except ValueError:
+        manager.set_connection_name("model.test.m")
+        manager.execute("grant select on s.t to analysts")
+        FabricSparkAdapter.post_model_hook(adapter, {}, None)
+    cursor.execute_batch.assert_called_once_with(["grant select on s.t to analysts"])
+
+
+@pytest.mark.parametrize(
+    "sql, held",
+    [
+        ("set spark.sql.ansi.enabled = true", True),
+        ("/* dbt */ create schema if not exists s", True),
+        ("create or replace temporary view t__dbt_tmp as select 1", True),
+        ("alter table s.t add columns (note string); comment on table s.t is 'x'", True),
+        ("insert into s.t select * from t__dbt_tmp", False),
+        ("create or replace table s.t using delta as select 1", False),
+        ("create or replace view s.v as select 1", False),
+        ("merge into s.t using t__dbt_tmp as u on t.id = u.id when matched then delete", False),
+        ("drop view if exists s.v; insert overwrite s.t select 1", False),
+    ],
+)
+def test_only_statements_nothing_reads_are_held(sql, held):
+    manager, cursor = _manager()
+    with patch.object(
+        FabricSparkConnectionManager, "add_query", return_value=(MagicMock(), MagicMock())
+    ) as add_query:
+        response, _ = manager.execute(sql)
+    assert batch.holdable(sql) is held
+    assert add_query.called is not held
+    assert (response._message == "OK (batched)") is held
+
+
+def test_fetching_queries_are_not_held():
+    manager, cursor = _manager(batch_statements=False)
+    with patch.object(
+        FabricSparkConnectionManager, "add_query", return_value=(MagicMock(), MagicMock())
+    ) as add_query:
+        manager.execute("create database if not exists s")
+    add_query.assert_called_once()
+    cursor.execute_batch.assert_not_called()
+
+
+def test_every_execute_path_invalidates_the_relations_its_ddl_targets():
+    manager, cursor = _manager()
+    cursor.execute_code.return_value = {"output": {"status": "ok"}}
+    cursor.execute_parallel.return_value = 2
+    cache = MagicMock()
+    with (
+        patch("dbt.adapters.fabricspark.metadata_cache.get_cache", return_value=cache),
+        patch.object(manager.column_cache, "invalidate") as columns,
+    ):
+        manager.execute("alter table s.held add columns (note string)")
+        manager.execute_batch(["drop table if exists s.batched"])
+        manager.execute("create table s.added (id int)", fetch=True)
+        manager.execute_code("spark.range(1).write.saveAsTable('s.x')", "drop table s.code")
+        manager.execute_parallel(
+            ["drop table s.a", "create or replace table s.b as select 1"], "-- stage", 2
+        )
+
+    expected = ["s.held", "s.batched", "s.added", "s.code", "s.a", "s.b"]
+    assert [c.args[0] for c in columns.call_args_list] == expected
+    assert [c.args[0] for c in cache.invalidate_relations.call_args_list] == expected
@@ -0,0 +1,185 @@
+"""Unit tests for bulk catalog describes."""
+
+import contextlib
+import io
+from unittest.mock import MagicMock, patch
+
+import pytest
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.fabricspark import catalog
+
+DESCRIBED = {
+    "lh.dbo.orders": [("id", "bigint"), ("amount", "double"), ("", ""), ("Owner", "me")],
+    "lh.dbo.customers": [("id", "bigint"), ("name", "string")],
+}
+
+
+class _Driver:
+    """A fake ``spark`` for the generated program; Delta tables carry ``lastModified``."""
+
+    def __init__(self):
+        self.modified = {"lh.dbo.orders": "2024-01-01 00:00:00", "lh.dbo.customers": "2024-01-02"}
+        self.views = {"lh.dbo.v_orders": "CREATE VIEW v_orders AS SELECT * FROM orders"}
+        self.spark = MagicMock()
+        self.spark.sql.side_effect = self.sql
+        self.described = []
+
+    def sql(self, sql):
+        verb, name = sql.rsplit(" ", 1)
+        if verb == "describe detail" and name in self.modified:
+            detail = {"format": "delta", "lastModified": self.modified[name]}
+            rows = [MagicMock(asDict=MagicMock(return_value=detail))]
+        elif verb == "show create table" and name in self.views:
+            rows = [(self.views[name],)]
+        elif verb == "describe table extended" and (name in DESCRIBED or name in self.views):
+            self.described.append(name)
+            rows = DESCRIBED.get(name, [("id", "bigint")])
+        else:
+            raise RuntimeError(f"[TABLE_OR_VIEW_NOT_FOUND] {name}")
+        return MagicMock(collect=MagicMock(return_value=rows))
+
+    def execute_code(self, code, description=""):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            exec(code, {"spark": self.spark})
+        return {"output": {"status": "ok", "data": {"text/plain": out.getvalue()}}}
+
+
+def _run_script(tables):
+    """Execute the generated pyspark program against a fake ``spark``."""
+    return _Driver().execute_code(catalog.build_script(tables))
+
+
+def test_script_describes_every_table_and_reports_failures_per_table():
+    tables = ["lh.dbo.orders", "lh.dbo.gone", "lh.dbo.customers"]
+
+    outcomes = catalog.parse_results(_run_script(tables), tables)
+
+    assert outcomes[0]["rows"][:2] == [
+        {"col_name": "id", "data_type": "bigint"},
+        {"col_name": "amount", "data_type": "double"},
+    ]
+    assert outcomes[0]["rows"][3] == {"col_name": "Owner", "data_type": "me"}
+    assert "TABLE_OR_VIEW_NOT_FOUND" in outcomes[1]["error"]
+    assert outcomes[2]["rows"][1] == {"col_name": "name", "data_type": "string"}
+
+
+def test_statement_errors_and_missing_results_raise():
+    with pytest.raises(DbtDatabaseError, match="NameError"):
+        catalog.parse_results({"output": {"status": "error", "evalue": "NameError"}}, ["t"])
+    empty = {"output": {"status": "ok", "data": {"text/plain": "nothing"}}}
+    with pytest.raises(DbtDatabaseError, match="no results"):
+        catalog.parse_results(empty, ["t"])
+
+
+@patch.object(catalog, "RELATIONS_PER_STATEMENT", 2)
+def test_describe_chunks_relations_across_statements():
+    tables = ["lh.dbo.orders", "lh.dbo.customers", "lh.dbo.orders"]
+    driver = _Driver()
+    connections = MagicMock()
+    connections.execute_code.side_effect = driver.execute_code
+
+    outcomes = catalog.describe(connections, tables)
+
+    assert connections.execute_code.call_count == 2
+    assert [len(o["rows"]) for o in outcomes] == [4, 2, 4]
+
+
+def test_cache_skips_relations_whose_fingerprint_did_not_change(tmp_path):
+    tables = ["lh.dbo.orders", "lh.dbo.customers", "lh.dbo.v_orders"]
+    views = {"lh.dbo.v_orders"}
+    driver = _Driver()
+    connections = MagicMock(execute_code=driver.execute_code)
+    path = str(tmp_path / "catalog.json")
+
+    first = catalog.describe(connections, tables, views, catalog.CatalogCache(path), "lh.dbo")
+    assert driver.described == tables
+
+    driver.described.clear()
+    driver.modified["lh.dbo.orders"] = "2024-03-01 12:00:00"
+    cache = catalog.CatalogCache(path)
+    second = catalog.describe(connections, tables, views, cache, "lh.dbo")
+
+    assert driver.described == ["lh.dbo.orders"]
+    assert [o["rows"] for o in second] == [o["rows"] for o in first]
+    assert set(cache.entries("lh.dbo")) == set(tables)
+
+
+def test_relations_without_fingerprint_or_failing_are_not_cached(tmp_path):
+    driver = _Driver()
+    del driver.modified["lh.dbo.customers"]
+    connections = MagicMock(execute_code=driver.execute_code)
+    cache = catalog.CatalogCache(str(tmp_path / "catalog.json"))
+    tables = ["lh.dbo.orders", "lh.dbo.customers", "lh.dbo.gone"]
+
+    outcomes = catalog.describe(connections, tables, (), cache, "lh.dbo")
+    catalog.describe(connections, tables, (), cache, "lh.dbo")
+
+    assert "error" in outcomes[2]
+    assert set(cache.entries("lh.dbo")) == {"lh.dbo.orders"}
+    assert driver.described == ["lh.dbo.orders", "lh.dbo.customers", "lh.dbo.customers"]
+
+
+class _ListingDriver(_Driver):
+    """A fake ``spark`` that also answers the schema listing and the commit-file listing."""
+
+    def __init__(self):
+        super().__init__()
+        self.commits = {"lh.dbo.orders": 3, "lh.dbo.customers": 7}
+        self.queries = []
+        self.spark.read.format.return_value.option.return_value.load.side_effect = self.load
+
+    def _location(self, name):
+        return "abfss://ws@onelake.dfs.fabric.microsoft.com/lh/Tables/" + name.split(".")[-1]
+
+    def sql(self, sql):
+        self.queries.append(sql)
+        if sql == "show table extended in lh.dbo like '*'":
+            rows = [
+                (
+                    "dbo",
+                    name.split(".")[-1],
+                    False,
+                    f"Provider: delta\nLocation: {self._location(name)}\n",
+                )
+                for name in self.commits
+            ]
+            rows.append(
+                (
+                    "dbo",
+                    "v_orders",
+                    False,
+                    "Type: VIEW\nView Text: " + self.views["lh.dbo.v_orders"],
+                )
+            )
+            return MagicMock(collect=MagicMock(return_value=rows))
+        return super().sql(sql)
+
+    def load(self, paths):
+        latest = {
+            self._location(name): (f"{self._location(name)}/_delta_log/{version:020d}.json", "t")
+            for name, version in self.commits.items()
+        }
+        assert sorted(paths) == sorted(f"{location}/_delta_log" for location in latest)
+        frame = MagicMock()
+        grouped = frame.selectExpr.return_value.groupBy.return_value.agg.return_value
+        grouped.collect.return_value = list(latest.items())
+        return frame
+
+
+def test_fingerprints_come_from_the_schema_listing_in_bulk(tmp_path):
+    tables = ["lh.dbo.orders", "lh.dbo.customers", "lh.dbo.v_orders"]
+    views = {"lh.dbo.v_orders"}
+    driver = _ListingDriver()
+    connections = MagicMock(execute_code=driver.execute_code)
+    path = str(tmp_path / "catalog.json")
+
+    catalog.describe(connections, tables, views, catalog.CatalogCache(path), "lh.dbo")
+    driver.described.clear()
+    driver.queries.clear()
+    driver.commits["lh.dbo.customers"] = 8
+    catalog.describe(connections, tables, views, catalog.CatalogCache(path), "lh.dbo")
+
+    assert driver.described == ["lh.dbo.customers"]
+    assert not [q for q in driver.queries if q.startswith(("describe detail", "show create"))]
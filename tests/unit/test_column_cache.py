@@ -0,0 +1,63 @@
+"""Unit tests for the per-run column cache."""
+
+import pytest
+
+from dbt.adapters.fabricspark import column_cache
+
+
+@pytest.mark.parametrize(
+    "sql, targets",
+    [
+        ("create or replace table `lh`.`dbo`.`orders` using delta as select 1", ["lh.dbo.orders"]),
+        ('/* {"app": "dbt"} */\ncreate table if not exists dbo.t (id int)', ["dbo.t"]),
+        ("CREATE OR REPLACE TEMPORARY VIEW orders__dbt_tmp AS select 1", ["orders__dbt_tmp"]),
+        ("alter table lh.dbo.orders add columns (note string)", ["lh.dbo.orders"]),
+        ("alter table lh.dbo.a rename to lh.dbo.b", ["lh.dbo.a", "lh.dbo.b"]),
+        ("drop materialized lake view if exists lh.dbo.mlv", ["lh.dbo.mlv"]),
+        ("merge into lh.dbo.orders as t using src as s on t.id = s.id", ["lh.dbo.orders"]),
+        ("drop view if exists a; create view b as select 1", ["a", "b"]),
+        ("insert into lh.dbo.orders select * from lh.dbo.stage", []),
+        ("select 'drop table lh.dbo.orders'", []),
+    ],
+)
+def test_ddl_targets(sql, targets):
+    assert [column_cache.relation_key(t) for t in column_cache.ddl_targets(sql)] == targets
+
+
+def test_describe_type():
+    assert column_cache.describe_type("integer") == "int"
+    assert column_cache.describe_type("long") == "bigint"
+    assert column_cache.describe_type("decimal(10,2)") == "decimal(10,2)"
+    assert column_cache.describe_type("struct") is None
+
+
+def test_entries_survive_until_a_statement_targets_them():
+    cache = column_cache.ColumnCache()
+    orders, items = "`lh`.`dbo`.`orders`", "`lh`.`dbo`.`items`"
+    cache.set(orders, ["id"])
+    cache.set(items, ["id", "sku"])
+
+    cache.invalidate_sql("insert into lh.dbo.orders values (1)")
+    assert cache.get(orders, None) == ["id"]
+
+    cache.invalidate_sql("alter table dbo.orders add columns (note string)")
+    assert cache.get(orders, None) is None
+    assert cache.get(items, None) == ["id", "sku"]
+
+
+def test_listed_relations_are_parsed_once_on_first_use():
+    cache = column_cache.ColumnCache()
+    parsed = []
+
+    def from_information(listed):
+        parsed.append(listed)
+        return ["id"]
+
+    cache.add_listed("lh.dbo.orders")
+    assert cache.get("lh.dbo.orders", from_information) == ["id"]
+    assert cache.get("lh.dbo.orders", from_information) == ["id"]
+    assert parsed == ["lh.dbo.orders"]
+
+    cache.add_listed("lh.dbo.items")
+    cache.invalidate("lh.dbo.items")
+    assert cache.get("lh.dbo.items", from_information) is None
@@ -13,25 +13,36 @@ Mocked-HTTP coverage of the HC lifecycle:
   ``reuse_session`` is set, in which case the session is kept warm.
 - The HC session manager is registered as a :class:`LivyBackend`.
 - 404 on submit flags the REPL for re-acquire.
+- ``HighConcurrencyReplPool`` fills up concurrently after the first lease,
+  takes leases back on disconnect, and swaps dead REPLs for background
+  replacements.
+- With ``hc_repls_per_session`` threads are spread evenly across
+  ``<tag>-shard-k`` sessionTags.
 """
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from dbt_common.exceptions import DbtDatabaseError
 
+from dbt.adapters.exceptions import FailedToConnectError
 from dbt.adapters.fabricspark import concurrent_livy
 from dbt.adapters.fabricspark.concurrent_livy import (
     HighConcurrencyConnection,
     HighConcurrencyConnectionWrapper,
     HighConcurrencyCursor,
     HighConcurrencySession,
+    HighConcurrencyReplPool,
     HighConcurrencySessionManager,
     derive_session_tag,
 )
 from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
 from dbt.adapters.fabricspark.livy_backend import LivyBackend
+from dbt.adapters.fabricspark.livy_engine import get_engine
 
 
 def _make_creds(reuse_session: bool = False, **overrides) -> FabricSparkCredentials:
@@ -69,10 +80,15 @@ def _reset_module_state():
     concurrent_livy._session_tags.clear()
     concurrent_livy._active_sessions.clear()
     concurrent_livy._shortcuts_done.clear()
+    concurrent_livy._repl_pools.clear()
+    concurrent_livy._shard_occupancy.clear()
     yield
     concurrent_livy._session_tags.clear()
     concurrent_livy._active_sessions.clear()
     concurrent_livy._shortcuts_done.clear()
+    concurrent_livy._repl_pools.clear()
+    concurrent_livy._shard_occupancy.clear()
+    concurrent_livy.configure_hc_threads(1)
 
 
 # --------------------------------------------------------------------------- #
@@ -127,9 +143,9 @@ class TestDeriveSessionTag:
 
 class TestHighConcurrencySessionAcquire:
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.time.sleep")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.get")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.post")
+    @patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+    @patch("dbt.adapters.fabricspark._http_utils.get")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_happy_path(self, mock_post, mock_get, _sleep, _headers):
         mock_post.return_value = _mock_response(202, {"id": "hc-1", "state": "NotStarted"})
         mock_get.side_effect = [
@@ -159,9 +175,9 @@ class TestHighConcurrencySessionAcquire:
         assert hc in concurrent_livy._active_sessions
 
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.time.sleep")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.get")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.post")
+    @patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+    @patch("dbt.adapters.fabricspark._http_utils.get")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_terminal_dead_state_raises(self, mock_post, mock_get, _sleep, _headers):
         mock_post.return_value = _mock_response(202, {"id": "hc-2", "state": "NotStarted"})
         mock_get.return_value = _mock_response(
@@ -178,8 +194,8 @@ class TestHighConcurrencySessionAcquire:
         assert "Dead" in str(exc.value) or "out of capacity" in str(exc.value)
 
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.time.sleep")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.post")
+    @patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_404_on_post_retries_then_succeeds(self, mock_post, _sleep, _headers):
         mock_post.side_effect = [
             _mock_response(404, text="livy not yet up"),
@@ -187,7 +203,7 @@ class TestHighConcurrencySessionAcquire:
         ]
         creds = _make_creds()
         hc = HighConcurrencySession(creds, creds.spark_config)
-        with patch("dbt.adapters.fabricspark.concurrent_livy.requests.get") as mock_get:
+        with patch("dbt.adapters.fabricspark._http_utils.get") as mock_get:
             mock_get.return_value = _mock_response(
                 200, {"state": "Idle", "sessionId": "s", "replId": "r"}
             )
@@ -202,9 +218,9 @@ class TestHighConcurrencySessionAcquire:
 
 class TestHighConcurrencyCursorExecute:
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.time.sleep")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.get")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.post")
+    @patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+    @patch("dbt.adapters.fabricspark._http_utils.get")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_select_returns_rows_and_schema(self, mock_post, mock_get, _sleep, _headers):
         mock_post.return_value = _mock_response(200, {"id": 1, "state": "waiting"})
         mock_get.return_value = _mock_response(
@@ -242,9 +258,9 @@ class TestHighConcurrencyCursorExecute:
         assert cursor.description[0][0] == "version"
 
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.time.sleep")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.get")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.post")
+    @patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+    @patch("dbt.adapters.fabricspark._http_utils.get")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_ddl_returns_empty_result(self, mock_post, mock_get, _sleep, _headers):
         mock_post.return_value = _mock_response(200, {"id": 1, "state": "waiting"})
         # Fabric returns an envelope without `data` for DDL statements.
@@ -264,8 +280,8 @@ class TestHighConcurrencyCursorExecute:
         assert cursor.fetchall() == []
 
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.time.sleep")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.post")
+    @patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_404_on_submit_marks_repl_dead(self, mock_post, _sleep, _headers):
         mock_post.return_value = _mock_response(404, text="repl gone")
 
@@ -282,9 +298,9 @@ class TestHighConcurrencyCursorExecute:
         assert hc.is_new_session_required is True
 
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.time.sleep")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.get")
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.post")
+    @patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+    @patch("dbt.adapters.fabricspark._http_utils.get")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_statement_error_raises(self, mock_post, mock_get, _sleep, _headers):
         mock_post.return_value = _mock_response(200, {"id": 1, "state": "waiting"})
         mock_get.return_value = _mock_response(
@@ -315,7 +331,7 @@ class TestHighConcurrencyCursorExecute:
 
 class TestHighConcurrencyDelete:
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.delete")
+    @patch("dbt.adapters.fabricspark._http_utils.delete")
     def test_delete_calls_api_and_clears_state(self, mock_delete, _headers):
         mock_delete.return_value = _mock_response(200)
 
@@ -388,6 +404,294 @@ class TestHighConcurrencySessionManager:
         mock_delete.assert_not_called()
         assert mgr._hc_session is None
 
+    @patch("dbt.adapters.fabricspark.concurrent_livy._maybe_create_shortcuts")
+    def test_connect_async_awaits_acquire_on_engine_loop(self, _shortcuts):
+        async def _fake_acquire_async(self):
+            self.is_new_session_required = False
+            self.session_id = "s"
+            self.repl_id = "r"
+
+        with patch.object(HighConcurrencySession, "acquire_async", _fake_acquire_async):
+            creds = _make_creds()
+            mgr = HighConcurrencySessionManager()
+            conn = get_engine().run(mgr.connect_async(creds))
+            assert isinstance(conn, HighConcurrencyConnection)
+            assert mgr.connect(creds) is conn
+        _shortcuts.assert_called_once_with(creds)
+
+
+# --------------------------------------------------------------------------- #
+# REPL pool                                                                   #
+# --------------------------------------------------------------------------- #
+
+
+def _fake_acquirers():
+    counter = iter(range(1000))
+
+    def _ready(session):
+        n = next(counter)
+        session.hc_id = f"hc-{n}"
+        session.session_id = "s"
+        session.repl_id = f"r-{n}"
+        session.is_new_session_required = False
+        session.is_dead = False
+
+    async def _ready_async(session):
+        _ready(session)
+
+    return _ready, _ready_async
+
+
+def _wait_for_idle(pool, count):
+    deadline = time.monotonic() + 5
+    while len(pool._idle) < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(pool._idle) == count
+
+
+@patch.object(concurrent_livy, "REPL_POOL_JITTER_SECONDS", 0)
+@patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+class TestHighConcurrencyReplPool:
+    def test_first_lease_fills_the_rest_concurrently(self, _sleep):
+        ready, ready_async = _fake_acquirers()
+        with (
+            patch.object(HighConcurrencySession, "acquire", ready),
+            patch.object(HighConcurrencySession, "acquire_async", ready_async),
+        ):
+            pool = HighConcurrencyReplPool(_make_creds(), size=3)
+            first = pool.lease()
+            _wait_for_idle(pool, 2)
+            others = {pool.lease().repl_id, pool.lease().repl_id}
+
+        assert first.repl_id == "r-0"
+        assert others == {"r-1", "r-2"}
+        assert pool._leased == 3 and pool._pending == 0
+
+    def test_release_returns_lease_for_reuse(self, _sleep):
+        ready, ready_async = _fake_acquirers()
+        with (
+            patch.object(HighConcurrencySession, "acquire", ready),
+            patch.object(HighConcurrencySession, "acquire_async", ready_async),
+        ):
+            pool = HighConcurrencyReplPool(_make_creds(), size=1)
+            session = pool.lease()
+            pool.release(session)
+            assert pool.lease() is session
+
+    def test_lease_never_shows_a_free_slot_while_acquiring(self, _sleep):
+        ready, ready_async = _fake_acquirers()
+        pool = HighConcurrencyReplPool(_make_creds(), size=1)
+        occupied = []
+
+        class RecordingLock:
+            def __init__(self):
+                self._lock = threading.Lock()
+
+            def acquire(self, *args):
+                return self._lock.acquire(*args)
+
+            def release(self):
+                occupied.append(pool._leased + pool._pending + len(pool._idle))
+                self._lock.release()
+
+            __enter__ = acquire
+
+            def __exit__(self, *exc):
+                self.release()
+
+        pool._cond = threading.Condition(RecordingLock())
+        with (
+            patch.object(HighConcurrencySession, "acquire", ready),
+            patch.object(HighConcurrencySession, "acquire_async", ready_async),
+        ):
+            pool.lease()
+
+        assert occupied and min(occupied) == 1
+        assert pool._leased == 1 and pool._pending == 0
+
+    @patch.object(HighConcurrencySession, "delete")
+    def test_dead_repl_is_swapped_for_background_replacement(self, mock_delete, _sleep):
+        ready, ready_async = _fake_acquirers()
+        with (
+            patch.object(HighConcurrencySession, "acquire", ready),
+            patch.object(HighConcurrencySession, "acquire_async", ready_async),
+        ):
+            pool = HighConcurrencyReplPool(_make_creds(), size=1)
+            session = pool.lease()
+            cursor = HighConcurrencyCursor(session.credential, session)
+            cursor._mark_repl_dead()
+            _wait_for_idle(pool, 1)
+            cursor._ensure_repl()
+
+        assert session.repl_id == "r-1"
+        assert not session.is_dead
+        assert session in concurrent_livy._active_sessions
+        deadline = time.monotonic() + 5
+        while not mock_delete.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        mock_delete.assert_called_once()
+
+    @patch("dbt.adapters.fabricspark.concurrent_livy._maybe_create_shortcuts")
+    @patch.object(HighConcurrencySession, "delete")
+    def test_manager_leases_and_returns_instead_of_deleting(self, mock_delete, _shortcuts, _sleep):
+        ready, ready_async = _fake_acquirers()
+        with (
+            patch.object(HighConcurrencySession, "acquire", ready),
+            patch.object(HighConcurrencySession, "acquire_async", ready_async),
+        ):
+            creds = _make_creds(hc_repl_pool=True)
+            mgr = HighConcurrencySessionManager()
+            mgr.connect(creds)
+            session = mgr._hc_session
+            mgr.disconnect()
+
+        mock_delete.assert_not_called()
+        assert concurrent_livy.get_repl_pool(creds)._idle == [session]
+
+
+# --------------------------------------------------------------------------- #
+# execute_parallel                                                            #
+# --------------------------------------------------------------------------- #
+
+
+def _parallel_cursor(statement_outputs):
+    """A ready cursor plus fakes recording which REPL ran which statement."""
+    creds = _make_creds()
+    session = HighConcurrencySession(creds, creds.spark_config)
+    session.hc_id, session.session_id, session.repl_id = "hc-own", "s", "r-own"
+    session.is_new_session_required = False
+    ran = []
+
+    async def submit(engine, url, code, *args, **kwargs):
+        ran.append((url.split("/repls/")[1].split("/")[0], code))
+        return _mock_response(200, {"id": len(ran)})
+
+    async def wait(engine, url, statement_id, *args, **kwargs):
+        code = ran[statement_id - 1][1]
+        return {"output": statement_outputs.get(code, {"status": "ok"})}
+
+    return HighConcurrencyCursor(creds, session), ran, submit, wait
+
+
+@patch.object(HighConcurrencySession, "delete")
+class TestExecuteParallel:
+    def test_statements_spread_over_extra_repls_leased_from_the_pool(self, mock_delete):
+        cursor, ran, submit, wait = _parallel_cursor({})
+        ready, ready_async = _fake_acquirers()
+        statements = [f"insert into s.t values ({i})" for i in range(6)]
+        with (
+            patch.object(HighConcurrencySession, "acquire", ready),
+            patch.object(HighConcurrencySession, "acquire_async", ready_async),
+            patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.submit_statement", submit),
+            patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.wait_statement", wait),
+        ):
+            used = cursor.execute_parallel(statements, 3)
+            ran_first = list(ran)
+            ran.clear()
+            cursor.execute_parallel(statements, 3)
+
+        assert used == 3
+        assert sorted(code for _, code in ran_first) == statements
+        assert {repl for repl, _ in ran_first} <= {"r-own", "r-0", "r-1"}
+        # The second call reuses the pooled REPLs instead of acquiring new ones.
+        assert {repl for repl, _ in ran} <= {"r-own", "r-0", "r-1"}
+        mock_delete.assert_not_called()
+        pool = concurrent_livy.get_repl_pool(cursor.credential, cursor.hc_session.session_tag)
+        assert len(pool._idle) == 2 and pool._leased == 0
+        assert len(cursor.in_flight) == 0
+
+    def test_first_failure_stops_handing_out_statements(self, mock_delete):
+        statements = [f"insert into s.t values ({i})" for i in range(5)]
+        failing = {statements[1]: {"status": "error", "evalue": "DELTA_CONCURRENT_APPEND"}}
+        cursor, ran, submit, wait = _parallel_cursor(failing)
+        with (
+            patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.submit_statement", submit),
+            patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.wait_statement", wait),
+            pytest.raises(DbtDatabaseError, match="DELTA_CONCURRENT_APPEND"),
+        ):
+            cursor.execute_parallel(statements, 1)
+
+        assert [code for _, code in ran] == statements[:2]
+        mock_delete.assert_not_called()
+
+    def test_failed_extra_acquire_falls_back_to_fewer_repls(self, mock_delete):
+        cursor, ran, submit, wait = _parallel_cursor({})
+
+        async def refuse(session):
+            raise FailedToConnectError("no REPL slots")
+
+        def refuse_sync(session):
+            raise FailedToConnectError("no REPL slots")
+
+        with (
+            patch.object(HighConcurrencySession, "acquire", refuse_sync),
+            patch.object(HighConcurrencySession, "acquire_async", refuse),
+            patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.submit_statement", submit),
+            patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.wait_statement", wait),
+        ):
+            used = cursor.execute_parallel(["select 1", "select 2"], 4)
+
+        assert used == 1
+        assert [repl for repl, _ in ran] == ["r-own", "r-own"]
+
+
+# --------------------------------------------------------------------------- #
+# sessionTag sharding                                                         #
+# --------------------------------------------------------------------------- #
+
+
+class TestSessionTagSharding:
+    def test_unsharded_by_default(self):
+        creds = _make_creds(reuse_session=True)
+        concurrent_livy.configure_hc_threads(16)
+        assert concurrent_livy.shard_tags(creds) == [derive_session_tag(creds)]
+
+    def test_shard_tags_are_deterministic_suffixes(self):
+        creds = _make_creds(reuse_session=True, hc_repls_per_session=5)
+        concurrent_livy.configure_hc_threads(16)
+        base = derive_session_tag(creds)
+        assert concurrent_livy.shard_tags(creds) == [f"{base}-shard-{i}" for i in range(4)]
+
+    def test_threads_spread_evenly_across_shards(self):
+        creds = _make_creds(hc_repls_per_session=5)
+        concurrent_livy.configure_hc_threads(16)
+        tags = [concurrent_livy.assign_shard(creds) for _ in range(16)]
+        assert sorted(tags.count(t) for t in set(tags)) == [4, 4, 4, 4]
+
+        concurrent_livy.release_shard(tags[0])
+        occupancy = concurrent_livy.shard_occupancy()[tags[0]]
+        assert occupancy == {"repls": 3, "peak": 4}
+        assert concurrent_livy.assign_shard(creds) == tags[0]
+
+    @patch("dbt.adapters.fabricspark.concurrent_livy._maybe_create_shortcuts")
+    @patch.object(HighConcurrencySession, "delete")
+    def test_managers_acquire_on_their_shard_tag(self, _delete, _shortcuts):
+        acquired_tags = []
+
+        def _fake_acquire(self):
+            acquired_tags.append(self._build_acquire_payload()["sessionTag"])
+            self.is_new_session_required = False
+
+        creds = _make_creds(hc_repls_per_session=2)
+        concurrent_livy.configure_hc_threads(4)
+        with patch.object(HighConcurrencySession, "acquire", _fake_acquire):
+            managers = [HighConcurrencySessionManager() for _ in range(4)]
+            for mgr in managers:
+                mgr.connect(creds)
+        assert sorted(acquired_tags) == sorted(concurrent_livy.shard_tags(creds) * 2)
+
+        for mgr in managers:
+            mgr.disconnect()
+        assert all(c["repls"] == 0 for c in concurrent_livy.shard_occupancy().values())
+
+    def test_pools_are_sized_per_shard(self):
+        creds = _make_creds(hc_repls_per_session=5)
+        concurrent_livy.configure_hc_threads(12)
+        tags = concurrent_livy.shard_tags(creds)
+        pools = [concurrent_livy.get_repl_pool(creds, tag) for tag in tags]
+        assert [p.size for p in pools] == [4, 4, 4]
+        assert [p.session_tag for p in pools] == tags
+
 
 # --------------------------------------------------------------------------- #
 # atexit cleanup                                                              #
@@ -396,7 +700,7 @@ class TestHighConcurrencySessionManager:
 
 class TestHighConcurrencyAtexitCleanup:
     @patch("dbt.adapters.fabricspark.concurrent_livy._get_headers", return_value={})
-    @patch("dbt.adapters.fabricspark.concurrent_livy.requests.delete")
+    @patch("dbt.adapters.fabricspark._http_utils.delete")
     def test_atexit_deletes_only_non_reuse_sessions(self, mock_delete, _headers):
         # reuse_session sessions are left alive so the underlying Livy session
         # stays warm; non-reuse sessions are deleted to free REPL slots (#232).
@@ -460,6 +764,25 @@ class TestHighConcurrencyConnectionWrapper:
             wrapper.execute("SELECT 1;")
             mock_exec.assert_called_once_with("SELECT 1")
 
+    @patch("dbt.adapters.fabricspark._http_utils.post")
+    def test_cancel_cancels_in_flight_statement(self, mock_post):
+        mock_post.return_value = _mock_response(200, {"msg": "canceled"})
+        creds = _make_creds()
+        hc = HighConcurrencySession(creds, creds.spark_config)
+        hc.session_id = "s"
+        hc.repl_id = "r"
+        hc.is_new_session_required = False
+        wrapper = HighConcurrencyConnectionWrapper(HighConcurrencyConnection(creds, hc))
+        url = hc.statements_url()
+
+        with patch.object(concurrent_livy, "_get_headers", return_value={}):
+            with wrapper.in_flight.track(url, 7, creds, dict):
+                wrapper.cancel()
+
+        mock_post.assert_called_once()
+        assert mock_post.call_args.args[0] == f"{url}/7/cancel"
+        assert len(wrapper.in_flight) == 0
+
 
 # --------------------------------------------------------------------------- #
 # _build_acquire_payload — session_idle_timeout injection                     #
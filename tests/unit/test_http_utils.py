@@ -1,9 +1,13 @@
 """Unit tests for the shared HTTP helpers."""
 
+import threading
 from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
 
-from dbt.adapters.fabricspark._http_utils import parse_retry_after
+import pytest
+
+from dbt.adapters.fabricspark._http_utils import HttpTransport, parse_retry_after
 
 
 def _response(headers=None, body=None):
@@ -58,3 +62,60 @@ def test_returns_zero_when_until_pattern_is_malformed():
 def test_returns_zero_when_message_has_no_until_clause():
     body = {"message": "Too many requests"}
     assert parse_retry_after(_response(body=body)) == 0
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_reuses_connection_across_requests(local_server):
+    transport = HttpTransport()
+    try:
+        for _ in range(5):
+            assert transport.request("GET", f"{local_server}/sessions").status_code == 200
+        stats = transport.stats()[local_server]
+        assert stats == {"requests": 5, "opened": 1, "reused": 4}
+    finally:
+        transport.close()
+
+
+def test_transport_keeps_one_session_per_origin():
+    transport = HttpTransport()
+    a = transport.session_for("https://api.fabric.microsoft.com/v1/workspaces/ws")
+    b = transport.session_for("https://api.fabric.microsoft.com/v1/other")
+    c = transport.session_for("https://onelake.dfs.fabric.microsoft.com/ws")
+    assert a is b
+    assert a is not c
+    transport.close()
+
+
+def test_configure_grows_pool_but_never_shrinks():
+    transport = HttpTransport(pool_maxsize=10)
+    session = transport.session_for("https://api.fabric.microsoft.com/v1")
+    transport.configure(32)
+    assert transport.pool_maxsize == 32
+    assert session.get_adapter("https://api.fabric.microsoft.com")._pool_maxsize == 32
+    transport.configure(4)
+    assert transport.pool_maxsize == 32
+    transport.close()
@@ -0,0 +1,199 @@
+"""Unit tests for the asyncio Livy engine."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.fabricspark.livy_engine import (
+    InFlightStatements,
+    LivyEngine,
+    cancel_in_flight,
+    get_engine,
+)
+from dbt.adapters.fabricspark.statement_poller import StatementTimeoutError
+
+URL = "https://api.fabric.microsoft.com/v1/ws/lh/livyapi/sessions/s1/statements"
+
+
+def _creds():
+    creds = MagicMock()
+    creds.statement_timeout = 30
+    creds.poll_statement_wait = 0
+    creds.http_timeout = 5
+    return creds
+
+
+def _response(status, body=None, text=""):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.json.return_value = body or {}
+    resp.text = text
+    resp.headers = {}
+    return resp
+
+
+def test_run_returns_coroutine_result():
+    async def answer():
+        await asyncio.sleep(0)
+        return 42
+
+    assert LivyEngine().run(answer()) == 42
+
+
+def test_run_from_engine_loop_is_rejected():
+    engine = LivyEngine()
+
+    async def nested():
+        return engine.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError, match="await instead"):
+        engine.run(nested())
+
+
+def test_get_engine_is_process_wide():
+    assert get_engine() is get_engine()
+
+
+def test_executor_grows_with_the_transport_pool():
+    engine = LivyEngine(max_workers=2)
+    engine.configure(6)
+    engine.configure(3)
+    assert engine.max_workers == 6
+    assert engine.run(engine.call(lambda: 7)) == 7
+
+    size = get_engine().max_workers + 4
+    with patch("dbt.adapters.fabricspark._http_utils.transport_pool_maxsize", return_value=size):
+        assert get_engine().max_workers == size
+
+
+def test_throttled_requests_wait_on_the_loop_not_in_executor_threads():
+    from dbt.adapters.fabricspark import _http_utils
+
+    url = "https://throttled.example/v1/workspaces/ws/livyapi/sessions/s1/statements"
+    throttle = _http_utils._transport.throttle
+    session = MagicMock()
+    session.request.return_value = _response(200, {"id": 1})
+    throttle.bucket_for(url).on_throttled(0.2)
+    engine = LivyEngine(max_workers=1)
+
+    async def _many():
+        return await asyncio.gather(*(engine.http("GET", url) for _ in range(5)))
+
+    with (
+        patch.object(_http_utils._transport, "session_for", return_value=session),
+        patch.object(throttle, "before_request", side_effect=AssertionError("blocking wait")),
+    ):
+        responses = engine.run(_many())
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert throttle.bucket_for(url).wait_seconds > 0
+
+
+@patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_submit_retries_5xx_then_returns_response(mock_post, mock_sleep):
+    mock_post.side_effect = [_response(503, text="busy"), _response(200, {"id": 3})]
+    engine = LivyEngine()
+    res = engine.run(engine.submit_statement(URL, "SELECT 1", _creds(), headers=dict))
+
+    assert res.json() == {"id": 3}
+    mock_sleep.assert_awaited_once()
+    # Decorrelated jitter: first delay is drawn from [base, 3 * base].
+    assert 1.0 <= mock_sleep.await_args.args[0] <= 3.0
+    assert mock_post.call_args.args[0] == URL
+
+
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_submit_404_invokes_on_not_found(mock_post):
+    mock_post.return_value = _response(404, text="gone")
+    on_not_found = MagicMock()
+    engine = LivyEngine()
+    with pytest.raises(DbtRuntimeError, match="HC statement submit failed"):
+        engine.run(
+            engine.submit_statement(
+                URL, "SELECT 1", _creds(), headers=dict, label="HC", on_not_found=on_not_found
+            )
+        )
+    on_not_found.assert_called_once()
+
+
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_cancel_posts_to_cancel_endpoint(mock_post):
+    mock_post.side_effect = [_response(200, {"msg": "canceled"}), _response(404, text="gone")]
+    engine = LivyEngine()
+    assert engine.run(engine.cancel_statement(URL, 9, _creds(), headers=dict)) is True
+    assert mock_post.call_args.args[0] == URL + "/9/cancel"
+    assert engine.run(engine.cancel_statement(URL, 9, _creds(), headers=dict)) is False
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_many_statements_run_concurrently_on_one_loop(mock_post, mock_get):
+    counter = iter(range(1000))
+    mock_post.side_effect = lambda *a, **k: _response(200, {"id": next(counter)})
+
+    def fake_get(url, params=None, **kwargs):
+        if params is not None:
+            first = params["from"]
+            return _response(
+                200,
+                {
+                    "statements": [
+                        {"id": i, "state": "available", "output": {"status": "ok"}}
+                        for i in range(first, first + params["size"])
+                    ]
+                },
+            )
+        return _response(200, {"id": int(url.rsplit("/", 1)[1]), "state": "available"})
+
+    mock_get.side_effect = fake_get
+    engine = LivyEngine()
+    creds = _creds()
+
+    async def fan_out():
+        return await asyncio.gather(
+            *(engine.execute_statement(URL, "SELECT 1", creds, headers=dict) for _ in range(50))
+        )
+
+    results = engine.run(fan_out())
+    assert sorted(r["id"] for r in results) == list(range(50))
+
+
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_timed_out_statement_is_cancelled(mock_post):
+    mock_post.return_value = _response(200)
+    tracker = InFlightStatements()
+    with pytest.raises(StatementTimeoutError):
+        with tracker.track(URL, 4, _creds(), dict):
+            raise StatementTimeoutError("Timeout (30s) waiting for statement 4")
+
+    assert mock_post.call_args.args[0] == URL + "/4/cancel"
+    assert len(tracker) == 0
+
+
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_finished_or_failed_statement_is_not_cancelled(mock_post):
+    tracker = InFlightStatements()
+    with tracker.track(URL, 1, _creds(), dict):
+        pass
+    with pytest.raises(DbtRuntimeError):
+        with tracker.track(URL, 2, _creds(), dict):
+            raise DbtRuntimeError("syntax error")
+
+    mock_post.assert_not_called()
+    assert len(tracker) == 0
+
+
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_cancel_in_flight_covers_every_connection(mock_post):
+    mock_post.return_value = _response(200)
+    first, second = InFlightStatements(), InFlightStatements()
+    with first.track(URL, 1, _creds(), dict), second.track(URL, 2, _creds(), dict):
+        assert cancel_in_flight([first, second, InFlightStatements()]) == 2
+
+    assert sorted(c.args[0] for c in mock_post.call_args_list) == [
+        URL + "/1/cancel",
+        URL + "/2/cancel",
+    ]
@@ -1,11 +1,9 @@
 """Tests for livysession module, focusing on local vs Fabric mode routing."""
 
 import base64
-import datetime as dt
 import json
 import os
 import tempfile
-from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -59,10 +57,10 @@ class TestGetHeaders:
             spark_config={"name": "test-session"},
         )
 
-        # Reset global accessToken
+        # Reset cached tokens
         import dbt.adapters.fabricspark.livysession as livysession_module
 
-        livysession_module.accessToken = None
+        livysession_module._token_manager.clear()
 
         headers = get_headers(credentials)
 
@@ -172,7 +170,7 @@ class TestCreateSessionRetry:
 
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
-    @patch("dbt.adapters.fabricspark.livysession.requests.post")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     @patch("dbt.adapters.fabricspark.livysession.LivySession.wait_for_session_start")
     def test_create_session_succeeds_immediately(
         self, mock_wait, mock_post, mock_sleep, mock_headers
@@ -188,7 +186,7 @@ class TestCreateSessionRetry:
 
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
-    @patch("dbt.adapters.fabricspark.livysession.requests.post")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     @patch("dbt.adapters.fabricspark.livysession.LivySession.wait_for_session_start")
     def test_create_session_accepts_202_without_retry(
         self, mock_wait, mock_post, mock_sleep, mock_headers
@@ -204,7 +202,7 @@ class TestCreateSessionRetry:
 
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
-    @patch("dbt.adapters.fabricspark.livysession.requests.post")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     @patch("dbt.adapters.fabricspark.livysession.LivySession.wait_for_session_start")
     def test_create_session_retries_on_404_then_succeeds(
         self, mock_wait, mock_post, mock_sleep, mock_headers
@@ -223,7 +221,7 @@ class TestCreateSessionRetry:
 
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
-    @patch("dbt.adapters.fabricspark.livysession.requests.post")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     @patch("dbt.adapters.fabricspark.livysession.LivySession.wait_for_session_start")
     def test_create_session_retries_on_500_then_succeeds(
         self, mock_wait, mock_post, mock_sleep, mock_headers
@@ -242,7 +240,7 @@ class TestCreateSessionRetry:
 
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
-    @patch("dbt.adapters.fabricspark.livysession.requests.post")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_create_session_raises_after_all_retries_exhausted(
         self, mock_post, mock_sleep, mock_headers
     ):
@@ -264,7 +262,7 @@ class TestCreateSessionRetry:
 
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
-    @patch("dbt.adapters.fabricspark.livysession.requests.post")
+    @patch("dbt.adapters.fabricspark._http_utils.post")
     def test_create_session_does_not_retry_on_401(self, mock_post, mock_sleep, mock_headers):
         """create_session should NOT retry on 401 auth errors (non-transient)."""
         mock_post.return_value = self._make_response(401)
@@ -296,7 +294,7 @@ class TestWaitForSessionStartTransientErrors:
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
     @patch("dbt.adapters.fabricspark.livysession.time.time")
-    @patch("dbt.adapters.fabricspark.livysession.requests.get")
+    @patch("dbt.adapters.fabricspark._http_utils.get")
     def test_wait_retries_on_request_exception(
         self, mock_get, mock_time, mock_sleep, mock_headers
     ):
@@ -319,7 +317,7 @@ class TestWaitForSessionStartTransientErrors:
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
     @patch("dbt.adapters.fabricspark.livysession.time.time")
-    @patch("dbt.adapters.fabricspark.livysession.requests.get")
+    @patch("dbt.adapters.fabricspark._http_utils.get")
     def test_wait_retries_on_json_decode_error(
         self, mock_get, mock_time, mock_sleep, mock_headers
     ):
@@ -345,7 +343,7 @@ class TestWaitForSessionStartTransientErrors:
     @patch("dbt.adapters.fabricspark.livysession.get_headers", return_value={})
     @patch("dbt.adapters.fabricspark.livysession.time.sleep")
     @patch("dbt.adapters.fabricspark.livysession.time.time")
-    @patch("dbt.adapters.fabricspark.livysession.requests.get")
+    @patch("dbt.adapters.fabricspark._http_utils.get")
     def test_wait_succeeds_immediately_without_retries(
         self, mock_get, mock_time, mock_sleep, mock_headers
     ):
@@ -766,60 +764,6 @@ class TestCreateFabricSessionIdleTimeout:
         assert "spark.livy.session.idle.timeout" not in spark_config["conf"]
 
 
-class TestFixBinding:
-    """Tests for LivySessionConnectionWrapper._fix_binding."""
-
-    def test_string_without_quotes(self):
-        """Plain strings are wrapped in single quotes."""
-        assert LivySessionConnectionWrapper._fix_binding("hello") == "'hello'"
-
-    def test_string_with_single_quote(self):
-        """Single quotes inside string values are escaped with a backslash."""
-        result = LivySessionConnectionWrapper._fix_binding("Cote d'Ivoire")
-        assert result == "'Cote d\\'Ivoire'"
-
-    def test_string_with_multiple_single_quotes(self):
-        """Multiple single quotes are all escaped."""
-        result = LivySessionConnectionWrapper._fix_binding("it's a 'test'")
-        assert result == "'it\\'s a \\'test\\''"
-
-    def test_none_returns_empty_string_literal(self):
-        assert LivySessionConnectionWrapper._fix_binding(None) == "''"
-
-    def test_integer(self):
-        assert LivySessionConnectionWrapper._fix_binding(42) == 42.0
-
-    def test_float(self):
-        assert LivySessionConnectionWrapper._fix_binding(3.14) == 3.14
-
-    def test_decimal(self):
-        assert LivySessionConnectionWrapper._fix_binding(Decimal("1.5")) == 1.5
-
-    def test_datetime(self):
-        value = dt.datetime(2024, 1, 15, 10, 30, 45, 123456)
-        result = LivySessionConnectionWrapper._fix_binding(value)
-        assert result == "'2024-01-15 10:30:45.123'"
-
-    def test_seed_insert_with_single_quote_produces_valid_sql(self):
-        """End-to-end check: bindings containing single quotes produce
-        syntactically valid SQL when substituted into an INSERT template."""
-        sql_template = (
-            "insert into db.schema.sample values "
-            "(cast(%s as bigint),cast(%s as string)),(cast(%s as bigint),cast(%s as string))"
-        )
-        raw_bindings = [1.0, "Cote d'Ivoire", 2.0, "Tonga"]
-        bindings = tuple(LivySessionConnectionWrapper._fix_binding(b) for b in raw_bindings)
-        sql = sql_template % bindings
-        # The generated SQL must NOT have an unescaped inner quote that would
-        # break parsing. The value should be: 'Cote d\'Ivoire'
-        assert "Cote d\\'Ivoire" in sql
-        assert sql == (
-            "insert into db.schema.sample values "
-            "(cast(1.0 as bigint),cast('Cote d\\'Ivoire' as string)),"
-            "(cast(2.0 as bigint),cast('Tonga' as string))"
-        )
-
-
 class TestFetchmany:
     """Tests for LivyCursor.fetchmany and LivySessionConnectionWrapper.fetchmany."""
 
@@ -967,10 +911,10 @@ class _NotACredential:
 
 
 def _reset_token_state():
-    """Wipe the module-level access token and credential cache between tests."""
+    """Wipe the cached access tokens and credential cache between tests."""
     import dbt.adapters.fabricspark.livysession as livysession_module
 
-    livysession_module.accessToken = None
+    livysession_module._token_manager.clear()
     livysession_module._custom_credential_cache.clear()
     _StaticFakeCredential.call_count = 0
     _StaticFakeCredential.last_kwargs = {}
@@ -1126,11 +1070,15 @@ class TestTokenCredentialAuth:
         get_headers(credentials)
         assert _StaticFakeCredential.call_count == 1
 
-        # Force expiry: set the module-global token to one that's already
-        # expired so is_token_refresh_necessary fires.
+        # Force expiry: replace the cached token with one that's already
+        # expired so the manager refreshes inline.
         from azure.core.credentials import AccessToken
 
-        livysession_module.accessToken = AccessToken(token="stale", expires_on=0)
+        manager = livysession_module._token_manager
+        key = manager.key_for(credentials)
+        manager._entries[key] = manager._entries[key]._replace(
+            token=AccessToken(token="stale", expires_on=0)
+        )
 
         get_headers(credentials)
         assert _StaticFakeCredential.call_count == 2
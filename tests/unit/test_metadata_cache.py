@@ -0,0 +1,51 @@
+"""Unit tests for the on-disk metadata cache."""
+
+import os
+import stat
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from dbt.adapters.fabricspark import metadata_cache
+
+
+def _creds(tmp_path, ttl=3600):
+    return SimpleNamespace(
+        workspaceid="ws",
+        lakehouseid="lh-id",
+        metadata_cache_file=str(tmp_path / "target" / "metadata.db"),
+        metadata_cache_ttl=ttl,
+    )
+
+
+def test_values_persist_across_instances_until_the_ttl(tmp_path):
+    path = str(tmp_path / "metadata.db")
+    metadata_cache.MetadataCache(path, ttl=60).put("spark_version:ws:lh", "3.5")
+
+    cache = metadata_cache.MetadataCache(path, ttl=60)
+    assert cache.get("spark_version:ws:lh") == "3.5"
+    assert cache.get("missing") is None
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    with patch("time.time", return_value=os.path.getmtime(path) + 3600):
+        assert cache.get("spark_version:ws:lh") is None
+
+
+def test_ddl_drops_the_listing_of_the_target_schema(tmp_path):
+    creds = _creds(tmp_path)
+    cache = metadata_cache.get_cache(creds)
+    dbo = metadata_cache.relations_key(creds, "`lakehouse`.`dbo`")
+    sales = metadata_cache.relations_key(creds, "`lakehouse`.`sales`")
+    cache.put(dbo, [{"identifier": "orders"}])
+    cache.put(sales, [{"identifier": "leads"}])
+
+    cache.invalidate_relations("orders__dbt_tmp")
+    assert cache.get(dbo) == [{"identifier": "orders"}]
+
+    cache.invalidate_relations("dbo.orders")
+    assert cache.get(dbo) is None
+    assert cache.get(sales) == [{"identifier": "leads"}]
+
+
+def test_get_cache_is_off_without_a_file(tmp_path):
+    creds = _creds(tmp_path)
+    creds.metadata_cache_file = None
+    assert metadata_cache.get_cache(creds) is None
@@ -74,7 +74,7 @@ class TestExtractErrorDetail:
 
 class TestRequestWithRetry:
     @patch("dbt.adapters.fabricspark.mlv_api.time.sleep")
-    @patch("dbt.adapters.fabricspark.mlv_api.requests.request")
+    @patch("dbt.adapters.fabricspark._http_utils.request")
     def test_retries_on_429(self, mock_request, mock_sleep):
         rate_limit_resp = MagicMock()
         rate_limit_resp.status_code = 429
@@ -94,7 +94,7 @@ class TestRequestWithRetry:
         mock_sleep.assert_called_once()
 
     @patch("dbt.adapters.fabricspark.mlv_api.time.sleep")
-    @patch("dbt.adapters.fabricspark.mlv_api.requests.request")
+    @patch("dbt.adapters.fabricspark._http_utils.request")
     def test_retries_on_500(self, mock_request, mock_sleep):
         err_resp = MagicMock()
         err_resp.status_code = 500
@@ -110,7 +110,7 @@ class TestRequestWithRetry:
         assert result.status_code == 200
 
     @patch("dbt.adapters.fabricspark.mlv_api.time.sleep")
-    @patch("dbt.adapters.fabricspark.mlv_api.requests.request")
+    @patch("dbt.adapters.fabricspark._http_utils.request")
     def test_raises_after_max_retries(self, mock_request, mock_sleep):
         err_resp = MagicMock()
         err_resp.status_code = 503
@@ -123,7 +123,7 @@ class TestRequestWithRetry:
             _request_with_retry("GET", "http://test", {}, "test-op", 30)
         assert mock_request.call_count == MAX_RETRIES
 
-    @patch("dbt.adapters.fabricspark.mlv_api.requests.request")
+    @patch("dbt.adapters.fabricspark._http_utils.request")
     def test_raises_immediately_on_400(self, mock_request):
         err_resp = MagicMock()
         err_resp.status_code = 400
@@ -137,7 +137,7 @@ class TestRequestWithRetry:
         assert mock_request.call_count == 1
 
     @patch("dbt.adapters.fabricspark.mlv_api.time.sleep")
-    @patch("dbt.adapters.fabricspark.mlv_api.requests.request")
+    @patch("dbt.adapters.fabricspark._http_utils.request")
     def test_retries_on_connection_error(self, mock_request, mock_sleep):
         mock_request.side_effect = [
             requests.exceptions.ConnectionError("refused"),
@@ -148,7 +148,7 @@ class TestRequestWithRetry:
         assert mock_request.call_count == 2
 
     @patch("dbt.adapters.fabricspark.mlv_api.time.sleep")
-    @patch("dbt.adapters.fabricspark.mlv_api.requests.request")
+    @patch("dbt.adapters.fabricspark._http_utils.request")
     def test_retries_on_timeout(self, mock_request, mock_sleep):
         mock_request.side_effect = [
             requests.exceptions.Timeout("timed out"),
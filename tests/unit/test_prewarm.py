@@ -0,0 +1,106 @@
+"""Unit tests for the background Livy session pre-warm."""
+
+from argparse import Namespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from dbt.adapters.fabricspark.connections import FabricSparkConnectionManager
+
+
+def _creds(local=False):
+    creds = MagicMock()
+    creds.is_local_mode = local
+    creds.http_max_rps = 50.0
+    creds.retry_base_delay = 1.0
+    creds.retry_max_delay = 30.0
+    creds.retry_budget = 600
+    creds.circuit_breaker_threshold = 10
+    creds.circuit_breaker_reset = 30
+    return creds
+
+
+@pytest.fixture(autouse=True)
+def _reset_prewarm():
+    FabricSparkConnectionManager._prewarm = None
+    FabricSparkConnectionManager.connection_managers.clear()
+    yield
+    FabricSparkConnectionManager._prewarm = None
+    FabricSparkConnectionManager.connection_managers.clear()
+
+
+@patch("dbt.adapters.fabricspark.connections.get_lakehouse_properties", return_value={})
+def test_first_open_adopts_prewarmed_backend(mock_props):
+    backend = MagicMock()
+    backend.connect_async = AsyncMock()
+    creds = _creds()
+    with patch.object(FabricSparkConnectionManager, "_new_backend", return_value=backend):
+        FabricSparkConnectionManager.start_prewarm(creds)
+        FabricSparkConnectionManager._adopt_prewarmed("thread-1")
+        FabricSparkConnectionManager._adopt_prewarmed("thread-2")
+
+    assert FabricSparkConnectionManager.connection_managers == {"thread-1": backend}
+    backend.connect_async.assert_awaited_once_with(creds)
+    mock_props.assert_called_once_with(creds)
+    assert FabricSparkConnectionManager._prewarm is None
+
+
+def test_start_prewarm_is_idempotent():
+    backend = MagicMock()
+    backend.connect_async = AsyncMock()
+    with patch.object(FabricSparkConnectionManager, "_new_backend", return_value=backend):
+        FabricSparkConnectionManager.start_prewarm(_creds(local=True))
+        first = FabricSparkConnectionManager._prewarm
+        FabricSparkConnectionManager.start_prewarm(_creds(local=True))
+        assert FabricSparkConnectionManager._prewarm is first
+        first.result(timeout=5)
+
+
+def test_failed_prewarm_falls_back_to_normal_connect():
+    backend = MagicMock()
+    backend.connect_async = AsyncMock(side_effect=RuntimeError("capacity paused"))
+    with patch.object(FabricSparkConnectionManager, "_new_backend", return_value=backend):
+        FabricSparkConnectionManager.start_prewarm(_creds(local=True))
+        FabricSparkConnectionManager._adopt_prewarmed("thread-1")
+
+    assert FabricSparkConnectionManager.connection_managers == {}
+    assert FabricSparkConnectionManager._prewarm is None
+
+
+def test_cleanup_releases_unadopted_backend():
+    backend = MagicMock()
+    backend.connect_async = AsyncMock()
+    with patch.object(FabricSparkConnectionManager, "_new_backend", return_value=backend):
+        FabricSparkConnectionManager.start_prewarm(_creds(local=True))
+        FabricSparkConnectionManager._prewarm.result(timeout=5)
+
+    manager = FabricSparkConnectionManager.__new__(FabricSparkConnectionManager)
+    manager.cleanup_all()
+    backend.disconnect.assert_called_once()
+    assert FabricSparkConnectionManager._prewarm is None
+
+
+@pytest.mark.parametrize(
+    "flags, prewarmed",
+    [
+        (Namespace(WHICH="run"), True),
+        (Namespace(WHICH="generate"), True),
+        (Namespace(WHICH="parse"), False),
+        (Namespace(WHICH="compile"), False),
+        (Namespace(WHICH="list"), False),
+        (Namespace(WHICH="deps"), False),
+        (Namespace(WHICH="serve"), False),
+        (Namespace(USE_COLORS=True), True),
+    ],
+)
+def test_prewarm_starts_only_for_commands_that_run_sql(flags, prewarmed):
+    profile = MagicMock(threads=1)
+    profile.credentials.prewarm_session = True
+    profile.credentials.method = "livy"
+    with (
+        patch("dbt.flags.get_flags", return_value=flags),
+        patch.object(FabricSparkConnectionManager, "start_prewarm") as start,
+    ):
+        FabricSparkConnectionManager(profile, MagicMock())
+
+    assert start.called is prewarmed
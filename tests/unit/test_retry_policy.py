@@ -0,0 +1,109 @@
+"""Unit tests for the shared retry policy and circuit breaker."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from dbt.adapters.fabricspark import retry_policy
+from dbt.adapters.fabricspark.retry_policy import (
+    CircuitOpenError,
+    RetryPolicy,
+    configure_retry_policy,
+)
+
+URL = "https://api.fabric.microsoft.com/v1/workspaces/ws/lakehouses/lh/livyapi"
+
+
+def test_delays_are_jittered_within_base_and_cap():
+    policy = RetryPolicy(base=1.0, cap=8.0, budget=0)
+    delays = [policy.start("op", max_retries=50).next_delay() for _ in range(200)]
+    assert all(1.0 <= d <= 3.0 for d in delays)
+    # Independent states must not march in lockstep.
+    assert len({round(d, 6) for d in delays}) > 100
+
+    state = policy.start("op", max_retries=50)
+    assert all(1.0 <= state.next_delay() <= 8.0 for _ in range(30))
+
+
+def test_retry_limit_exhausts_state():
+    state = RetryPolicy(budget=0).start("op", max_retries=2)
+    assert not state.exhausted()
+    state.next_delay()
+    state.next_delay()
+    assert state.exhausted()
+
+
+def test_time_budget_caps_total_backoff():
+    state = RetryPolicy(base=4.0, cap=4.0, budget=10).start("op", max_retries=100)
+    total = state.next_delay() + state.next_delay() + state.next_delay()
+    assert total == pytest.approx(10.0)
+    assert state.exhausted()
+
+
+def test_retry_after_hint_is_never_undercut():
+    state = RetryPolicy(base=1.0, cap=2.0, budget=5).start("op", max_retries=10)
+    assert state.next_delay(hint=20.0) == 20.0
+
+
+def test_record_success_resets_retry_count_but_keeps_budget():
+    state = RetryPolicy(base=1.0, cap=1.0, budget=100).start("op", max_retries=1)
+    state.next_delay()
+    assert state.exhausted()
+    state.record_success()
+    assert not state.exhausted()
+    assert state.spent == pytest.approx(1.0)
+
+
+def test_circuit_opens_after_threshold_and_callers_wait_together():
+    policy = RetryPolicy(base=0.1, cap=0.1, budget=600, breaker_threshold=3, breaker_reset=30)
+    states = [policy.start("Livy poll", URL, max_retries=30) for _ in range(3)]
+    for state in states:
+        state.record_failure()
+    delays = [state.next_delay() for state in states]
+    # Every caller is pushed to the same reset window instead of its own 0.1s backoff.
+    assert all(25 < d <= 30 for d in delays)
+    assert policy.metrics()["circuit_opens"] == {"https://api.fabric.microsoft.com": 1}
+
+
+def test_open_circuit_fails_fast_when_wait_exceeds_budget():
+    policy = RetryPolicy(budget=5, breaker_threshold=1, breaker_reset=60)
+    state = policy.start("HC submit", URL)
+    state.record_failure()
+    with pytest.raises(CircuitOpenError, match="Circuit open"):
+        state.next_delay()
+
+
+def test_success_closes_circuit():
+    policy = RetryPolicy(breaker_threshold=1, breaker_reset=60)
+    state = policy.start("op", URL)
+    state.record_failure()
+    assert policy.breaker_for(URL).remaining() > 0
+    state.record_success()
+    assert policy.breaker_for(URL).remaining() == 0
+
+
+def test_metrics_aggregate_retries_per_operation():
+    policy = RetryPolicy(base=1.0, cap=1.0, budget=0)
+    policy.start("Livy submit").next_delay()
+    state = policy.start("Livy submit")
+    state.next_delay()
+    state.next_delay()
+    assert policy.metrics()["Livy submit"] == {"retries": 3, "retry_seconds": 3.0}
+
+
+def test_configure_applies_profile_settings(monkeypatch):
+    policy = RetryPolicy()
+    monkeypatch.setattr(retry_policy, "_policy", policy)
+    creds = MagicMock(
+        retry_base_delay=0.5,
+        retry_max_delay=10.0,
+        retry_budget=120,
+        circuit_breaker_threshold=0,
+        circuit_breaker_reset=15,
+    )
+    configure_retry_policy(creds)
+    assert (policy.base, policy.cap, policy.budget) == (0.5, 10.0, 120)
+    state = policy.start("op", URL)
+    for _ in range(50):
+        state.record_failure()
+    assert policy.breaker_for(URL).remaining() == 0
@@ -0,0 +1,175 @@
+"""Unit tests for bulk seed loading."""
+
+import contextlib
+import datetime as dt
+import io
+import sys
+import types
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import agate
+import pytest
+from dbt_common.exceptions import DbtDatabaseError
+
+from dbt.adapters.fabricspark import seed_loader, sql_binding
+from tests.unit.test_seed_macro import load_csv_rows_macro
+
+
+@pytest.fixture
+def fake_pyspark():
+    """Stand-ins for the pyspark types the load statement imports."""
+    module = types.ModuleType("pyspark.sql.types")
+    module.StringType = lambda: "string"
+    module.StructField = lambda name, kind, nullable: name
+    module.StructType = list
+    with patch.dict(
+        sys.modules,
+        {"pyspark": types.ModuleType("pyspark"), "pyspark.sql": types.ModuleType("pyspark.sql")},
+    ):
+        sys.modules["pyspark.sql.types"] = module
+        yield
+
+
+class _Driver:
+    """Runs generated pyspark statements in one namespace, like a Livy REPL."""
+
+    def __init__(self):
+        self.spark = MagicMock()
+        self.frames = []
+        self.spark.createDataFrame.side_effect = lambda rows, schema: (
+            self.frames.append((list(rows), schema)) or MagicMock()
+        )
+        self.namespace = {"spark": self.spark}
+        self.descriptions = []
+
+    def execute_code(self, code, description, kind="pyspark"):
+        self.descriptions.append(description)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            exec(code, self.namespace)
+        return {"output": {"status": "ok", "data": {"text/plain": out.getvalue()}}}
+
+
+def test_cells_render_like_bound_values():
+    values = [None, "it's \\ ü", True, 7, Decimal("1.50"), dt.datetime(2024, 1, 15, 10, 30, 45)]
+    cells = [seed_loader.cell_text(v) for v in values]
+    assert cells == ["", "it's \\ ü", "true", "7", "1.50", "2024-01-15 10:30:45.000"]
+    for value, cell in zip(values[2:], cells[2:]):
+        assert sql_binding.literal(value).strip("'") == cell
+
+
+@patch.object(seed_loader, "STAGE_ROWS_PER_STATEMENT", 2)
+def test_rows_are_staged_in_slices_and_inserted_once(fake_pyspark):
+    driver = _Driver()
+    rows = [(1, "a"), (2, None), (3, "c'"), (4, "d"), (5, "e")]
+
+    sql = seed_loader.load(driver, "lh.dbo.seed", rows, ["bigint", "string"])
+
+    assert len(driver.descriptions) == 4
+    assert (
+        sql
+        == "insert into lh.dbo.seed select cast(c0 as bigint), cast(c1 as string) from <staged rows>"
+    )
+    ((staged, schema),) = driver.frames
+    assert staged == [["1", "a"], ["2", ""], ["3", "c'"], ["4", "d"], ["5", "e"]]
+    assert schema == ["c0", "c1"]
+    insert = driver.spark.sql.call_args.args[0]
+    assert insert.startswith(
+        "insert into lh.dbo.seed select cast(c0 as bigint), cast(c1 as string) from _dbt_seed_"
+    )
+    driver.spark.catalog.dropTempView.assert_called_once()
+    assert driver.namespace["_dbt_seed_stage"] == {}
+
+
+def test_lost_staging_buffer_fails_the_load(fake_pyspark):
+    driver = _Driver()
+    scripts = seed_loader.build_scripts("lh.dbo.seed", [(1,), (2,)], ["int"])
+    out = driver.execute_code(scripts[0], "stage")
+    assert seed_loader.parse_count(out) == 2
+    driver.namespace["_dbt_seed_stage"].clear()  # e.g. the REPL was replaced mid-load
+    with pytest.raises(RuntimeError, match="holds 0 of 2 rows"):
+        driver.execute_code(scripts[-1], "load")
+
+
+def test_statement_error_is_raised():
+    with pytest.raises(DbtDatabaseError, match="AnalysisException"):
+        seed_loader.parse_count({"output": {"status": "error", "evalue": "AnalysisException"}})
+
+
+def test_content_hash_tracks_data_types_and_config():
+    digest = seed_loader.rows_digest([(1, "a"), (2, None)])
+    base = seed_loader.content_hash(digest, ["id", "v"], ["bigint", "string"], {"a": 1, "b": 2})
+
+    assert base == seed_loader.content_hash(
+        digest, ["id", "v"], ["bigint", "string"], {"b": 2, "a": 1}
+    )
+    for changed in (
+        seed_loader.content_hash(
+            seed_loader.rows_digest([(1, "a"), (2, "")]), ["id", "v"], ["bigint", "string"], {}
+        ),
+        seed_loader.content_hash(digest, ["id", "w"], ["bigint", "string"], {"a": 1, "b": 2}),
+        seed_loader.content_hash(digest, ["id", "v"], ["int", "string"], {"a": 1, "b": 2}),
+        seed_loader.content_hash(digest, ["id", "v"], ["bigint", "string"], {"a": 1, "b": 3}),
+    ):
+        assert changed != base
+
+
+def test_stored_hash_is_read_from_table_metadata():
+    seed_hash = "ab" * 32
+    extended = (
+        "Provider: delta\n"
+        f"Table Properties: [delta.minReaderVersion=1, {seed_loader.HASH_PROPERTY}={seed_hash}]\n"
+    )
+    assert seed_loader.stored_hash(extended) == seed_hash
+    assert seed_loader.stored_hash(f"{seed_loader.HASH_PROPERTY}={seed_hash}") == seed_hash
+    assert seed_loader.stored_hash("Provider: delta\nTable Properties: [a=b]") is None
+    assert seed_loader.stored_hash(None) is None
+
+
+def test_values_statements_match_the_seed_macro_batches():
+    rows = [(i, f"it's {i}", None) for i in range(700)]
+    table = agate.Table(rows, ["id", "name", "note"], [agate.Number(), agate.Text(), agate.Text()])
+    render, adapter = load_csv_rows_macro()
+    render(table)
+    expected = [sql_binding.bind(sql, bindings) for sql, bindings in adapter.queries]
+
+    statements = seed_loader.values_statements(
+        "lh.dbo.seed", table.rows, ["bigint", "string", "string"]
+    )
+
+    assert statements == expected
+    assert len(statements) == 2
+
+
+def test_parallel_load_stages_then_inserts_once():
+    connections = MagicMock()
+    connections.execute_parallel.return_value = 3
+    rows = [(i,) for i in range(1200)]
+
+    sql = seed_loader.load_parallel(connections, "lh.dbo.s", "lh.dbo.s__stage", rows, ["int"], 3)
+
+    executed = [c.args[0] for c in connections.execute.call_args_list]
+    assert executed == [
+        "drop table if exists lh.dbo.s__stage",
+        "create table lh.dbo.s__stage using delta as select * from lh.dbo.s where 1 = 0",
+        "insert into lh.dbo.s select * from lh.dbo.s__stage",
+        "drop table if exists lh.dbo.s__stage",
+    ]
+    assert sql == executed[2]
+    statements, _, repls = connections.execute_parallel.call_args.args
+    assert repls == 3
+    assert len(statements) == 3
+    assert all(s.startswith("insert into lh.dbo.s__stage values") for s in statements)
+
+
+def test_failed_parallel_load_drops_the_stage_and_leaves_the_seed_alone():
+    connections = MagicMock()
+    connections.execute_parallel.side_effect = DbtDatabaseError("boom")
+
+    with pytest.raises(DbtDatabaseError):
+        seed_loader.load_parallel(connections, "s", "s__stage", [(1,), (2,)], ["int"], 2)
+
+    executed = [c.args[0] for c in connections.execute.call_args_list]
+    assert executed[-1] == "drop table if exists s__stage"
+    assert not any(sql.startswith("insert into s ") for sql in executed)
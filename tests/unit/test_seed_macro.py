@@ -0,0 +1,116 @@
+"""Render the seed VALUES macro outside dbt to check what it sends."""
+
+from unittest.mock import patch
+
+import agate
+from jinja2 import Environment
+
+from dbt.adapters.fabricspark.impl import FabricSparkAdapter
+
+SEED_MACROS = "src/dbt/include/fabricspark/macros/materializations/seeds/seed.sql"
+
+
+class _Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+def _raise_return(value):
+    raise _Return(value)
+
+
+class _Relation:
+    def render(self):
+        return "lh.dbo.seed"
+
+
+class _Adapter:
+    convert_type = FabricSparkAdapter.convert_type
+    seed_column_types = FabricSparkAdapter.seed_column_types
+
+    def __init__(self):
+        self.queries = []
+
+    def use_bulk_seed_load(self, agate_table):
+        return False
+
+    def use_parallel_seed_load(self, agate_table):
+        return False
+
+    def add_query(self, sql, bindings=None, abridge_sql_log=False):
+        self.queries.append((sql, bindings))
+
+
+def load_csv_rows_macro(source=None):
+    """Return ``(render, adapter)``; ``render(table, column_types)`` runs the macro."""
+    if source is None:
+        with open(SEED_MACROS) as f:
+            text = f.read()
+        start = text.index("{% macro fabricspark__load_csv_rows")
+        source = text[start : text.index("{% endmacro %}", start) + len("{% endmacro %}")]
+    adapter = _Adapter()
+    template = Environment(extensions=["jinja2.ext.do"]).from_string(
+        source,
+        globals={
+            "adapter": adapter,
+            "this": _Relation(),
+            "log": lambda *a, **k: "",
+            "return": _raise_return,
+            "get_binding_char": lambda: "%s",
+            "calc_batch_size": lambda n: min(500, int(6000 / n) - 1),
+        },
+    )
+
+    def render(agate_table, column_types=None):
+        model = {"config": {"column_types": column_types or {}}}
+        try:
+            template.module.fabricspark__load_csv_rows(model, agate_table)
+        except _Return as ret:
+            return ret.value
+
+    return render, adapter
+
+
+def _table(rows):
+    return agate.Table(
+        rows,
+        ["id", "name", "score"],
+        [agate.Number(), agate.Text(), agate.Number()],
+    )
+
+
+def test_values_batches_use_one_row_template():
+    render, adapter = load_csv_rows_macro()
+    table = _table([(i, f"n{i}", i / 2) for i in range(3)])
+
+    first = render(table, {"name": "varchar(10)"})
+
+    sql, bindings = adapter.queries[0]
+    row = "(cast(%s as bigint),cast(%s as varchar(10)),cast(%s as double))"
+    assert sql == "insert into lh.dbo.seed values\n" + ",".join([row] * 3)
+    assert first == sql
+    assert len(bindings) == 9
+
+
+def test_column_types_are_inferred_once_per_column():
+    render, adapter = load_csv_rows_macro()
+    table = _table([(i, f"n{i}", i) for i in range(1200)])
+    with patch.object(
+        FabricSparkAdapter, "convert_number_type", return_value="bigint"
+    ) as convert_number:
+        render(table)
+
+    assert len(adapter.queries) == 3
+    assert convert_number.call_count == 2
+
+
+def test_number_type_matches_max_precision():
+    for values, expected in (
+        (["1", "2.0", None, "-3.000"], "bigint"),
+        (["1", "2.50", None], "double"),
+        ([None], "bigint"),
+    ):
+        table = agate.Table([(v,) for v in values], ["n"], [agate.Number()])
+        assert FabricSparkAdapter.convert_number_type(table, 0) == expected
+        max_precision = table.aggregate(agate.MaxPrecision(0))
+        assert expected == ("double" if max_precision else "bigint")
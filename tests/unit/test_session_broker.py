@@ -0,0 +1,206 @@
+"""Unit tests for the local session broker."""
+
+import os
+import shutil
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from azure.core.credentials import AccessToken
+
+from dbt.adapters.fabricspark import concurrent_livy, session_broker
+from dbt.adapters.fabricspark.concurrent_livy import (
+    HighConcurrencySession,
+    HighConcurrencySessionManager,
+)
+from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+from dbt.adapters.fabricspark.session_broker import (
+    BrokerClient,
+    BrokerError,
+    BrokerServer,
+    SessionBroker,
+)
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+
+
+def _make_creds(**overrides) -> FabricSparkCredentials:
+    base = dict(
+        method="livy",
+        livy_mode="fabric",
+        authentication="CLI",
+        workspaceid="1de8390c-9aca-4790-bee8-72049109c0f4",
+        lakehouseid="8c5bc260-bc3a-4898-9ada-01e433d461ba",
+        lakehouse="tests",
+        endpoint="https://api.fabric.microsoft.com/v1",
+        spark_config={"name": "test-session", "numExecutors": 4},
+        session_start_timeout=10,
+        poll_wait=0,
+    )
+    base.update(overrides)
+    return FabricSparkCredentials(**base)
+
+
+def _fake_acquirers():
+    counter = iter(range(1000))
+    calls = []
+
+    def _ready(session):
+        n = next(counter)
+        calls.append(n)
+        session.hc_id = f"hc-{n}"
+        session.session_id = "s"
+        session.repl_id = f"r-{n}"
+        session.is_new_session_required = False
+        session.is_dead = False
+
+    async def _ready_async(session):
+        _ready(session)
+
+    return _ready, _ready_async, calls
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    session_broker._clients.clear()
+    concurrent_livy._repl_pools.clear()
+    concurrent_livy._shard_occupancy.clear()
+    concurrent_livy._shortcuts_done.clear()
+    yield
+    session_broker._clients.clear()
+    concurrent_livy._repl_pools.clear()
+    concurrent_livy._shard_occupancy.clear()
+    concurrent_livy._shortcuts_done.clear()
+
+
+@pytest.fixture
+def broker():
+    # AF_UNIX paths are length-limited, so keep the directory short.
+    directory = tempfile.mkdtemp(prefix="fsb-", dir="/tmp")
+    path = os.path.join(directory, "b.sock")
+    server = BrokerServer(path, SessionBroker())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_disabled_or_local_mode_has_no_broker():
+    assert session_broker.get_broker(_make_creds()) is None
+    local = _make_creds(session_broker=True, livy_mode="local", endpoint="http://localhost:8998")
+    assert session_broker.get_broker(local) is None
+
+
+def test_socket_is_private(broker):
+    assert stat.S_IMODE(os.stat(broker).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(os.path.dirname(broker)).st_mode) == 0o700
+
+
+def test_ping_meta_and_errors(broker):
+    client = BrokerClient(broker)
+    assert client.ping()
+    assert client.meta_get("spark_version:ws:lh") is None
+    client.meta_put("spark_version:ws:lh", "3.5")
+    assert client.meta_get("spark_version:ws:lh") == "3.5"
+    with pytest.raises(BrokerError):
+        client.request("nope")
+
+
+def test_existing_broker_is_reused_without_spawning(broker):
+    creds = _make_creds(session_broker=True, session_broker_socket=broker)
+    with patch.object(session_broker, "_spawn") as spawn:
+        client = session_broker.get_broker(creds)
+    assert client is not None and client.socket_path == broker
+    spawn.assert_not_called()
+
+
+def test_token_is_served_by_broker(broker):
+    creds = _make_creds(session_broker=True, session_broker_socket=broker)
+    token = AccessToken(token="brokered", expires_on=int(time.time()) + 3600)
+    with patch("dbt.adapters.fabricspark.livysession.get_access_token", return_value=token):
+        assert BrokerClient(broker).token(creds) == token
+
+
+@patch.object(concurrent_livy, "REPL_POOL_JITTER_SECONDS", 0)
+@patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+@patch("dbt.adapters.fabricspark.concurrent_livy._maybe_create_shortcuts")
+def test_released_repl_is_leased_again_by_next_process(_shortcuts, _sleep, broker):
+    creds = _make_creds(session_broker=True, session_broker_socket=broker)
+    ready, ready_async, calls = _fake_acquirers()
+    with (
+        patch.object(HighConcurrencySession, "acquire", ready),
+        patch.object(HighConcurrencySession, "acquire_async", ready_async),
+    ):
+        first = HighConcurrencySessionManager()
+        first.connect(creds)
+        hc_id = first._hc_session.hc_id
+        assert first._hc_session not in concurrent_livy._active_sessions
+        first.disconnect()
+
+        second = HighConcurrencySessionManager()
+        second.connect(creds)
+        assert second._hc_session.hc_id == hc_id
+        assert second._hc_session.is_new_session_required is False
+
+    assert calls == [0]
+    stats = BrokerClient(broker).request("stats")
+    assert stats["leased"] == 1
+    assert stats["requests"]["lease"] == 2
+
+
+@patch.object(session_broker, "LEASE_WAIT_SECONDS", 0.2)
+@patch.object(concurrent_livy, "REPL_POOL_JITTER_SECONDS", 0)
+@patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+def test_lease_of_exited_client_is_reclaimed_and_busy_pool_answers_at_once(_sleep, broker):
+    creds = _make_creds(session_broker=True, session_broker_socket=broker)
+    ready, ready_async, calls = _fake_acquirers()
+    leased = {}
+
+    def lease(name):
+        start = time.monotonic()
+        session = concurrent_livy.BrokeredReplPool(creds, 0).lease()
+        leased[name] = (session and session.hc_id, time.monotonic() - start)
+
+    with (
+        patch.object(HighConcurrencySession, "acquire", ready),
+        patch.object(HighConcurrencySession, "acquire_async", ready_async),
+    ):
+        # A client process that takes a lease and dies without releasing it.
+        other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        crashed = BrokerClient(broker).request(
+            "lease",
+            credentials=session_broker._wire_credentials(creds),
+            shard=0,
+            threads=1,
+            pid=other.pid,
+        )
+        other.kill()
+        other.wait()
+        clients = [threading.Thread(target=lease, args=(name,)) for name in ("a", "b")]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join(5)
+
+    assert calls == [0]
+    assert sorted(hc_id or "" for hc_id, _ in leased.values()) == ["", crashed["hc_id"]]
+    assert all(elapsed < 2 for _, elapsed in leased.values())
+    assert session_broker.get_broker(creds) is not None
+    assert BrokerClient(broker).request("stats")["leased"] == 1
+
+
+def test_failed_broker_call_falls_back_and_disables_broker(tmp_path):
+    creds = _make_creds(session_broker=True, session_broker_socket=str(tmp_path / "gone.sock"))
+    session_broker._clients[session_broker.resolve_socket_path(creds)] = BrokerClient(
+        str(tmp_path / "gone.sock")
+    )
+    assert session_broker.broker_call(creds, "meta_get", "k") is None
+    assert session_broker.get_broker(creds) is None
@@ -17,7 +17,7 @@ class TestShorcutClient(unittest.TestCase):
         )
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
         with mock.patch.object(client, "check_if_exists_and_delete_shortcut", return_value=False):
-            with mock.patch("requests.post") as mock_post:
+            with mock.patch("dbt.adapters.fabricspark._http_utils.post") as mock_post:
                 client.create_shortcut(shortcut)
                 mock_post.assert_called_once()
                 self.assertEqual(
@@ -37,7 +37,7 @@ class TestShorcutClient(unittest.TestCase):
         )
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
         with mock.patch.object(client, "check_if_exists_and_delete_shortcut", return_value=True):
-            with mock.patch("requests.post") as mock_post:
+            with mock.patch("dbt.adapters.fabricspark._http_utils.post") as mock_post:
                 client.create_shortcut(shortcut)
                 mock_post.assert_not_called()
 
@@ -52,7 +52,7 @@ class TestShorcutClient(unittest.TestCase):
             source_item_id="source_item_id",
         )
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("dbt.adapters.fabricspark._http_utils.get") as mock_get:
             mock_get.return_value.status_code = 404
             self.assertFalse(client.check_if_exists_and_delete_shortcut(shortcut))
 
@@ -67,7 +67,7 @@ class TestShorcutClient(unittest.TestCase):
             source_item_id="source_item_id",
         )
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("dbt.adapters.fabricspark._http_utils.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "path": "path",
@@ -96,7 +96,7 @@ class TestShorcutClient(unittest.TestCase):
             source_item_id="source_item_id",
         )
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("dbt.adapters.fabricspark._http_utils.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "path": "path",
@@ -116,7 +116,7 @@ class TestShorcutClient(unittest.TestCase):
                 self.assertEqual(mock_delete.call_args[0][0], "path")
                 self.assertEqual(mock_delete.call_args[0][1], "name")
                 # check that the client creates a new shortcut after deleting the old one
-                with mock.patch("requests.post") as mock_post:
+                with mock.patch("dbt.adapters.fabricspark._http_utils.post") as mock_post:
                     client.create_shortcut(shortcut)
                     mock_post.assert_called_once()
                     self.assertEqual(
@@ -141,7 +141,7 @@ class TestShorcutClient(unittest.TestCase):
             source_item_id="source_item_id",
         )
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("dbt.adapters.fabricspark._http_utils.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "path": "path",
@@ -161,7 +161,7 @@ class TestShorcutClient(unittest.TestCase):
                 self.assertEqual(mock_delete.call_args[0][0], "path")
                 self.assertEqual(mock_delete.call_args[0][1], "name")
                 # check that the client creates a new shortcut after deleting the old one
-                with mock.patch("requests.post") as mock_post:
+                with mock.patch("dbt.adapters.fabricspark._http_utils.post") as mock_post:
                     client.create_shortcut(shortcut)
                     mock_post.assert_called_once()
                     self.assertEqual(
@@ -186,7 +186,7 @@ class TestShorcutClient(unittest.TestCase):
             source_item_id="source_item_id",
         )
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("dbt.adapters.fabricspark._http_utils.get") as mock_get:
             mock_get.return_value.status_code = 200
             mock_get.return_value.json.return_value = {
                 "path": "path",
@@ -206,7 +206,7 @@ class TestShorcutClient(unittest.TestCase):
                 self.assertEqual(mock_delete.call_args[0][0], "path")
                 self.assertEqual(mock_delete.call_args[0][1], "name")
                 # check that the client creates a new shortcut after deleting the old one
-                with mock.patch("requests.post") as mock_post:
+                with mock.patch("dbt.adapters.fabricspark._http_utils.post") as mock_post:
                     client.create_shortcut(shortcut)
                     mock_post.assert_called_once()
                     self.assertEqual(
@@ -229,15 +229,15 @@ class TestShorcutClient(unittest.TestCase):
             source_item_id="source_item_id",
         )
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
-        with mock.patch("requests.get") as mock_get:
+        with mock.patch("dbt.adapters.fabricspark._http_utils.get") as mock_get:
             mock_get.return_value.status_code = 500
             with self.assertRaises(Exception):
                 client.check_if_exists_and_delete_shortcut(shortcut)
 
     def test_delete_shortcut_succeeds(self):
-        # delete_shortcut calls requests.delete
+        # delete_shortcut calls _http_utils.delete
         client = ShortcutClient(token="token", workspace_id="workspace_id", item_id="item_id")
-        with mock.patch("requests.delete") as mock_delete:
+        with mock.patch("dbt.adapters.fabricspark._http_utils.delete") as mock_delete:
             client.delete_shortcut("path", "name")
             mock_delete.assert_called_once()
             self.assertEqual(
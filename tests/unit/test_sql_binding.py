@@ -0,0 +1,92 @@
+"""Unit tests for client-side parameter binding."""
+
+import datetime as dt
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.fabricspark import sql_binding
+from dbt.adapters.fabricspark.connections import LivySessionConnectionWrapper
+from dbt.adapters.fabricspark.singleton_livy import LivyCursor
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("hello", "'hello'"),
+        ("Cote d'Ivoire", "'Cote d\\'Ivoire'"),
+        ("it's a 'test'", "'it\\'s a \\'test\\''"),
+        ("C:\\temp\\", "'C:\\\\temp\\\\'"),
+        ("\\' or 1=1 --", "'\\\\\\' or 1=1 --'"),
+        ("Zürich ☃ \U0001f600", "'Zürich ☃ \U0001f600'"),
+        ("100%", "'100%'"),
+        (None, "''"),
+        (True, "true"),
+        (42, "42"),
+        (2**63 - 1, "9223372036854775807"),
+        (3.14, "3.14"),
+        (float("nan"), "'NaN'"),
+        (float("-inf"), "'-Infinity'"),
+        (Decimal("12345678901234567890.125"), "12345678901234567890.125"),
+        (Decimal("1E+3"), "1000"),
+        (dt.datetime(2024, 1, 15, 10, 30, 45, 123456), "'2024-01-15 10:30:45.123'"),
+        (dt.date(2024, 1, 15), "'2024-01-15'"),
+    ],
+)
+def test_literal(value, expected):
+    assert sql_binding.literal(value) == expected
+
+
+def test_seed_insert_with_single_quote_produces_valid_sql():
+    sql_template = (
+        "insert into db.schema.sample values "
+        "(cast(%s as bigint),cast(%s as string)),(cast(%s as bigint),cast(%s as string))"
+    )
+    sql = sql_binding.bind(sql_template, [1, "Cote d'Ivoire", 2, "Tonga"])
+    assert sql == (
+        "insert into db.schema.sample values "
+        "(cast(1 as bigint),cast('Cote d\\'Ivoire' as string)),"
+        "(cast(2 as bigint),cast('Tonga' as string))"
+    )
+
+
+def test_literal_percent_signs_do_not_break_binding():
+    template = (
+        "/* 50% done */ select %s, '%s literal', a % 2, a %% 3 "
+        "from t where b like 'x%' -- %s\nand c = %s"
+    )
+    plan = sql_binding.compile_plan(template)
+    assert plan.placeholders == 2
+    assert plan.render(["v", 7]) == (
+        "/* 50% done */ select 'v', '%s literal', a % 2, a % 3 "
+        "from t where b like 'x%' -- %s\nand c = 7"
+    )
+
+
+def test_plan_is_compiled_once_per_template():
+    template = "insert into t values " + ",".join(["(cast(%s as int))"] * 3)
+    sql_binding.compile_plan.cache_clear()
+    sql_binding.bind(template, [1, 2, 3])
+    sql_binding.bind(template, [4, 5, 6])
+    assert sql_binding.compile_plan.cache_info().hits == 1
+
+
+def test_wrong_number_of_bindings_is_an_error():
+    with pytest.raises(DbtRuntimeError, match="2 placeholders but 1 bindings"):
+        sql_binding.bind("select %s, %s", [1])
+
+
+def test_wrapper_binds_before_submitting():
+    cursor = LivyCursor.__new__(LivyCursor)
+    wrapper = LivySessionConnectionWrapper.__new__(LivySessionConnectionWrapper)
+    wrapper._cursor = cursor
+    with patch.object(LivyCursor, "_getLivyResult", side_effect=RuntimeError) as _result:
+        with (
+            patch.object(LivyCursor, "_submitLivyCode") as submit,
+            pytest.raises(RuntimeError),
+        ):
+            wrapper.execute("select %s, %s;", ["a\\b", None])
+    submit.assert_called_once_with("select 'a\\\\b', ''")
+    _result.assert_called_once()
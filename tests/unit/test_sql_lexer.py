@@ -0,0 +1,57 @@
+"""Unit tests for the single-pass SQL lexer."""
+
+import pytest
+
+from dbt.adapters.fabricspark.sql_lexer import (
+    clean_statement,
+    split_statements,
+    strip_comments,
+    strip_terminator,
+)
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("/* dbt header */\nselect 1", "select 1"),
+        ("select 1   /* a */   from t", "select 1\nfrom t"),
+        ("select 1 /* outer /* inner */ still outer */ from t", "select 1\nfrom t"),
+        ("select 1 -- trailing /* not a block\nfrom t", "select 1 \nfrom t"),
+        (
+            "select '/* kept */', \"-- kept\", `c/*` from t",
+            "select '/* kept */', \"-- kept\", `c/*` from t",
+        ),
+        ("select 'it\\'s /* kept */' from t", "select 'it\\'s /* kept */' from t"),
+        ("select r'C:\\' /* gone */", "select r'C:\\'"),
+        ("select /*+ BROADCAST(t) */ * from t", "select /*+ BROADCAST(t) */ * from t"),
+        ("select a - b / c from t", "select a - b / c from t"),
+        ("select 1 /* unterminated", "select 1 /* unterminated"),
+    ],
+)
+def test_strip_comments(sql, expected):
+    assert strip_comments(sql) == expected
+
+
+def test_clean_statement_drops_trailing_semicolons_only():
+    assert clean_statement("select ';' ;  ;\n") == "select ';'"
+    assert clean_statement("select 1; -- done\n") == "select 1"
+    assert strip_terminator("  select 1 ;\n") == "select 1"
+
+
+def test_split_statements_ignores_quoted_and_commented_semicolons():
+    script = """
+        create table t (a string); -- first; still a comment
+        /* ; */ insert into t values ('x;y');
+        ;
+        select `a;b` from t
+    """
+    assert split_statements(script) == [
+        "create table t (a string)",
+        "insert into t values ('x;y')",
+        "select `a;b` from t",
+    ]
+
+
+def test_large_input_is_handled_in_one_pass():
+    sql = ("select 1 as a,  /* c */\n" + " " * 200 + "\n") * 20000 + "select 2"
+    assert clean_statement(sql).count("\n") == 20000
@@ -0,0 +1,118 @@
+"""Unit tests for the shared Livy statement poller."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
+
+from dbt.adapters.fabricspark import statement_poller
+from dbt.adapters.fabricspark.statement_poller import StatementPoller, StatementTimeoutError
+
+URL = "https://api.fabric.microsoft.com/v1/ws/lh/livyapi/sessions/s1/statements"
+
+
+def _creds(statement_timeout=30):
+    creds = MagicMock()
+    creds.statement_timeout = statement_timeout
+    creds.poll_statement_wait = 0
+    creds.http_timeout = 5
+    return creds
+
+
+def _response(status, body=None, text=""):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.json.return_value = body or {}
+    resp.text = text
+    resp.headers = {}
+    return resp
+
+
+def _available(statement_id, rows=None):
+    return {
+        "id": statement_id,
+        "state": "available",
+        "output": {"status": "ok", "data": {"application/json": {"data": rows or []}}},
+    }
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_single_statement_polls_until_available(mock_get):
+    mock_get.side_effect = [
+        _response(200, {"id": 7, "state": "running"}),
+        _response(200, _available(7, [[1]])),
+    ]
+    poller = StatementPoller()
+    body = poller.wait(URL, 7, _creds(), headers=dict)
+
+    assert body["output"]["data"]["application/json"]["data"] == [[1]]
+    assert mock_get.call_args_list[0].args[0] == URL + "/7"
+    assert poller.in_flight() == 0
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_statements_sharing_a_collection_use_one_list_call(mock_get):
+    def fake_get(url, params=None, **kwargs):
+        if params is not None:
+            assert url == URL
+            assert params == {"from": 3, "size": 2}
+            return _response(200, {"statements": [_available(3), _available(4, [["x"]])]})
+        return _response(200, {"id": int(url.rsplit("/", 1)[1]), "state": "running"})
+
+    mock_get.side_effect = fake_get
+    poller = StatementPoller()
+    creds = _creds()
+    with poller._cond:
+        # Register both before the scheduler runs so they are due together.
+        first = poller.watch(URL, 3, creds, headers=dict)
+        second = poller.watch(URL, 4, creds, headers=dict)
+
+    assert first.result(timeout=5)["id"] == 3
+    assert second.result(timeout=5)["output"]["data"]["application/json"]["data"] == [["x"]]
+    assert poller.request_count == 1
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_list_endpoint_rejection_falls_back_to_single_polls(mock_get):
+    def fake_get(url, params=None, **kwargs):
+        if params is not None:
+            return _response(400, text="bad query")
+        return _response(200, _available(int(url.rsplit("/", 1)[1])))
+
+    mock_get.side_effect = fake_get
+    poller = StatementPoller()
+    creds = _creds()
+    with poller._cond:
+        first = poller.watch(URL, 1, creds, headers=dict)
+        second = poller.watch(URL, 2, creds, headers=dict)
+
+    assert first.result(timeout=5)["id"] == 1
+    assert second.result(timeout=5)["id"] == 2
+    assert URL in poller._no_list
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_error_state_raises_database_error(mock_get):
+    mock_get.return_value = _response(
+        200, {"id": 1, "state": "error", "output": {"evalue": "table not found"}}
+    )
+    with pytest.raises(DbtDatabaseError, match="table not found"):
+        StatementPoller().wait(URL, 1, _creds(), headers=dict)
+
+
+@patch.object(statement_poller, "MAX_NOT_FOUND_RETRIES", 1)
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_exhausted_404_calls_on_not_found(mock_get):
+    mock_get.return_value = _response(404, text="statement gone")
+    on_not_found = MagicMock()
+    with pytest.raises(DbtRuntimeError, match="HTTP 404"):
+        StatementPoller().wait(URL, 1, _creds(), headers=dict, on_not_found=on_not_found)
+    on_not_found.assert_called_once()
+    assert mock_get.call_count == 2
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_statement_timeout_raises_non_retryable_error(mock_get):
+    mock_get.return_value = _response(200, {"id": 1, "state": "running"})
+    with pytest.raises(StatementTimeoutError, match="Increase `statement_timeout`"):
+        StatementPoller().wait(URL, 1, _creds(statement_timeout=1), headers=dict)
@@ -0,0 +1,276 @@
+"""Unit tests for statement fingerprints and reattach-on-resubmit."""
+
+import json
+import os
+import sqlite3
+import stat
+import sys
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import requests
+from dbt_common.exceptions import DbtDatabaseError, DbtRuntimeError
+
+from dbt.adapters.fabricspark import concurrent_livy, statement_registry
+from dbt.adapters.fabricspark.concurrent_livy import HighConcurrencyCursor, HighConcurrencySession
+from dbt.adapters.fabricspark.credentials import FabricSparkCredentials
+from dbt.adapters.fabricspark.livy_engine import LivyEngine
+from dbt.adapters.fabricspark.statement_registry import MARKER_PREFIX, StatementRegistry
+
+URL = "https://api.fabric.microsoft.com/v1/ws/lh/livyapi/sessions/s1/statements"
+
+
+def _creds(**overrides):
+    base = dict(
+        method="livy",
+        livy_mode="fabric",
+        authentication="CLI",
+        workspaceid="1de8390c-9aca-4790-bee8-72049109c0f4",
+        lakehouseid="8c5bc260-bc3a-4898-9ada-01e433d461ba",
+        lakehouse="tests",
+        endpoint="https://api.fabric.microsoft.com/v1",
+        spark_config={"name": "test-session"},
+    )
+    base.update(overrides)
+    return FabricSparkCredentials(**base)
+
+
+def _response(status, body=None):
+    resp = MagicMock()
+    resp.status_code = status
+    resp.json.return_value = body or {}
+    resp.text = ""
+    resp.headers = {}
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def _reset_registries():
+    statement_registry._registries.clear()
+    yield
+    statement_registry._registries.clear()
+
+
+def test_tag_appends_unique_marker():
+    fp = statement_registry.fingerprint("SELECT 1")
+    first, marker = statement_registry.tag("SELECT 1", fp)
+    second, _ = statement_registry.tag("SELECT 1", fp)
+    assert first.startswith("SELECT 1\n" + MARKER_PREFIX + fp)
+    assert first.endswith(marker)
+    assert first != second
+
+
+@patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+@patch("dbt.adapters.fabricspark._http_utils.get")
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_timed_out_submit_reattaches_to_accepted_statement(mock_post, mock_get, _sleep):
+    mock_post.side_effect = requests.exceptions.ReadTimeout("read timed out")
+
+    def listing(url, **kwargs):
+        submitted = json.loads(mock_post.call_args.kwargs["data"])["code"]
+        return _response(
+            200, {"statements": [{"id": 0, "code": "x"}, {"id": 8, "code": submitted}]}
+        )
+
+    mock_get.side_effect = listing
+    engine = LivyEngine()
+    res = engine.run(
+        engine.submit_statement(URL, "MERGE INTO t", _creds(), headers=dict, fingerprint="fp")
+    )
+
+    assert res.json()["id"] == 8
+    assert mock_post.call_count == 1
+
+
+@patch("dbt.adapters.fabricspark.livy_engine.LivyEngine.sleep", new_callable=AsyncMock)
+@patch("dbt.adapters.fabricspark._http_utils.get")
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_rejected_submit_is_posted_again(mock_post, mock_get, _sleep):
+    mock_post.side_effect = [
+        requests.exceptions.ConnectionError("reset"),
+        _response(200, {"id": 3}),
+    ]
+    mock_get.return_value = _response(200, {"statements": []})
+    engine = LivyEngine()
+    res = engine.run(
+        engine.submit_statement(URL, "SELECT 1", _creds(), headers=dict, fingerprint="fp")
+    )
+
+    assert res.json()["id"] == 3
+    assert mock_post.call_count == 2
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_resume_only_running_or_own_unread_statements(mock_get):
+    registry = StatementRegistry()
+    registry.record("fp", URL, 4)
+
+    mock_get.return_value = _response(200, {"id": 4, "state": "running"})
+    assert registry.resume("fp", URL, _creds(), dict)["id"] == 4
+    assert registry.resume("fp", URL + "-other", _creds(), dict) is None
+
+    with pytest.raises(DbtRuntimeError), registry.consuming("fp"):
+        raise DbtRuntimeError("poll failed")
+    mock_get.return_value = _response(200, {"id": 4, "state": "available"})
+    assert registry.resume("fp", URL, _creds(), dict)["id"] == 4
+    with patch.object(registry, "_claim", return_value={"url": URL, "id": 4, "pid": -1}):
+        assert registry.resume("fp", URL, _creds(), dict) is None
+    assert registry.lookup("fp") is None
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_finished_statement_is_only_reattached_by_an_immediate_retry(mock_get):
+    registry = StatementRegistry()
+    mock_get.return_value = _response(200, {"id": 4, "state": "available"})
+
+    def broken_poll(statement_fingerprint):
+        with pytest.raises(DbtRuntimeError), registry.consuming(statement_fingerprint):
+            raise DbtRuntimeError("poll failed")
+
+    registry.record("refresh", URL, 4)
+    broken_poll("refresh")
+    registry.record("audit", URL, 5)
+    assert registry.resume("refresh", URL, _creds(), dict) is None
+
+    registry.record("refresh", URL, 4)
+    broken_poll("refresh")
+    later = time.time() + statement_registry.RETRY_WINDOW_SECONDS + 1
+    with patch("time.time", return_value=later):
+        assert registry.resume("refresh", URL, _creds(), dict) is None
+    assert registry.lookup("refresh") is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX process checks")
+@patch("dbt.adapters.fabricspark._http_utils.get")
+def test_only_orphaned_records_of_other_processes_are_adopted(mock_get, tmp_path):
+    path = str(tmp_path / "statements.db")
+    mock_get.return_value = _response(200, {"id": 7, "state": "running"})
+
+    for pid, adopted in ((os.getppid(), False), (2**22 + 12345, True)):
+        StatementRegistry(path).record("fp", URL, 7)
+        with sqlite3.connect(path) as db:
+            db.execute("update statements set owner = ?, pid = ?", (f"{pid}:1", pid))
+        registry = StatementRegistry(path)
+        assert (registry.resume("fp", URL, _creds(), dict) is not None) is adopted
+        assert (registry.lookup("fp") is not None) is adopted
+        os.unlink(path)
+
+
+def test_concurrent_writers_keep_every_record(tmp_path):
+    path = str(tmp_path / "statements.db")
+    start = threading.Barrier(8)
+
+    def submit(n):
+        registry = StatementRegistry(path)
+        start.wait(timeout=5)
+        registry.record(f"fp-{n}", URL, n)
+
+    threads = [threading.Thread(target=submit, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    with sqlite3.connect(path) as db:
+        assert sorted(row[0] for row in db.execute("select id from statements")) == list(range(8))
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_concurrent_identical_statements_each_run(mock_post, mock_get):
+    creds = _creds()
+    ids = iter(range(1, 100))
+    lock = threading.Lock()
+
+    def post(*args, **kwargs):
+        with lock:
+            return _response(200, {"id": next(ids)})
+
+    mock_post.side_effect = post
+    mock_get.side_effect = lambda url, **kwargs: _response(
+        200, {"id": int(url.rsplit("/", 1)[1]), "state": "running"}
+    )
+    first_submitted = threading.Event()
+    second_submitted = threading.Event()
+    waited = []
+
+    async def wait(engine, url, statement_id, *args, **kwargs):
+        waited.append(statement_id)
+        return {"id": statement_id, "state": "available", "output": {"status": "ok", "data": {}}}
+
+    def run(second):
+        hc = HighConcurrencySession(creds, creds.spark_config)
+        hc.hc_id, hc.session_id, hc.repl_id = "hc", "s", "r"
+        hc.is_new_session_required = False
+        cursor = HighConcurrencyCursor(creds, hc)
+        # The second thread submits while the first one's statement is running.
+        if second:
+            first_submitted.wait(timeout=5)
+        response = cursor._submit("INSERT INTO audit_log VALUES (1)")
+        (second_submitted if second else first_submitted).set()
+        second_submitted.wait(timeout=5)
+        cursor._poll(response)
+
+    with (
+        patch.object(concurrent_livy, "_get_headers", return_value={}),
+        patch.object(LivyEngine, "wait_statement", wait),
+    ):
+        threads = [threading.Thread(target=run, args=(second,)) for second in (False, True)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+    assert mock_post.call_count == 2
+    assert sorted(waited) == [1, 2]
+
+
+def test_consuming_keeps_record_only_when_the_wait_broke():
+    registry = StatementRegistry()
+    for error, kept in ((DbtRuntimeError("poll failed"), True), (DbtDatabaseError("bad"), False)):
+        registry.record("fp", URL, 1)
+        with pytest.raises(type(error)), registry.consuming("fp"):
+            raise error
+        assert (registry.lookup("fp") is not None) is kept
+
+    registry.record("fp", URL, 1)
+    with registry.consuming("fp"):
+        pass
+    assert registry.lookup("fp") is None
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_file_registry_survives_the_process(tmp_path):
+    path = str(tmp_path / "statements.db")
+    StatementRegistry(path).record("fp", URL, 11)
+
+    assert StatementRegistry(path).lookup("fp")["id"] == 11
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+@patch("dbt.adapters.fabricspark._http_utils.get")
+@patch("dbt.adapters.fabricspark._http_utils.post")
+def test_cursor_retry_waits_on_running_statement_instead_of_resubmitting(mock_post, mock_get):
+    creds = _creds()
+    hc = HighConcurrencySession(creds, creds.spark_config)
+    hc.hc_id, hc.session_id, hc.repl_id = "hc", "s", "r"
+    hc.is_new_session_required = False
+    cursor = HighConcurrencyCursor(creds, hc)
+    mock_post.return_value = _response(200, {"id": 5})
+    mock_get.return_value = _response(200, {"id": 5, "state": "running"})
+    done = {"id": 5, "state": "available", "output": {"status": "ok", "data": {}}}
+    wait = AsyncMock(side_effect=[DbtRuntimeError("poll failed after 30 retries"), done])
+
+    with (
+        patch.object(concurrent_livy, "_get_headers", return_value={}),
+        patch.object(LivyEngine, "wait_statement", wait),
+    ):
+        with pytest.raises(DbtRuntimeError):
+            cursor.execute("MERGE INTO t USING s ON t.id = s.id")
+        cursor.execute("MERGE INTO t USING s ON t.id = s.id")
+
+    assert mock_post.call_count == 1
+    assert wait.await_args.args[1] == 5
+    assert statement_registry.get_registry(creds).lookup(cursor._fingerprint) is None
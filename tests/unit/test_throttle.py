@@ -0,0 +1,124 @@
+"""Unit tests for the process-wide request throttle."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dbt.adapters.fabricspark._http_utils import HttpTransport
+from dbt.adapters.fabricspark.throttle import MIN_RPS, ThrottleCoordinator, TokenBucket
+
+WS_URL = "https://api.fabric.microsoft.com/v1/workspaces/WS1/lakehouses/lh/livyapi/sessions"
+
+
+def test_key_for_separates_origin_and_workspace():
+    assert ThrottleCoordinator.key_for(WS_URL) == ("https://api.fabric.microsoft.com", "ws1")
+    assert ThrottleCoordinator.key_for("https://onelake.dfs.fabric.microsoft.com/x") == (
+        "https://onelake.dfs.fabric.microsoft.com",
+        "",
+    )
+
+
+def test_buckets_are_shared_per_workspace():
+    coordinator = ThrottleCoordinator()
+    a = coordinator.bucket_for(WS_URL)
+    b = coordinator.bucket_for(WS_URL.replace("/sessions", "/sessions/1/statements"))
+    c = coordinator.bucket_for(WS_URL.replace("WS1", "WS2"))
+    assert a is b
+    assert a is not c
+
+
+def test_throttled_bucket_pauses_every_caller():
+    bucket = TokenBucket(max_rps=100)
+    bucket.on_throttled(0.2)
+    start = time.monotonic()
+    waits = []
+    threads = [threading.Thread(target=lambda: waits.append(bucket.acquire())) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert time.monotonic() - start >= 0.2
+    assert all(w > 0 for w in waits)
+    assert bucket.throttled == 1
+
+
+def test_async_acquire_waits_without_blocking_the_loop():
+    bucket = TokenBucket(max_rps=100)
+    bucket.on_throttled(0.2)
+
+    async def _many():
+        return await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+    start = time.monotonic()
+    with patch("dbt.adapters.fabricspark.throttle.time.sleep", side_effect=AssertionError):
+        waits = asyncio.run(_many())
+    assert time.monotonic() - start >= 0.2
+    assert all(w > 0 for w in waits)
+
+
+def test_rate_drops_on_throttle_and_recovers_on_success():
+    bucket = TokenBucket(max_rps=40)
+    bucket.on_throttled(0)
+    assert bucket.rate == 10
+    bucket.on_throttled(0)
+    bucket.on_throttled(0)
+    assert bucket.rate == MIN_RPS
+    for _ in range(1000):
+        bucket.on_success()
+    assert bucket.rate == 40
+
+
+def test_configure_lowers_existing_buckets():
+    coordinator = ThrottleCoordinator(max_rps=50)
+    bucket = coordinator.bucket_for(WS_URL)
+    coordinator.configure(5)
+    assert bucket.max_rps == 5
+    assert bucket.rate == 5
+    coordinator.configure(None)
+    assert coordinator.max_rps == 5
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        status = 429 if type(self).calls == 1 else 200
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def throttling_server():
+    _ThrottlingHandler.calls = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottlingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_429_holds_back_the_next_request(throttling_server):
+    transport = HttpTransport()
+    url = f"{throttling_server}/v1/workspaces/ws/items"
+    try:
+        assert transport.request("GET", url).status_code == 429
+        start = time.monotonic()
+        assert transport.request("GET", url).status_code == 200
+        assert time.monotonic() - start >= 0.9
+        stats = transport.throttle.stats()[f"{throttling_server} workspace=ws"]
+        assert stats["throttled"] == 1
+    finally:
+        transport.close()
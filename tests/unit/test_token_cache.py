@@ -0,0 +1,97 @@
+"""Unit tests for the optional on-disk token cache."""
+
+import json
+import os
+import stat
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from azure.core.credentials import AccessToken
+
+from dbt.adapters.fabricspark import token_cache
+from dbt.adapters.fabricspark.token_cache import get_or_acquire
+
+SCOPE = "https://analysis.windows.net/powerbi/api/.default"
+
+
+def _creds(client_id=None):
+    return SimpleNamespace(
+        authentication="CLI",
+        tenant_id="tenant",
+        client_id=client_id,
+        credential_class=None,
+        credential_kwargs={},
+    )
+
+
+def _acquire(token="fresh", lifetime=3600):
+    return MagicMock(return_value=AccessToken(token=token, expires_on=int(time.time()) + lifetime))
+
+
+def test_disabled_without_path():
+    acquire = _acquire()
+    assert get_or_acquire(None, _creds(), SCOPE, acquire).token == "fresh"
+    assert get_or_acquire(None, _creds(), SCOPE, acquire).token == "fresh"
+    assert acquire.call_count == 2
+
+
+def test_second_process_reuses_cached_token(tmp_path):
+    path = str(tmp_path / "tokens.json")
+    first = _acquire("from-az")
+    assert get_or_acquire(path, _creds(), SCOPE, first).token == "from-az"
+
+    second = _acquire("unused")
+    hits_before = token_cache.token_cache_stats()["hits"]
+    assert get_or_acquire(path, _creds(), SCOPE, second).token == "from-az"
+    second.assert_not_called()
+    assert token_cache.token_cache_stats()["hits"] == hits_before + 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_cache_file_is_private(tmp_path):
+    path = str(tmp_path / "nested" / "tokens.json")
+    get_or_acquire(path, _creds(), SCOPE, _acquire())
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_near_expiry_token_is_reacquired(tmp_path):
+    path = str(tmp_path / "tokens.json")
+    get_or_acquire(path, _creds(), SCOPE, _acquire("short", lifetime=60))
+    assert get_or_acquire(path, _creds(), SCOPE, _acquire("renewed")).token == "renewed"
+
+
+def test_identities_do_not_share_entries(tmp_path):
+    path = str(tmp_path / "tokens.json")
+    get_or_acquire(path, _creds("app-a"), SCOPE, _acquire("a"))
+    assert get_or_acquire(path, _creds("app-b"), SCOPE, _acquire("b")).token == "b"
+    with open(path) as f:
+        assert len(json.load(f)) == 2
+
+
+def test_corrupt_file_falls_back_to_acquire(tmp_path):
+    path = tmp_path / "tokens.json"
+    path.write_text("not json")
+    assert get_or_acquire(str(path), _creds(), SCOPE, _acquire("ok")).token == "ok"
+    assert json.loads(path.read_text())
+
+
+def test_cli_tokens_follow_the_signed_in_az_account(tmp_path, monkeypatch):
+    monkeypatch.setenv("AZURE_CONFIG_DIR", str(tmp_path / "az"))
+    (tmp_path / "az").mkdir()
+    profile = tmp_path / "az" / "azureProfile.json"
+
+    def sign_in(user, mtime):
+        subscription = {"isDefault": True, "tenantId": "tenant", "user": {"name": user}}
+        profile.write_text(json.dumps({"subscriptions": [subscription]}), encoding="utf-8-sig")
+        os.utime(profile, (mtime, mtime))
+
+    path = str(tmp_path / "tokens.json")
+    sign_in("alice@contoso.com", 1_000_000)
+    get_or_acquire(path, _creds(), SCOPE, _acquire("alice"))
+    assert get_or_acquire(path, _creds(), SCOPE, _acquire("unused")).token == "alice"
+
+    sign_in("bob@contoso.com", 1_000_100)
+    assert get_or_acquire(path, _creds(), SCOPE, _acquire("bob")).token == "bob"
@@ -0,0 +1,105 @@
+"""Unit tests for the per-credential token manager."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from azure.core.credentials import AccessToken
+
+from dbt.adapters.fabricspark import token_manager
+from dbt.adapters.fabricspark.token_manager import TokenManager
+
+
+def _creds(authentication="CLI", tenant_id=None, client_id=None, **extra):
+    return SimpleNamespace(
+        authentication=authentication,
+        tenant_id=tenant_id,
+        client_id=client_id,
+        credential_class=extra.get("credential_class"),
+        credential_kwargs=extra.get("credential_kwargs", {}),
+    )
+
+
+class _CountingFetch:
+    def __init__(self, lifetime=3600):
+        self.lifetime = lifetime
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, credentials):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        return AccessToken(
+            token=f"{credentials.client_id or 'cli'}-{n}",
+            expires_on=int(time.time()) + self.lifetime,
+        )
+
+
+def test_distinct_identities_get_distinct_tokens():
+    fetch = _CountingFetch()
+    manager = TokenManager(fetch)
+    a = manager.headers(_creds("SPN", tenant_id="t", client_id="app-a"))
+    b = manager.headers(_creds("SPN", tenant_id="t", client_id="app-b"))
+    again = manager.headers(_creds("SPN", tenant_id="t", client_id="app-a"))
+
+    assert a["Authorization"] == "Bearer app-a-1"
+    assert b["Authorization"] == "Bearer app-b-2"
+    assert again == a
+    assert fetch.calls == 2
+    manager.clear()
+
+
+def test_token_credential_kwargs_are_part_of_the_key():
+    one = _creds("token_credential", credential_class="m.C", credential_kwargs={"x": [1]})
+    two = _creds("token_credential", credential_class="m.C", credential_kwargs={"x": [2]})
+    assert TokenManager.key_for(one) != TokenManager.key_for(two)
+
+
+def test_concurrent_cold_reads_fetch_once():
+    fetch = _CountingFetch()
+    manager = TokenManager(fetch)
+    creds = _creds()
+    threads = [threading.Thread(target=manager.headers, args=(creds,)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert fetch.calls == 1
+    manager.clear()
+
+
+def test_token_inside_margin_is_refreshed_inline():
+    fetch = _CountingFetch(lifetime=60)
+    manager = TokenManager(fetch)
+    creds = _creds()
+    assert manager.headers(creds)["Authorization"] == "Bearer cli-1"
+    assert manager.headers(creds)["Authorization"] == "Bearer cli-2"
+    manager.clear()
+
+
+@patch.object(token_manager, "REFRESH_AHEAD_SECONDS", 0)
+@patch.object(token_manager, "REFRESH_MARGIN_SECONDS", 0)
+def test_background_timer_refreshes_before_expiry():
+    fetch = _CountingFetch(lifetime=1)
+    manager = TokenManager(fetch)
+    creds = _creds()
+    manager.headers(creds)
+    fetch.lifetime = 3600
+    deadline = time.monotonic() + 5
+    while fetch.calls < 2 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert fetch.calls == 2
+    assert manager.headers(creds)["Authorization"] == "Bearer cli-2"
+    manager.clear()
+
+
+def test_invalidate_forces_refetch():
+    fetch = _CountingFetch()
+    manager = TokenManager(fetch)
+    creds = _creds()
+    manager.get_token(creds)
+    manager.invalidate(creds)
+    assert manager.get_token(creds).token == "cli-2"
+    manager.clear()